@@ -34,12 +34,56 @@ SIMPLE_JWT = {
 }
 
 #Cache configuration
-CACHES = {
-    "default": {
+# LocMemCache is per process. With several workers, set CACHE_BACKEND=sqlite
+# so they share one cache (throttle counters, cached users and responses).
+CACHE_BACKENDS = {
+    "locmem": {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": "unique-snowflake",
-    }
+    },
+    "sqlite": {
+        "BACKEND": "base.cache_backends.SQLiteCache",
+        "LOCATION": os.environ.get("CACHE_LOCATION", str(BASE_DIR / "cache.sqlite3")),
+        "OPTIONS": {"MAX_ENTRIES": 100000, "CULL_FREQUENCY": 10},
+    },
 }
+CACHES = {"default": CACHE_BACKENDS[os.environ.get("CACHE_BACKEND", "locmem")]}
+
+# Accounts with more followers than this are not fanned out on write;
+# their posts are merged into followers' home timelines at read time.
+TIMELINE_FANOUT_LIMIT = 10000
+# Entries kept per home timeline; older ones are trimmed by
+# `python manage.py trim_timelines`. See base.timeline.
+TIMELINE_MAX_ENTRIES = 800
+
+# Authenticated users are cached per process for AUTH_USER_LOCAL_TTL seconds,
+# at most AUTH_USER_LOCAL_SIZE of them, and in the shared cache for
+# AUTH_USER_CACHE_TTL; see base.user_cache.
+AUTH_USER_LOCAL_SIZE = 10000
+AUTH_USER_LOCAL_TTL = 5
+AUTH_USER_CACHE_TTL = 60
+
+# Verified access tokens kept per process; see base.token_cache.
+AUTH_TOKEN_CACHE_SIZE = 10000
+
+# Default lifetime of per-user API response caches; see base.response_cache.
+RESPONSE_CACHE_TIMEOUT = 60
+
+# Organization roles used for authorization are cached for this long; see
+# base.membership.
+MEMBERSHIP_CACHE_TTL = 300
+
+# Search backend class; None picks FTS5 on SQLite and ORM prefix search
+# elsewhere. See base.search.
+SEARCH_BACKEND = None
+
+# Each process rebuilds its typeahead index this often, in seconds, to pick up
+# writes made by other workers; see base.autocomplete.
+AUTOCOMPLETE_REFRESH_INTERVAL = 300
+
+# Each process rebuilds its Bloom filter of taken usernames this often, in
+# seconds; see base.username_filter.
+USERNAME_FILTER_REFRESH_INTERVAL = 300
 
 # Application definition
 
@@ -64,7 +108,8 @@ REST_FRAMEWORK = {
         'base.throttling.LoginThrottle',
     ],
     "DEFAULT_THROTTLE_RATES": {
-        'login': '4/minute',
+        'login': '4/minute',  # Per username
+        'login_ip': '20/minute',  # Per client IP, across usernames
         'token_refresh': '5/minute',  # For TokenRefreshRateThrottle
         'organization_join': '20/hour',  # Allow 20 join requests per hour per user
     },
@@ -138,6 +183,29 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing; see base.hashers. PASSWORD_HASHER picks the hasher for new
+# hashes: "pbkdf2", or "argon2" (needs argon2-cffi). The rest still verify
+# existing hashes, which are rehashed on the next successful login. Measure
+# cost changes with `python manage.py bench_login`.
+PASSWORD_HASHER_CHOICES = {
+    "pbkdf2": "base.hashers.TunedPBKDF2PasswordHasher",
+    "argon2": "base.hashers.TunedArgon2PasswordHasher",
+}
+PASSWORD_HASHER = os.environ.get("PASSWORD_HASHER", "pbkdf2")
+PASSWORD_HASHERS = [PASSWORD_HASHER_CHOICES[PASSWORD_HASHER]] + [
+    hasher for name, hasher in PASSWORD_HASHER_CHOICES.items() if name != PASSWORD_HASHER
+] + [
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+PASSWORD_HASH_ITERATIONS = int(os.environ.get("PASSWORD_HASH_ITERATIONS", 1_000_000))
+PASSWORD_HASH_ARGON2 = {"time_cost": 2, "memory_cost": 102400, "parallelism": 8}
+# Threads that may hash at once, per process
+PASSWORD_HASH_WORKERS = 4
+
+AUTHENTICATION_BACKENDS = ["base.backends.PooledModelBackend"]
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
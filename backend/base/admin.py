@@ -2,9 +2,18 @@ from django.contrib import admin
 
 from .models import MyUser, Post, Organization, orgPost, Job, JobApplication
 
+# Counter columns are maintained by base.signals, so they are shown, never edited.
+
+class MyUserAdmin(admin.ModelAdmin):
+    readonly_fields = ['follower_count', 'following_count']
+
+class PostAdmin(admin.ModelAdmin):
+    readonly_fields = ['like_count']
+
 class OrganizationAdmin(admin.ModelAdmin):
     list_display = ['name', 'owner', 'created_at']
     filter_horizontal = ['members', 'pending_requests']
+    readonly_fields = ['member_count']
 
 class JobAdmin(admin.ModelAdmin):
     list_display = ['title', 'creator', 'pay', 'post_date']
@@ -18,7 +27,7 @@ class JobApplicationAdmin(admin.ModelAdmin):
 
 admin.site.register(Job, JobAdmin)
 admin.site.register(JobApplication, JobApplicationAdmin)
-admin.site.register(MyUser)
-admin.site.register(Post)
+admin.site.register(MyUser, MyUserAdmin)
+admin.site.register(Post, PostAdmin)
 admin.site.register(Organization, OrganizationAdmin)
-admin.site.register(orgPost)
\ No newline at end of file
+admin.site.register(orgPost, PostAdmin)
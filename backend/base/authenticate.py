@@ -1,4 +1,11 @@
+from django.utils.translation import gettext_lazy as _
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from .token_cache import get_verified_token
+from .user_cache import get_cached_user
 
 class CookiesAuthentication(JWTAuthentication):
     def authenticate(self, request):
@@ -13,5 +20,33 @@ class CookiesAuthentication(JWTAuthentication):
             user = self.get_user(validated_token)
         except:
             return None
-        
-        return (user, validated_token)
\ No newline at end of file
+
+        return (user, validated_token)
+
+    def get_validated_token(self, raw_token):
+        """JWTAuthentication.get_validated_token via the verified-token cache."""
+        return get_verified_token(raw_token, super().get_validated_token)
+
+    def get_user(self, validated_token):
+        """Same checks as JWTAuthentication.get_user, but via the user cache."""
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = get_cached_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
@@ -0,0 +1,159 @@
+"""
+In-memory prefix index for typeahead over usernames and organization names.
+
+Each kind of entry is kept in a list of (key, pk) pairs sorted by key, so the
+matches for a prefix are one bisect plus a short forward scan, with no
+database access. Organization names are indexed under every word as well
+as the full name, so "club" suggests "Chess Club".
+
+Each process builds the index on first use. Saves and deletes made through
+the ORM update it through signals, but only in the process that made them.
+Every process also rebuilds its index once it is older than
+AUTOCOMPLETE_REFRESH_INTERVAL seconds, which picks up writes from other
+workers and bulk updates that bypass signals. That rebuild runs on a
+background thread; suggestions keep coming from the old index until it is
+swapped in. /api/search/ stays authoritative.
+"""
+import threading
+import time
+from bisect import bisect_left, insort
+
+from django.conf import settings
+
+from .background import run_in_background
+from .models import MyUser, Organization
+
+DEFAULT_LIMIT = 8
+MAX_LIMIT = 20
+
+
+class PrefixIndex:
+    def __init__(self):
+        self._entries = []  # sorted (key, pk)
+        self._keys = {}  # pk -> keys it is indexed under
+        self._labels = {}  # pk -> display label
+
+    def add(self, pk, label, keys):
+        if self._keys.get(pk) == keys and self._labels.get(pk) == label:
+            return  # most saves do not touch the indexed name
+        self.remove(pk)
+        for key in keys:
+            insort(self._entries, (key, pk))
+        self._keys[pk] = keys
+        self._labels[pk] = label
+
+    def remove(self, pk):
+        for key in self._keys.pop(pk, ()):
+            i = bisect_left(self._entries, (key, pk))
+            if i < len(self._entries) and self._entries[i] == (key, pk):
+                del self._entries[i]
+        self._labels.pop(pk, None)
+
+    def load(self, rows):
+        """Replace the contents with (pk, label, keys) rows in one sort."""
+        entries, keys, labels = [], {}, {}
+        for pk, label, row_keys in rows:
+            entries.extend((key, pk) for key in row_keys)
+            keys[pk] = row_keys
+            labels[pk] = label
+        entries.sort()
+        self._entries, self._keys, self._labels = entries, keys, labels
+
+    def match(self, prefix, limit):
+        """Up to limit (pk, label) pairs whose key starts with prefix, in key order."""
+        found, seen = [], set()
+        i = bisect_left(self._entries, (prefix,))
+        while i < len(self._entries) and len(found) < limit:
+            key, pk = self._entries[i]
+            if not key.startswith(prefix):
+                break
+            if pk not in seen:
+                seen.add(pk)
+                found.append((pk, self._labels[pk]))
+            i += 1
+        return found
+
+
+def organization_keys(name):
+    words = name.lower().split()
+    return tuple(' '.join(words[i:]) for i in range(len(words)))
+
+
+class Autocomplete:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._users = PrefixIndex()
+        self._organizations = PrefixIndex()
+        self._expires = None
+
+    def _refresh_interval(self):
+        return getattr(settings, 'AUTOCOMPLETE_REFRESH_INTERVAL', 300)
+
+    def build(self):
+        users = PrefixIndex()
+        users.load(
+            (username, username, (username.lower(),))
+            for username in MyUser.objects.values_list('username', flat=True).iterator()
+        )
+        organizations = PrefixIndex()
+        organizations.load(
+            (pk, name, organization_keys(name))
+            for pk, name in Organization.objects.values_list('id', 'name').iterator()
+        )
+        with self._lock:
+            self._users, self._organizations = users, organizations
+            self._expires = time.monotonic() + self._refresh_interval()
+
+    def _ensure_fresh(self):
+        if self._expires is None:
+            # Nothing to answer from yet: one thread builds, the others wait.
+            with self._build_lock:
+                if self._expires is None:
+                    self.build()
+        elif time.monotonic() > self._expires and self._build_lock.acquire(blocking=False):
+            run_in_background(self._rebuild, 'autocomplete-rebuild')
+
+    def _rebuild(self):
+        try:
+            self.build()
+        finally:
+            self._build_lock.release()
+
+    def suggest(self, prefix, limit):
+        """(users, organizations): up to limit (pk, label) matches each."""
+        prefix = prefix.lower().strip()
+        limit = max(1, min(limit, MAX_LIMIT))
+        if not prefix:
+            return [], []
+        self._ensure_fresh()
+        with self._lock:
+            return (
+                self._users.match(prefix, limit),
+                self._organizations.match(prefix, limit),
+            )
+
+    def user_saved(self, username):
+        with self._lock:
+            self._users.add(username, username, (username.lower(),))
+
+    def user_deleted(self, username):
+        with self._lock:
+            self._users.remove(username)
+
+    def organization_saved(self, pk, name):
+        with self._lock:
+            self._organizations.add(pk, name, organization_keys(name))
+
+    def organization_deleted(self, pk):
+        with self._lock:
+            self._organizations.remove(pk)
+
+    def reset(self):
+        """Drop the index; the next suggest() rebuilds it."""
+        with self._lock:
+            self._users, self._organizations = PrefixIndex(), PrefixIndex()
+            self._expires = None
+
+
+autocomplete = Autocomplete()
@@ -0,0 +1,21 @@
+"""
+Background rebuilds for the per-process in-memory indexes (base.autocomplete,
+base.username_filter), so a request never waits on a table scan to refresh
+one.
+"""
+import threading
+
+from django.db import connections
+
+
+def run_in_background(target, name):
+    """Run target on a daemon thread that closes its own database connections."""
+    def run():
+        try:
+            target()
+        finally:
+            connections.close_all()
+
+    thread = threading.Thread(target=run, name=name, daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,273 @@
+"""
+A cache backend shared by every worker process on a node.
+
+LocMemCache gives each gunicorn worker its own cache, so throttle counters,
+cached users and cached responses are split N ways. SQLiteCache keeps entries
+in one SQLite file in WAL mode: readers never block each other or the writer,
+and no external service is needed.
+
+    CACHES = {
+        "default": {
+            "BACKEND": "base.cache_backends.SQLiteCache",
+            "LOCATION": "/var/tmp/backend-cache.sqlite3",
+            "OPTIONS": {"MAX_ENTRIES": 100000, "CULL_FREQUENCY": 10},
+        }
+    }
+
+Integers are stored as SQLite integers so incr()/decr() are a single atomic
+UPDATE across processes. Everything else is pickled. When the cache grows
+past MAX_ENTRIES, expired rows go first, then the least recently used
+1/CULL_FREQUENCY of the rest. Triggers keep a running row count in
+cache_size, so checking the size on each write is a single-row read rather
+than a COUNT(*) scan under the write lock.
+"""
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+# Reads only rewrite an entry's access time once it is this many seconds old,
+# so hot keys are not turned into a write on every get().
+ACCESS_RESOLUTION = 1.0
+
+# Run in one transaction, so no row is written before the count triggers
+# exist. The initial count only scans when cache_size is first created.
+SCHEMA = """
+BEGIN IMMEDIATE;
+CREATE TABLE IF NOT EXISTS cache_entry (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires REAL,
+    accessed REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS cache_entry_accessed ON cache_entry (accessed);
+CREATE TABLE IF NOT EXISTS cache_size (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    entries INTEGER NOT NULL
+);
+INSERT INTO cache_size (id, entries)
+    SELECT 0, (SELECT COUNT(*) FROM cache_entry) WHERE NOT EXISTS (SELECT 1 FROM cache_size);
+CREATE TRIGGER IF NOT EXISTS cache_entry_counted AFTER INSERT ON cache_entry
+    BEGIN UPDATE cache_size SET entries = entries + 1; END;
+CREATE TRIGGER IF NOT EXISTS cache_entry_uncounted AFTER DELETE ON cache_entry
+    BEGIN UPDATE cache_size SET entries = entries - 1; END;
+COMMIT;
+"""
+
+
+class SQLiteCache(BaseCache):
+    def __init__(self, location, params):
+        super().__init__(params)
+        self._path = location
+        self._local = threading.local()
+
+    # Connections ---------------------------------------------------------
+
+    def _connection(self):
+        """
+        One connection per thread, reopened after a fork. Connections are kept
+        for the life of the thread; close() stays a no-op so Django does not
+        reconnect at the end of every request.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self._path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA mmap_size=67108864')
+            # INSERT OR REPLACE only fires the delete trigger with this on.
+            conn.execute('PRAGMA recursive_triggers=ON')
+            conn.executescript(SCHEMA)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    # Encoding ------------------------------------------------------------
+
+    @staticmethod
+    def _encode(value):
+        if type(value) is int and -2**63 <= value < 2**63:
+            return value
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _decode(value):
+        return value if isinstance(value, int) else pickle.loads(value)
+
+    # Cache API -----------------------------------------------------------
+
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        row = self._connection().execute(
+            'SELECT value, expires, accessed FROM cache_entry WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None:
+            return default
+
+        value, expires, accessed = row
+        if expires is not None and expires <= now:
+            self._delete_expired(key, now)
+            return default
+        if now - accessed > ACCESS_RESOLUTION:
+            self._connection().execute(
+                'UPDATE cache_entry SET accessed = ? WHERE key = ?', (now, key)
+            )
+        return self._decode(value)
+
+    def get_many(self, keys, version=None):
+        key_map = {self.make_and_validate_key(key, version=version): key for key in keys}
+        if not key_map:
+            return {}
+
+        now = time.time()
+        placeholders = ','.join('?' * len(key_map))
+        rows = self._connection().execute(
+            f'SELECT key, value FROM cache_entry WHERE key IN ({placeholders}) '
+            'AND (expires IS NULL OR expires > ?)',
+            (*key_map, now),
+        ).fetchall()
+        return {key_map[key]: self._decode(value) for key, value in rows}
+
+    def has_key(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return self._connection().execute(
+            'SELECT 1 FROM cache_entry WHERE key = ? AND (expires IS NULL OR expires > ?)',
+            (key, time.time()),
+        ).fetchone() is not None
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        self._write(key, value, timeout, only_if_missing=False)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return self._write(key, value, timeout, only_if_missing=True)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        for key, value in data.items():
+            self.set(key, value, timeout, version=version)
+        return []
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        cursor = self._connection().execute(
+            'UPDATE cache_entry SET expires = ?, accessed = ? '
+            'WHERE key = ? AND (expires IS NULL OR expires > ?)',
+            (self.get_backend_timeout(timeout), now, key, now),
+        )
+        return cursor.rowcount == 1
+
+    def incr(self, key, delta=1, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        row = self._connection().execute(
+            'UPDATE cache_entry SET value = value + ?, accessed = ? '
+            'WHERE key = ? AND typeof(value) = \'integer\' '
+            'AND (expires IS NULL OR expires > ?) RETURNING value',
+            (delta, now, key, now),
+        ).fetchall()  # drain RETURNING so the statement, and its lock, finish
+        if row:
+            return row[0][0]
+
+        # Missing, expired, or not stored as an integer (e.g. a float).
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute(
+                'SELECT value FROM cache_entry WHERE key = ? '
+                'AND (expires IS NULL OR expires > ?)',
+                (key, now),
+            ).fetchone()
+            if row is None:
+                raise ValueError("Key '%s' not found" % key)
+            new_value = self._decode(row[0]) + delta
+            conn.execute(
+                'UPDATE cache_entry SET value = ?, accessed = ? WHERE key = ?',
+                (self._encode(new_value), now, key),
+            )
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return new_value
+
+    def delete(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        cursor = self._connection().execute('DELETE FROM cache_entry WHERE key = ?', (key,))
+        return cursor.rowcount == 1
+
+    def delete_many(self, keys, version=None):
+        keys = [self.make_and_validate_key(key, version=version) for key in keys]
+        if keys:
+            placeholders = ','.join('?' * len(keys))
+            self._connection().execute(
+                f'DELETE FROM cache_entry WHERE key IN ({placeholders})', keys
+            )
+
+    def clear(self):
+        self._connection().execute('DELETE FROM cache_entry')
+
+    # Internals -----------------------------------------------------------
+
+    def _delete_expired(self, key, now):
+        self._connection().execute(
+            'DELETE FROM cache_entry WHERE key = ? AND expires <= ?', (key, now)
+        )
+
+    def _write(self, key, value, timeout, only_if_missing):
+        now = time.time()
+        expires = self.get_backend_timeout(timeout)
+        encoded = self._encode(value)
+        conn = self._connection()
+
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if only_if_missing:
+                self._delete_expired(key, now)
+                cursor = conn.execute(
+                    'INSERT OR IGNORE INTO cache_entry (key, value, expires, accessed) '
+                    'VALUES (?, ?, ?, ?)',
+                    (key, encoded, expires, now),
+                )
+                written = cursor.rowcount == 1
+            else:
+                conn.execute(
+                    'INSERT OR REPLACE INTO cache_entry (key, value, expires, accessed) '
+                    'VALUES (?, ?, ?, ?)',
+                    (key, encoded, expires, now),
+                )
+                written = True
+            if written:
+                self._cull(conn, now)
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return written
+
+    @staticmethod
+    def _size(conn):
+        return conn.execute('SELECT entries FROM cache_size').fetchone()[0]
+
+    def _cull(self, conn, now):
+        if self._size(conn) <= self._max_entries:
+            return
+
+        conn.execute('DELETE FROM cache_entry WHERE expires <= ?', (now,))
+        count = self._size(conn)
+        if count <= self._max_entries:
+            return
+
+        if self._cull_frequency == 0:
+            conn.execute('DELETE FROM cache_entry')
+        else:
+            conn.execute(
+                'DELETE FROM cache_entry WHERE key IN '
+                '(SELECT key FROM cache_entry ORDER BY accessed LIMIT ?)',
+                (count // self._cull_frequency,),
+            )
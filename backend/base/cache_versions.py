@@ -0,0 +1,18 @@
+"""
+Version counters in the shared cache, for invalidating many cached entries
+at once: each entry's key includes the version it was built under, so
+bumping the version orphans all of them without finding or deleting any.
+"""
+from django.core.cache import cache
+
+
+def bump_version(key):
+    """Increment the version stored at key, creating it if it is missing."""
+    # add() is a no-op if the key exists, so the incr() below always has a
+    # value to bump.
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The key was evicted between add() and incr().
+        cache.set(key, 1, None)
@@ -0,0 +1,92 @@
+"""
+Password hashing: hashers with costs taken from settings, and a bounded
+thread pool that caps how many hashes run at once.
+
+A password hash is deliberately slow (hundreds of ms for PBKDF2 with Django's
+default iterations) and CPU bound. The pool does not make any one login
+faster: the request thread still waits for its hash. What it bounds is the
+number of hashes in flight, PASSWORD_HASH_WORKERS per process, so a burst of
+logins or registrations queues for a hashing slot instead of running dozens
+of hashes at once and starving every other request of CPU. hashlib and
+argon2-cffi release the GIL, so the pool threads really do hash in parallel.
+
+Logins hash through PooledModelBackend and every other hash through
+MyUser.set_password, so registration and password changes share the cap.
+
+Tune the costs with `python manage.py bench_login`.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    make_password,
+    verify_password,
+)
+
+_pool = None
+_pool_lock = Lock()
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 with PASSWORD_HASH_ITERATIONS rounds."""
+
+    @property
+    def iterations(self):
+        return getattr(settings, 'PASSWORD_HASH_ITERATIONS', PBKDF2PasswordHasher.iterations)
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2id with costs from PASSWORD_HASH_ARGON2; needs argon2-cffi."""
+
+    def _cost(self, name):
+        return getattr(settings, 'PASSWORD_HASH_ARGON2', {}).get(
+            name, getattr(Argon2PasswordHasher, name)
+        )
+
+    @property
+    def time_cost(self):
+        return self._cost('time_cost')
+
+    @property
+    def memory_cost(self):
+        return self._cost('memory_cost')
+
+    @property
+    def parallelism(self):
+        return self._cost('parallelism')
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(
+                    max_workers=getattr(settings, 'PASSWORD_HASH_WORKERS', 4),
+                    thread_name_prefix='password-hash',
+                )
+    return _pool
+
+
+def check_user_password(user, raw_password):
+    """
+    user.check_password() with the hashing done in the pool. A hash made with
+    an old hasher or old costs is replaced, saved from this thread so it uses
+    the request's database connection.
+    """
+    is_correct, must_update = get_pool().submit(
+        verify_password, raw_password, user.password
+    ).result()
+
+    if is_correct and must_update:
+        user.password = hash_password(raw_password)
+        user.save(update_fields=['password'])
+    return is_correct
+
+
+def hash_password(raw_password):
+    """make_password() in the pool."""
+    return get_pool().submit(make_password, raw_password).result()
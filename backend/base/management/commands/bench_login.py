@@ -0,0 +1,55 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, verify_password
+from django.core.management.base import BaseCommand
+
+from base.hashers import get_pool
+from base.models import MyUser
+
+BENCH_PASSWORD = 'bench-login-password'
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the password checks logins run, through the hashing pool, and "
+        "report p50/p99 latency, to tune password hasher cost and "
+        "PASSWORD_HASH_WORKERS. Uses unsaved users; the database is not touched."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=50)
+        parser.add_argument('--concurrency', type=int, default=4)
+
+    def handle(self, *args, **options):
+        total, concurrency = options['requests'], options['concurrency']
+
+        # Hashed as registration would, but never saved.
+        user = MyUser(username='__bench_login__')
+        user.set_password(BENCH_PASSWORD)
+
+        def login(_):
+            started = time.perf_counter()
+            is_correct, _must_update = get_pool().submit(
+                verify_password, BENCH_PASSWORD, user.password
+            ).result()
+            elapsed = time.perf_counter() - started
+            if not is_correct:
+                raise RuntimeError('bench login failed')
+            return elapsed
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as clients:
+            latencies = sorted(clients.map(login, range(total)))
+        wall = time.perf_counter() - started
+
+        def percentile(p):
+            return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000
+
+        self.stdout.write(
+            f"hasher: {type(get_hasher()).__name__}, "
+            f"{getattr(settings, 'PASSWORD_HASH_WORKERS', 4)} hashing threads"
+        )
+        self.stdout.write(f"{total} logins, {concurrency} concurrent, {total / wall:.1f} logins/s")
+        self.stdout.write(f"p50: {percentile(50):.1f} ms  p99: {percentile(99):.1f} ms")
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from base.search import SEARCH_KINDS, get_search_backend
+
+
+class Command(BaseCommand):
+    help = (
+        "Recreate missing search index triggers and rebuild the search index "
+        "from the tables in bulk. Run after VACUUM, after a migration that "
+        "rebuilds a searched table, or after loading rows with raw SQL."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "kinds", nargs="*",
+            help=f"Only rebuild these kinds ({', '.join(SEARCH_KINDS)}). Default: all.",
+        )
+
+    def handle(self, *args, **options):
+        unknown = set(options["kinds"]) - set(SEARCH_KINDS)
+        if unknown:
+            raise CommandError(f"Unknown search kinds: {', '.join(sorted(unknown))}")
+
+        indexes = [SEARCH_KINDS[kind] for kind in options["kinds"]] or None
+        backend = get_search_backend()
+        backend.install(connection, indexes)
+        rebuilt = ", ".join(options["kinds"]) or "all kinds"
+        self.stdout.write(f"{type(backend).__name__}: search index rebuilt ({rebuilt})")
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from base.models import MyUser, Organization
+
+
+def _actual_count(rows, field):
+    return Coalesce(Subquery(
+        rows.filter(**{field: OuterRef('pk')}).values(field).annotate(total=Count('pk')).values('total')
+    ), 0)
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute MyUser follower_count and following_count and Organization "
+        "member_count from the join tables. Safe to run periodically."
+    )
+
+    def handle(self, *args, **options):
+        follows = MyUser.followers.through.objects.all()
+        for counter, field in (('follower_count', 'from_myuser'), ('following_count', 'to_myuser')):
+            with transaction.atomic():
+                drifted = MyUser.objects.alias(actual=_actual_count(follows, field)).exclude(
+                    **{counter: F('actual')}
+                )
+                fixed = drifted.update(**{counter: F('actual')})
+            self.stdout.write(f"MyUser: fixed {fixed} {counter} values")
+
+        with transaction.atomic():
+            drifted = Organization.objects.with_actual_member_count().exclude(
+                member_count=F('actual_member_count')
+            )
+            fixed = drifted.update(member_count=F('actual_member_count'))
+        self.stdout.write(f"Organization: fixed {fixed} member_count values")
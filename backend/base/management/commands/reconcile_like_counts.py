@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+
+from base.models import Post, orgPost
+
+
+class Command(BaseCommand):
+    help = "Recompute Post and orgPost like_count from the likes join tables."
+
+    def handle(self, *args, **options):
+        for model in (Post, orgPost):
+            with transaction.atomic():
+                drifted = model.objects.with_actual_like_count().exclude(
+                    like_count=F('actual_like_count')
+                )
+                fixed = drifted.update(like_count=F('actual_like_count'))
+
+            self.stdout.write(f"{model.__name__}: fixed {fixed} like counts")
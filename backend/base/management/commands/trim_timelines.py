@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from base.timeline import get_max_entries, trim_timelines
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete home timeline entries beyond the newest TIMELINE_MAX_ENTRIES "
+        "of each user. Safe to run periodically."
+    )
+
+    def handle(self, *args, **options):
+        deleted = trim_timelines()
+        self.stdout.write(f"TimelineEntry: deleted {deleted} entries past the newest {get_max_entries()}")
@@ -0,0 +1,105 @@
+"""
+Organization membership checks for authorization.
+
+Views used to test membership with `user in org.members.all()`, which loads
+every member of the organization. A role is now read in one indexed query:
+the owner id plus EXISTS probes of the members and pending_requests through
+tables. Roles are cached in two tiers:
+
+* a per-request memo, so a permission class and the view it guards share one
+  lookup, and
+* the shared Django cache for MEMBERSHIP_CACHE_TTL seconds, under a key that
+  includes a per-organization version.
+
+base.signals bumps the version whenever an organization, its members or its
+pending requests change, so the next lookup anywhere misses the shared tier.
+Code that writes the through tables directly must call
+invalidate_organization() itself.
+"""
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .cache_versions import bump_version
+from .models import MyUser, Organization
+
+Role = namedtuple('Role', ['is_owner', 'is_member', 'is_pending'])
+
+NO_ROLE = Role(False, False, False)
+
+
+def _ttl():
+    return getattr(settings, 'MEMBERSHIP_CACHE_TTL', 300)
+
+
+def _version_key(org_id):
+    return f'membership_version:{org_id}'
+
+
+def _role_key(org_id, version, username):
+    return f'membership:{org_id}:{version}:{username}'
+
+
+def get_role(org_id, username):
+    """The user's Role in the organization; NO_ROLE if it does not exist."""
+    version = cache.get(_version_key(org_id), 0)
+    key = _role_key(org_id, version, username)
+    role = cache.get(key)
+    if role is None:
+        row = (
+            Organization.objects.filter(pk=org_id)
+            .with_membership(MyUser(pk=username))
+            .values_list('owner_id', 'is_member', 'has_pending_request')
+            .first()
+        )
+        role = NO_ROLE if row is None else Role(row[0] == username, row[1], row[2])
+        cache.set(key, tuple(role), _ttl())
+    return Role(*role)
+
+
+def invalidate_organization(*org_ids):
+    """Forget every cached role in the organizations after membership changes."""
+    for org_id in org_ids:
+        bump_version(_version_key(org_id))
+
+
+class Memberships:
+    """Roles of any user, memoized for the lifetime of one request."""
+
+    def __init__(self, user):
+        self.user = user
+        self._roles = {}
+
+    def role(self, org_id, username=None):
+        username = username or self.user.pk
+        if username is None:
+            return NO_ROLE
+        key = (int(org_id), username)
+        if key not in self._roles:
+            self._roles[key] = get_role(*key)
+        return self._roles[key]
+
+    def is_owner(self, org_id, username=None):
+        return self.role(org_id, username).is_owner
+
+    def is_member(self, org_id, username=None):
+        return self.role(org_id, username).is_member
+
+    def is_pending(self, org_id, username=None):
+        return self.role(org_id, username).is_pending
+
+    def forget(self, org_id):
+        """Drop memoized roles after this request changes the organization."""
+        self._roles = {key: role for key, role in self._roles.items() if key[0] != int(org_id)}
+
+
+def memberships(request):
+    """The Memberships memo of this request, created on first use."""
+    # DRF's Request wraps the HttpRequest; keep the memo on the inner one so
+    # both see it.
+    http_request = getattr(request, '_request', request)
+    memo = getattr(http_request, '_memberships', None)
+    if memo is None or memo.user is not request.user:
+        memo = http_request._memberships = Memberships(request.user)
+    return memo
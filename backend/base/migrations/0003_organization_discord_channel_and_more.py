@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0002_job_jobapplication'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='organization',
+            name='discord_channel',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='organization',
+            name='discord_server',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+    ]
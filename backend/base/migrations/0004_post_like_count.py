@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:19
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_like_counts(apps, schema_editor):
+    for model_name, post_field in (("Post", "post"), ("orgPost", "orgpost")):
+        model = apps.get_model("base", model_name)
+        counts = (
+            model.likes.through.objects.filter(**{post_field: OuterRef("pk")})
+            .values(post_field)
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        model.objects.update(like_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0003_organization_discord_channel_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='orgpost',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_like_counts, migrations.RunPython.noop),
+    ]
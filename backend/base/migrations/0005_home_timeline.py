@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:24
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def seed_timelines(apps, schema_editor):
+    """Fan out existing posts so timelines are not empty after deploy."""
+    Post = apps.get_model("base", "Post")
+    MyUser = apps.get_model("base", "MyUser")
+    TimelineEntry = apps.get_model("base", "TimelineEntry")
+
+    followers = {}
+    for author_id, follower_id in MyUser.followers.through.objects.values_list(
+        "from_myuser_id", "to_myuser_id"
+    ).iterator():
+        followers.setdefault(author_id, []).append(follower_id)
+
+    limit = getattr(settings, "TIMELINE_FANOUT_LIMIT", 10000)
+    large = [author_id for author_id, ids in followers.items() if len(ids) > limit]
+    MyUser.objects.filter(pk__in=large).update(fan_out_on_read=True)
+    for author_id in large:
+        del followers[author_id]
+
+    entries = []
+    for post_id, author_id in Post.objects.values_list("id", "user_id").iterator():
+        for owner_id in [author_id, *followers.get(author_id, [])]:
+            entries.append(TimelineEntry(owner_id=owner_id, post_id=post_id))
+        if len(entries) >= 1000:
+            TimelineEntry.objects.bulk_create(entries, ignore_conflicts=True)
+            entries = []
+    TimelineEntry.objects.bulk_create(entries, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0004_post_like_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='myuser',
+            name='fan_out_on_read',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.CreateModel(
+            name='TimelineEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_entries', to=settings.AUTH_USER_MODEL)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_entries', to='base.post')),
+            ],
+            options={
+                'unique_together': {('owner', 'post')},
+            },
+        ),
+        migrations.RunPython(seed_timelines, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:41
+
+from django.db import migrations, models
+from django.db.models import F
+from django.db.models.functions import Cast
+
+# (model, field, indexes on that field)
+TIMESTAMPS = [
+    ("post", "created_at", [
+        models.Index(fields=["-created_at", "-id"], name="post_created_idx"),
+        models.Index(fields=["user", "-created_at", "-id"], name="post_user_created_idx"),
+    ]),
+    ("orgpost", "created_at", [
+        models.Index(fields=["organization", "-created_at", "-id"], name="orgpost_org_created_idx"),
+    ]),
+    ("job", "post_date", [
+        models.Index(fields=["-post_date"], name="job_post_date_idx"),
+        models.Index(fields=["creator", "-post_date"], name="job_creator_date_idx"),
+    ]),
+    ("jobapplication", "application_date", [
+        models.Index(fields=["job", "-application_date"], name="jobapp_job_date_idx"),
+    ]),
+]
+
+
+def copy_dates_to_datetimes(apps, schema_editor):
+    """Existing rows become midnight UTC on their original day."""
+    for model_name, field, _ in TIMESTAMPS:
+        model = apps.get_model("base", model_name)
+        model.objects.update(**{
+            f"{field}_dt": Cast(F(field), models.DateTimeField()),
+        })
+
+
+def build_operations():
+    operations = []
+    for model_name, field, indexes in TIMESTAMPS:
+        operations += [
+            migrations.RemoveIndex(model_name=model_name, name=index.name)
+            for index in indexes
+        ]
+        operations.append(migrations.AddField(
+            model_name=model_name,
+            name=f"{field}_dt",
+            field=models.DateTimeField(null=True),
+        ))
+
+    operations.append(
+        migrations.RunPython(copy_dates_to_datetimes, migrations.RunPython.noop)
+    )
+
+    for model_name, field, indexes in TIMESTAMPS:
+        operations += [
+            migrations.RemoveField(model_name=model_name, name=field),
+            migrations.RenameField(model_name=model_name, old_name=f"{field}_dt", new_name=field),
+            migrations.AlterField(
+                model_name=model_name,
+                name=field,
+                field=models.DateTimeField(auto_now_add=True),
+            ),
+        ]
+        operations += [
+            migrations.AddIndex(model_name=model_name, index=index)
+            for index in indexes
+        ]
+    return operations
+
+
+class Migration(migrations.Migration):
+    """
+    Post/orgPost.created_at, Job.post_date and JobApplication.application_date
+    move from DateField to DateTimeField so feeds have a strict order within a
+    day. The values are copied through a temporary column because SQLite
+    cannot reinterpret a date column as datetimes in place.
+    """
+
+    dependencies = [
+        ("base", "0006_hot_query_indexes"),
+    ]
+
+    operations = build_operations()
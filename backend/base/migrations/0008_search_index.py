@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:08
+
+from django.db import migrations
+
+# (table, rowid column, indexed columns) as of this migration
+SEARCH_INDEXES = [
+    ("base_myuser", "rowid", ("username", "first_name", "last_name")),
+    ("base_organization", "id", ("name", "bio")),
+]
+
+
+def index_sql(table, rowid, indexed_columns):
+    """External-content FTS5 table plus its sync triggers, frozen as of this migration."""
+    fts = f"{table}_fts"
+    columns = ", ".join(f'"{column}"' for column in indexed_columns)
+    new_values = ", ".join(f'new."{column}"' for column in indexed_columns)
+    old_values = ", ".join(f'old."{column}"' for column in indexed_columns)
+    insert = f'INSERT INTO "{fts}"(rowid, {columns}) VALUES (new."{rowid}", {new_values});'
+    delete = (
+        f'INSERT INTO "{fts}"("{fts}", rowid, {columns}) '
+        f"VALUES ('delete', old.\"{rowid}\", {old_values});"
+    )
+    return [
+        f'CREATE VIRTUAL TABLE IF NOT EXISTS "{fts}" USING fts5({columns}, '
+        f"content='{table}', content_rowid='{rowid}', prefix='2 3')",
+        f'CREATE TRIGGER IF NOT EXISTS "{fts}_ai" AFTER INSERT ON "{table}" BEGIN {insert} END',
+        f'CREATE TRIGGER IF NOT EXISTS "{fts}_ad" AFTER DELETE ON "{table}" BEGIN {delete} END',
+        f'CREATE TRIGGER IF NOT EXISTS "{fts}_au" AFTER UPDATE OF {columns} ON "{table}" '
+        f"BEGIN {delete} {insert} END",
+    ]
+
+
+def create_search_index(apps, schema_editor):
+    """FTS5 indexes for base.search; other databases use the ORM backend."""
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for table, rowid, columns in SEARCH_INDEXES:
+        for statement in index_sql(table, rowid, columns):
+            schema_editor.execute(statement)
+        schema_editor.execute(f"INSERT INTO \"{table}_fts\"(\"{table}_fts\") VALUES ('rebuild')")
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for table, _, _ in SEARCH_INDEXES:
+        for trigger in ("ai", "ad", "au"):
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS "{table}_fts_{trigger}"')
+        schema_editor.execute(f'DROP TABLE IF EXISTS "{table}_fts"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0007_datetime_timestamps'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
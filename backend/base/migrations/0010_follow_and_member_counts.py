@@ -0,0 +1,90 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:42
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+# Adding the columns makes SQLite rebuild these tables, which drops their
+# search triggers and renumbers base_myuser's rowids; see 0008_search_index.
+SEARCH_INDEXES = [
+    ("base_myuser", "rowid", ("username", "first_name", "last_name")),
+    ("base_organization", "id", ("name", "bio")),
+]
+
+
+def index_sql(table, rowid, indexed_columns):
+    """External-content FTS5 table plus its sync triggers, frozen as of this migration."""
+    fts = f"{table}_fts"
+    columns = ", ".join(f'"{column}"' for column in indexed_columns)
+    new_values = ", ".join(f'new."{column}"' for column in indexed_columns)
+    old_values = ", ".join(f'old."{column}"' for column in indexed_columns)
+    insert = f'INSERT INTO "{fts}"(rowid, {columns}) VALUES (new."{rowid}", {new_values});'
+    delete = (
+        f'INSERT INTO "{fts}"("{fts}", rowid, {columns}) '
+        f"VALUES ('delete', old.\"{rowid}\", {old_values});"
+    )
+    return [
+        f'CREATE VIRTUAL TABLE IF NOT EXISTS "{fts}" USING fts5({columns}, '
+        f"content='{table}', content_rowid='{rowid}', prefix='2 3')",
+        f'CREATE TRIGGER IF NOT EXISTS "{fts}_ai" AFTER INSERT ON "{table}" BEGIN {insert} END',
+        f'CREATE TRIGGER IF NOT EXISTS "{fts}_ad" AFTER DELETE ON "{table}" BEGIN {delete} END',
+        f'CREATE TRIGGER IF NOT EXISTS "{fts}_au" AFTER UPDATE OF {columns} ON "{table}" '
+        f"BEGIN {delete} {insert} END",
+    ]
+
+
+def _count(rows, field):
+    return Coalesce(Subquery(
+        rows.filter(**{field: OuterRef("pk")}).values(field).annotate(total=Count("pk")).values("total")
+    ), 0)
+
+
+def backfill_counts(apps, schema_editor):
+    MyUser = apps.get_model("base", "MyUser")
+    Organization = apps.get_model("base", "Organization")
+    follows = MyUser.followers.through.objects.all()
+    MyUser.objects.update(
+        follower_count=_count(follows, "from_myuser"),
+        following_count=_count(follows, "to_myuser"),
+    )
+    Organization.objects.update(
+        member_count=_count(Organization.members.through.objects.all(), "organization")
+    )
+
+
+def restore_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for table, rowid, columns in SEARCH_INDEXES:
+        for statement in index_sql(table, rowid, columns):
+            schema_editor.execute(statement)
+        schema_editor.execute(f"INSERT INTO \"{table}_fts\"(\"{table}_fts\") VALUES ('rebuild')")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0009_content_search_index'),
+    ]
+
+    operations = [
+        # Runs last when unapplying, after the columns are dropped again.
+        migrations.RunPython(migrations.RunPython.noop, restore_search_index),
+        migrations.AddField(
+            model_name='myuser',
+            name='follower_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='myuser',
+            name='following_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='organization',
+            name='member_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counts, migrations.RunPython.noop),
+        migrations.RunPython(restore_search_index, migrations.RunPython.noop),
+    ]
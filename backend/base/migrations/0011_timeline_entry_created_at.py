@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:22
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_post_dates(apps, schema_editor):
+    """Give existing entries the creation time of their post."""
+    Post = apps.get_model("base", "Post")
+    TimelineEntry = apps.get_model("base", "TimelineEntry")
+    TimelineEntry.objects.update(created_at=Subquery(
+        Post.objects.filter(pk=OuterRef("post_id")).values("created_at")[:1]
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0010_follow_and_member_counts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='timelineentry',
+            name='created_at',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.RunPython(copy_post_dates, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='timelineentry',
+            name='created_at',
+            field=models.DateTimeField(),
+        ),
+        migrations.AddIndex(
+            model_name='timelineentry',
+            index=models.Index(fields=['owner', '-created_at', '-post'], name='timeline_owner_created_idx'),
+        ),
+    ]
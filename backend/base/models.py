@@ -3,20 +3,83 @@
 
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models import Count, Exists, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 
 
-class MyUser(AbstractUser):
+class StoredCountersMixin:
+    """
+    For models with counter columns that base.signals keeps in step with F()
+    updates. save() on an existing row writes every other column only, so a
+    stale in-memory counter never overwrites changes made since it was read.
+    """
+    counter_fields = ()
+
+    def save(self, *args, **kwargs):
+        if (not self._state.adding and kwargs.get('update_fields') is None
+                and not kwargs.get('force_insert')):
+            deferred = self.get_deferred_fields()
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.counter_fields
+                and field.attname not in deferred
+            ]
+        super().save(*args, **kwargs)
+
+
+class MyUser(StoredCountersMixin, AbstractUser):
     username = models.CharField(max_length=30, unique=True, primary_key=True)
     bio = models.CharField(max_length=800)
     profile_image = models.ImageField(upload_to='profile_image/', blank=True, null=True)
     followers = models.ManyToManyField('self', symmetrical=False, related_name='following', blank=True)
+    follower_count = models.PositiveIntegerField(default=0)  # kept in sync by base.signals
+    following_count = models.PositiveIntegerField(default=0)  # kept in sync by base.signals
+    # Set once an account outgrows TIMELINE_FANOUT_LIMIT; see base.timeline
+    fan_out_on_read = models.BooleanField(default=False)
+
+    counter_fields = ('follower_count', 'following_count')
 
     def __str__(self):
         return self.username
+
+    def set_password(self, raw_password):
+        # Registration, create_user() and password changes share the login
+        # path's cap on concurrent hashes; see base.hashers.
+        from .hashers import hash_password
+
+        self.password = hash_password(raw_password)
+        self._password = raw_password
     
 
 
-class Organization(models.Model):
+class OrganizationQuerySet(models.QuerySet):
+
+    def with_membership(self, viewer):
+        """Annotate is_member and has_pending_request for viewer as EXISTS probes."""
+        return self.annotate(
+            is_member=Exists(self.model.members.through.objects.filter(
+                organization_id=OuterRef('pk'), myuser_id=viewer.pk)),
+            has_pending_request=Exists(self.model.pending_requests.through.objects.filter(
+                organization_id=OuterRef('pk'), myuser_id=viewer.pk)),
+        )
+
+    def with_summary(self, viewer):
+        """
+        Everything the organization serializers need in one single-row read
+        per organization: member_count is a stored column, so only the
+        viewer's membership flags are probed.
+        """
+        return self.with_membership(viewer)
+
+    def with_actual_member_count(self):
+        """Annotate actual_member_count, counted from the members through table."""
+        members = self.model.members.through.objects.filter(organization_id=OuterRef('pk'))
+        return self.alias(actual_member_count=Coalesce(Subquery(
+            members.values('organization_id').annotate(total=Count('pk')).values('total')
+        ), 0))
+
+
+class Organization(StoredCountersMixin, models.Model):
     name = models.CharField(max_length=100, unique=True)
     bio = models.CharField(max_length=800)
     profile_image = models.ImageField(upload_to='profile_image/', blank=True, null=True)
@@ -24,27 +87,106 @@ class Organization(models.Model):
     owner = models.ForeignKey(MyUser, on_delete=models.CASCADE, related_name='owned_organizations')
     members = models.ManyToManyField(MyUser, related_name='joined_organizations', blank=True)
     pending_requests = models.ManyToManyField(MyUser, related_name='organization_requests', blank=True)
+    member_count = models.PositiveIntegerField(default=0)  # kept in sync by base.signals
     discord_server = models.CharField(max_length=100, blank=True, null=True)
     discord_channel = models.CharField(max_length=100, blank=True, null=True)
 
+    objects = OrganizationQuerySet.as_manager()
+
+    counter_fields = ('member_count',)
+
     def __str__(self):
         return self.name
     
 
-class Post(models.Model):
+class PostQuerySet(models.QuerySet):
+    """Shared by Post and orgPost, which have the same user/likes shape."""
+
+    def for_feed(self, viewer=None):
+        """
+        Load everything the post serializers need in a single query: the
+        author via a join and the viewer's liked flag as an EXISTS
+        annotation. like_count is a stored column, so the likes join table
+        is only probed for the viewer's own row.
+        """
+        queryset = self.select_related('user')
+
+        if viewer is not None:
+            queryset = queryset.annotate(
+                liked=Exists(self.like_rows().filter(**{
+                    self.model.likes.field.m2m_reverse_field_name(): viewer.pk,
+                })),
+            )
+        return queryset
+
+    def like_rows(self):
+        """Rows of the likes through table belonging to the outer post."""
+        likes = self.model.likes
+        return likes.through.objects.filter(**{
+            likes.field.m2m_field_name(): OuterRef('pk'),
+        })
+
+    def with_actual_like_count(self):
+        """Annotate actual_like_count, counted from the likes through table."""
+        post_field = self.model.likes.field.m2m_field_name()
+        return self.alias(actual_like_count=Coalesce(Subquery(
+            self.like_rows().values(post_field).annotate(total=Count('pk')).values('total')
+        ), 0))
+
+
+class Post(StoredCountersMixin, models.Model):
     user = models.ForeignKey(MyUser, on_delete=models.CASCADE, related_name='posts')
     description = models.CharField(max_length=800)
-    created_at = models.DateField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True)
     likes = models.ManyToManyField(MyUser, related_name='post_likes', blank=True)
+    like_count = models.PositiveIntegerField(default=0)  # kept in sync by base.signals
+
+    objects = PostQuerySet.as_manager()
+
+    counter_fields = ('like_count',)
+
+    class Meta:
+        indexes = [
+            # get_posts keyset pages
+            models.Index(fields=['-created_at', '-id'], name='post_created_idx'),
+            # get_users_posts keyset pages
+            models.Index(fields=['user', '-created_at', '-id'], name='post_user_created_idx'),
+        ]
     
 
-class orgPost(models.Model):
+class TimelineEntry(models.Model):
+    """A post pushed onto one follower's home timeline when it was created."""
+    owner = models.ForeignKey(MyUser, on_delete=models.CASCADE, related_name='timeline_entries')
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='timeline_entries')
+    # Copied from the post, so timeline pages are read off this table's index
+    created_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = ('owner', 'post')
+        indexes = [
+            # home timeline keyset pages
+            models.Index(fields=['owner', '-created_at', '-post'], name='timeline_owner_created_idx'),
+        ]
+
+
+class orgPost(StoredCountersMixin, models.Model):
     user = models.ForeignKey(MyUser, on_delete=models.CASCADE, related_name='organization_posts')
     description = models.CharField(max_length=800)
-    created_at = models.DateField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True)
     likes = models.ManyToManyField(MyUser, related_name='org_post_likes', blank=True)
+    like_count = models.PositiveIntegerField(default=0)  # kept in sync by base.signals
     organization = models.ForeignKey(Organization, on_delete=models.CASCADE, related_name='organization_posts', null=True, blank=True)
 
+    objects = PostQuerySet.as_manager()
+
+    counter_fields = ('like_count',)
+
+    class Meta:
+        indexes = [
+            # get_organization_posts and get_organization_feed keyset pages
+            models.Index(fields=['organization', '-created_at', '-id'], name='orgpost_org_created_idx'),
+        ]
+
     def is_organization_post(self):
         return self.organization is not None
     
@@ -81,6 +223,12 @@ class Event(models.Model):
         blank=True,
     )
 
+    class Meta:
+        indexes = [
+            # EventListCreateView: filter by organization, order by start
+            models.Index(fields=['organization', 'starts_at'], name='event_org_starts_idx'),
+        ]
+
     def __str__(self):
         return f"{self.title} on {self.starts_at:%Y‑%m‑%d %H:%M}"
 
@@ -104,7 +252,15 @@ class Job(models.Model):
     title = models.CharField(max_length=120)
     description = models.TextField()
     pay = models.CharField(max_length=100)  # Using CharField for flexibility (allows ranges, hourly rates, etc.)
-    post_date = models.DateField(auto_now_add=True)
+    post_date = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # jobs list, newest first
+            models.Index(fields=['-post_date'], name='job_post_date_idx'),
+            # my_jobs
+            models.Index(fields=['creator', '-post_date'], name='job_creator_date_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} posted by {self.creator.username}"
@@ -117,7 +273,13 @@ class JobApplication(models.Model):
     applicant_phone = models.CharField(max_length=20)
     requested_pay = models.CharField(max_length=100, blank=True, null=True)
     resume_text = models.TextField()
-    application_date = models.DateField(auto_now_add=True)
+    application_date = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # job_applications: filter by job, newest first
+            models.Index(fields=['job', '-application_date'], name='jobapp_job_date_idx'),
+        ]
     
     def __str__(self):
         return f"Application from {self.applicant_name} for {self.job.title}"
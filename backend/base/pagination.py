@@ -0,0 +1,155 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination keyed on (ordering_field, id), newest first.
+
+    Each page is a single indexed range scan: the cursor carries the key of the
+    last row seen, so there is no COUNT(*) and no OFFSET regardless of how deep
+    the client has scrolled. Cursors are opaque base64 tokens.
+    """
+    page_size = 10
+    ordering_field = 'created_at'
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.base_url = request.build_absolute_uri()
+        self.field = queryset.model._meta.get_field(self.ordering_field)
+
+        cursor = self.decode_cursor(request)
+        reverse = cursor is not None and cursor['reverse']
+
+        # Fetch one extra row to learn whether another page exists.
+        rows = self.get_rows(queryset, cursor, reverse, self.page_size + 1)
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+
+        if reverse:
+            rows.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.page = rows
+        return rows
+
+    def get_rows(self, queryset, cursor, reverse, limit):
+        """Up to limit rows past the cursor, in the direction of travel."""
+        if cursor is not None:
+            queryset = queryset.filter(
+                self.get_seek_filter(cursor['value'], cursor['id'], reverse)
+            )
+
+        ordering = [self.ordering_field]
+        if self.ordering_field != 'id':
+            ordering.append('id')
+        if not reverse:
+            ordering = [f'-{field}' for field in ordering]
+        return list(queryset.order_by(*ordering)[:limit])
+
+    def get_seek_filter(self, value, pk, reverse):
+        """Rows strictly after (value, pk) in the requested direction."""
+        op = 'gt' if reverse else 'lt'
+        if self.ordering_field == 'id':
+            return Q(**{f'id__{op}': pk})
+        return (
+            Q(**{f'{self.ordering_field}__{op}': value}) |
+            Q(**{self.ordering_field: value, f'id__{op}': pk})
+        )
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, obj, reverse):
+        payload = {
+            'v': self.field.value_to_string(obj),
+            'i': obj.id,
+            'r': reverse,
+        }
+        token = urlsafe_b64encode(json.dumps(payload).encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+
+        try:
+            payload = json.loads(urlsafe_b64decode(token.encode()))
+            return {
+                'value': self.field.to_python(payload['v']),
+                'id': int(payload['i']),
+                'reverse': bool(payload['r']),
+            }
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+
+class TimelinePagination(KeysetPagination):
+    """
+    KeysetPagination over a base.timeline.HomeTimeline, which is not one
+    queryset but merges several range scans for each page.
+    """
+
+    def get_rows(self, timeline, cursor, reverse, limit):
+        return timeline.rows(cursor, reverse, limit)
+
+
+class OffsetPagination(BasePagination):
+    """
+    Page-numbered pagination without a COUNT(*), for ranked results that
+    have no stable key to seek on (see base.search.SearchResults).
+    """
+    page_size = 20
+    page_query_param = 'page'
+    invalid_page_message = 'Invalid page'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.base_url = request.build_absolute_uri()
+        try:
+            self.page_number = int(request.query_params.get(self.page_query_param, 1))
+        except ValueError:
+            raise NotFound(self.invalid_page_message)
+        if self.page_number < 1:
+            raise NotFound(self.invalid_page_message)
+
+        start = (self.page_number - 1) * self.page_size
+        # Fetch one extra row to learn whether another page exists.
+        rows = list(queryset[start:start + self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        return rows[:self.page_size]
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_page_link(self.page_number + 1) if self.has_next else None,
+            'previous': self.get_page_link(self.page_number - 1) if self.page_number > 1 else None,
+            'results': data,
+        })
+
+    def get_page_link(self, number):
+        return replace_query_param(self.base_url, self.page_query_param, number)
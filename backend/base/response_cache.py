@@ -0,0 +1,112 @@
+"""
+Per-user response caching for read-only API views.
+
+Django's cache_page keys on the URL alone, so an endpoint whose body depends
+on request.user (is_owner, following, ...) could serve one user's response
+to another. cache_response keys on the URL *and* the authenticated user.
+
+Each cached view also declares tags, e.g. "organization:7". Every tag has a
+version number in the cache, and the versions are part of the response key.
+invalidate_tags() bumps the versions, so every response built from the old
+data is skipped at once without having to find and delete it. base.signals
+invalidates tags when the underlying models change.
+
+Cached responses also carry a weak ETag computed from their data. A request
+whose If-None-Match matches the cached ETag gets a 304 straight from the
+cache, without running the view or serializing anything.
+"""
+import hashlib
+import json
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+from .cache_versions import bump_version
+
+
+def _tag_key(tag):
+    return f'resp_tag:{tag}'
+
+
+def _tag_versions(tags):
+    keys = [_tag_key(tag) for tag in tags]
+    versions = cache.get_many(keys)
+    return [versions.get(key, 0) for key in keys]
+
+
+def invalidate_tags(*tags):
+    """Orphan every cached response built from data carrying these tags."""
+    for tag in tags:
+        bump_version(_tag_key(tag))
+
+
+def _response_key(request, tags):
+    principal = request.user.pk if request.user.is_authenticated else 'anonymous'
+    versions = _tag_versions(tags)
+    raw = '|'.join([
+        request.path,
+        request.META.get('QUERY_STRING', ''),
+        str(principal),
+        ','.join(f'{tag}={version}' for tag, version in zip(tags, versions)),
+    ])
+    return 'response:' + hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _etag(data):
+    body = json.dumps(data, cls=JSONEncoder, sort_keys=True)
+    return f'W/"{hashlib.blake2b(body.encode(), digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(request, etag):
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored.
+    wanted = parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+    return '*' in wanted or etag.removeprefix('W/') in {tag.removeprefix('W/') for tag in wanted}
+
+
+def _conditional(request, data, etag):
+    response = HttpResponseNotModified() if _etag_matches(request, etag) else Response(data)
+    response['ETag'] = etag
+    # Per-user data: browsers may keep it but must revalidate each time.
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def cache_response(tags, timeout=None):
+    """
+    Cache successful GET responses of a DRF function view, per user.
+
+    tags is called with the view's URL kwargs and returns the tags the
+    response depends on. Place it below @api_view and @permission_classes so
+    authentication and permission checks still run on every request.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapped(request, *args, **kwargs):
+            if request.method != 'GET':
+                return view_func(request, *args, **kwargs)
+
+            key = _response_key(request, tags(**kwargs))
+            cached = cache.get(key)
+            if cached is not None:
+                return _conditional(request, *cached)
+
+            response = view_func(request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                etag = _etag(response.data)
+                cache.set(
+                    key,
+                    (response.data, etag),
+                    timeout if timeout is not None
+                    else getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 60),
+                )
+                return _conditional(request, response.data, etag)
+            return response
+        return wrapped
+    return decorator
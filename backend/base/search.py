@@ -0,0 +1,350 @@
+"""
+Ranked search over users, organizations, posts, jobs and events, behind a
+pluggable backend.
+
+settings.SEARCH_BACKEND names the backend class:
+
+* FTS5SearchBackend (default on SQLite) keeps an FTS5 index beside each
+  searched table with 2- and 3-character prefix indexes, kept in sync by
+  triggers. Every query word matches as a prefix ("jo smi" finds John Smith).
+  Results are ordered by bm25, with hits in the name columns weighted above
+  hits in descriptions. Lookups use the index, never a table scan.
+* PrefixSearchBackend uses plain ORM istartswith filters, for databases
+  without FTS5.
+
+A backend returns primary keys in rank order; SearchResults turns them into
+model instances for pagination.
+
+search_all() runs one query across every indexed kind and returns typed
+hits with the matched words wrapped in <mark>. Organization posts and events
+only match for members of their organization.
+
+Rebuilding a table in SQLite (as some migrations do) drops its triggers, and
+both that and VACUUM may renumber an implicit rowid. After every migrate,
+repair_search_index() reinstalls missing triggers and rebuilds any index that
+lost them or no longer matches its table.
+"""
+import re
+from html import escape
+
+from django.conf import settings
+from django.db import DatabaseError, connection, connections
+from django.db.models import Q
+from django.utils.module_loading import import_string
+
+from .models import Event, Job, MyUser, Organization, Post, orgPost
+
+WORD_RE = re.compile(r'\w+')
+
+
+class SearchIndex:
+    """
+    One searched table: the columns indexed and their bm25 weights, the kind
+    its hits are reported as, the field shown as the hit's label, and for
+    member-only content the foreign key to its organization.
+    """
+
+    def __init__(self, kind, model, columns, weights, label, member_scope=None):
+        self.kind = kind
+        self.model = model
+        self.columns = columns
+        self.weights = weights
+        self.label = label
+        self.member_scope = member_scope
+
+    @property
+    def table(self):
+        return self.model._meta.db_table
+
+    @property
+    def fts_table(self):
+        return f'{self.table}_fts'
+
+    @property
+    def rowid(self):
+        # MyUser's primary key is its username, so its rows are addressed by
+        # SQLite's implicit rowid instead.
+        pk = self.model._meta.pk
+        return pk.column if pk.get_internal_type() in ('AutoField', 'BigAutoField') else 'rowid'
+
+    def column(self, field):
+        return self.model._meta.get_field(field).column
+
+
+SEARCH_INDEXES = {
+    MyUser: SearchIndex('user', MyUser, ('username', 'first_name', 'last_name'), (10.0, 2.0, 2.0),
+                        label='username'),
+    Organization: SearchIndex('organization', Organization, ('name', 'bio'), (10.0, 1.0), label='name'),
+    Post: SearchIndex('post', Post, ('description',), (1.0,), label='user'),
+    orgPost: SearchIndex('org_post', orgPost, ('description',), (1.0,), label='user',
+                         member_scope='organization'),
+    Job: SearchIndex('job', Job, ('title', 'description'), (5.0, 1.0), label='title'),
+    Event: SearchIndex('event', Event, ('title', 'description'), (5.0, 1.0), label='title',
+                       member_scope='organization'),
+}
+
+SEARCH_KINDS = {index.kind: index for index in SEARCH_INDEXES.values()}
+
+
+def query_words(query):
+    return WORD_RE.findall(query.lower())
+
+
+def mark_words(text, words):
+    """HTML-escape text and wrap every word starting with one of words in <mark>."""
+    pattern = re.compile(r'\b(?:%s)\w*' % '|'.join(map(re.escape, words)), re.IGNORECASE)
+    parts, last = [], 0
+    for match in pattern.finditer(text):
+        parts += [escape(text[last:match.start()]), '<mark>', escape(match.group()), '</mark>']
+        last = match.end()
+    parts.append(escape(text[last:]))
+    return ''.join(parts)
+
+
+class SearchBackend:
+    def search(self, model, query, limit, offset=0):
+        """Primary keys of the best matches for query, best first."""
+        raise NotImplementedError('.search() must be overridden')
+
+    def search_all(self, query, kinds, viewer, limit, offset=0):
+        """
+        The best matches for query among the given kinds, best first, as
+        dicts of type, id, label, organization and highlight.
+        """
+        raise NotImplementedError('.search_all() must be overridden')
+
+    def install(self, connection, indexes=None):
+        """Create whatever index structures the backend needs."""
+
+    def rebuild(self, connection, indexes=None):
+        """Rebuild the indexes from the tables."""
+
+    def repair(self, connection):
+        """Fix indexes broken by schema changes; return the ones repaired."""
+        return []
+
+
+class PrefixSearchBackend(SearchBackend):
+    def search(self, model, query, limit, offset=0):
+        index = SEARCH_INDEXES[model]
+        words = query_words(query)
+        if not words:
+            return []
+
+        pks = model.objects.filter(self.condition(index, words)).order_by(index.columns[0])
+        return list(pks.values_list('pk', flat=True)[offset:offset + limit])
+
+    def search_all(self, query, kinds, viewer, limit, offset=0):
+        words = query_words(query)
+        if not words:
+            return []
+
+        # There is no rank to merge on, so hits are grouped by kind.
+        hits = []
+        for kind in kinds:
+            index = SEARCH_KINDS[kind]
+            rows = index.model.objects.filter(self.condition(index, words))
+            if index.member_scope:
+                rows = rows.filter(**{f'{index.member_scope}__members': viewer})
+            scope = index.column(index.member_scope) if index.member_scope else None
+            fields = dict.fromkeys(['pk', index.column(index.label), *index.columns, *filter(None, [scope])])
+            for row in rows.order_by(index.columns[0]).values(*fields)[:offset + limit - len(hits)]:
+                text = next((row[column] for column in index.columns
+                             if any((row[column] or '').lower().startswith(w) for w in words)),
+                            row[index.columns[0]])
+                hits.append({
+                    'type': kind,
+                    'id': row['pk'],
+                    'label': row[index.column(index.label)],
+                    'organization': row[scope] if scope else None,
+                    'highlight': mark_words(text, words),
+                })
+            if len(hits) >= offset + limit:
+                break
+        return hits[offset:offset + limit]
+
+    @staticmethod
+    def condition(index, words):
+        condition = Q()
+        for word in words:
+            condition &= Q(*(Q(**{f'{column}__istartswith': word}) for column in index.columns),
+                           _connector=Q.OR)
+        return condition
+
+
+class FTS5SearchBackend(SearchBackend):
+    def search(self, model, query, limit, offset=0):
+        index = SEARCH_INDEXES[model]
+        words = query_words(query)
+        if not words:
+            return []
+
+        weights = ', '.join(str(weight) for weight in index.weights)
+        sql = (
+            f'SELECT t."{model._meta.pk.column}" FROM "{index.fts_table}" f '
+            f'JOIN "{index.table}" t ON t."{index.rowid}" = f.rowid '
+            f'WHERE f."{index.fts_table}" MATCH %s '
+            f'ORDER BY bm25(f."{index.fts_table}", {weights}) LIMIT %s OFFSET %s'
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [self.match_expression(words), limit, offset])
+            return [row[0] for row in cursor.fetchall()]
+
+    def search_all(self, query, kinds, viewer, limit, offset=0):
+        words = query_words(query)
+        if not words or not kinds:
+            return []
+
+        # One branch per kind, merged on bm25 in a single statement. Scores
+        # from different tables are not strictly comparable, but the column
+        # weights keep name and title hits above body text everywhere.
+        match = self.match_expression(words)
+        members = Organization.members.through._meta
+        branches, params = [], []
+        for kind in kinds:
+            index = SEARCH_KINDS[kind]
+            fts = index.fts_table
+            weights = ', '.join(str(weight) for weight in index.weights)
+            scope = f't."{index.column(index.member_scope)}"' if index.member_scope else 'NULL'
+            sql = (
+                f'SELECT \'{kind}\' AS kind, t."{index.model._meta.pk.column}" AS id, '
+                f't."{index.column(index.label)}" AS label, {scope} AS organization, '
+                f'bm25(f."{fts}", {weights}) AS score, '
+                f'snippet(f."{fts}", -1, char(2), char(3), \'…\', 16) AS highlight '
+                f'FROM "{fts}" f JOIN "{index.table}" t ON t."{index.rowid}" = f.rowid '
+                f'WHERE f."{fts}" MATCH %s'
+            )
+            params.append(match)
+            if index.member_scope:
+                sql += (
+                    f' AND {scope} IN (SELECT "{members.get_field("organization").column}" '
+                    f'FROM "{members.db_table}" WHERE "{members.get_field("myuser").column}" = %s)'
+                )
+                params.append(viewer)
+            branches.append(sql)
+
+        sql = (
+            f'SELECT kind, id, label, organization, highlight FROM ({" UNION ALL ".join(branches)}) '
+            f'ORDER BY score, kind, id LIMIT %s OFFSET %s'
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [*params, limit, offset])
+            return [
+                {
+                    'type': kind,
+                    'id': pk,
+                    'label': label,
+                    'organization': organization,
+                    # snippet() marks matches with control characters so the
+                    # text can be escaped before the tags go in.
+                    'highlight': escape(highlight).replace('\x02', '<mark>').replace('\x03', '</mark>'),
+                }
+                for kind, pk, label, organization, highlight in cursor.fetchall()
+            ]
+
+    def install(self, connection, indexes=None):
+        with connection.cursor() as cursor:
+            for index in indexes or SEARCH_INDEXES.values():
+                for statement in self.index_sql(index.table, index.rowid, index.columns):
+                    cursor.execute(statement)
+        self.rebuild(connection, indexes)
+
+    def rebuild(self, connection, indexes=None):
+        with connection.cursor() as cursor:
+            for index in indexes or SEARCH_INDEXES.values():
+                fts = index.fts_table
+                cursor.execute(f'INSERT INTO "{fts}"("{fts}") VALUES (\'rebuild\')')
+                # Merge the rebuilt b-trees into one so lookups stay cheap.
+                cursor.execute(f'INSERT INTO "{fts}"("{fts}") VALUES (\'optimize\')')
+
+    def repair(self, connection):
+        broken = []
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')")
+            existing = {name for (name,) in cursor.fetchall()}
+            for index in SEARCH_INDEXES.values():
+                fts = index.fts_table
+                if fts not in existing:
+                    continue  # its migration is not applied
+                if any(f'{fts}_{trigger}' not in existing for trigger in ('ai', 'ad', 'au')):
+                    broken.append(index)
+                elif index.rowid == 'rowid':
+                    # An implicit rowid is not stable, so compare the index
+                    # with its table; this raises if they disagree.
+                    try:
+                        cursor.execute(f'INSERT INTO "{fts}"("{fts}", rank) VALUES (\'integrity-check\', 1)')
+                    except DatabaseError:
+                        broken.append(index)
+        if broken:
+            self.install(connection, broken)
+        return broken
+
+    @staticmethod
+    def match_expression(words):
+        # Each word becomes a quoted prefix term, so user input can never be
+        # read as FTS5 query syntax.
+        return ' '.join(f'"{word}"*' for word in words)
+
+    @staticmethod
+    def index_sql(table, rowid, indexed_columns):
+        """External-content FTS5 table plus the triggers that keep it in sync."""
+        fts = f'{table}_fts'
+        columns = ', '.join(f'"{column}"' for column in indexed_columns)
+        new_values = ', '.join(f'new."{column}"' for column in indexed_columns)
+        old_values = ', '.join(f'old."{column}"' for column in indexed_columns)
+        insert = f'INSERT INTO "{fts}"(rowid, {columns}) VALUES (new."{rowid}", {new_values});'
+        delete = (
+            f'INSERT INTO "{fts}"("{fts}", rowid, {columns}) '
+            f'VALUES (\'delete\', old."{rowid}", {old_values});'
+        )
+        return [
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS "{fts}" USING fts5({columns}, '
+            f'content=\'{table}\', content_rowid=\'{rowid}\', prefix=\'2 3\')',
+            f'CREATE TRIGGER IF NOT EXISTS "{fts}_ai" AFTER INSERT ON "{table}" BEGIN {insert} END',
+            f'CREATE TRIGGER IF NOT EXISTS "{fts}_ad" AFTER DELETE ON "{table}" BEGIN {delete} END',
+            f'CREATE TRIGGER IF NOT EXISTS "{fts}_au" AFTER UPDATE OF {columns} ON "{table}" '
+            f'BEGIN {delete} {insert} END',
+        ]
+
+
+def repair_search_index(sender, using, **kwargs):
+    """post_migrate receiver: see SearchBackend.repair()."""
+    get_search_backend().repair(connections[using])
+
+
+def get_search_backend():
+    default = 'base.search.FTS5SearchBackend' if connection.vendor == 'sqlite' \
+        else 'base.search.PrefixSearchBackend'
+    return import_string(getattr(settings, 'SEARCH_BACKEND', None) or default)()
+
+
+class SearchResults:
+    """
+    Lazily sliced search results, for OffsetPagination: each slice asks the
+    backend for one page of keys and loads those rows from queryset.
+    """
+
+    def __init__(self, queryset, query, backend=None):
+        self.queryset = queryset
+        self.query = query
+        self.backend = backend or get_search_backend()
+
+    def __getitem__(self, window):
+        start, stop = window.start or 0, window.stop
+        pks = self.backend.search(self.queryset.model, self.query, stop - start, start)
+        rows = self.queryset.in_bulk(pks)
+        return [rows[pk] for pk in pks if pk in rows]
+
+
+class UnifiedSearchResults:
+    """Lazily sliced search_all() hits, for OffsetPagination."""
+
+    def __init__(self, query, kinds, viewer, backend=None):
+        self.query = query
+        self.kinds = kinds
+        self.viewer = viewer
+        self.backend = backend or get_search_backend()
+
+    def __getitem__(self, window):
+        start, stop = window.start or 0, window.stop
+        return self.backend.search_all(self.query, self.kinds, self.viewer, stop - start, start)
@@ -62,9 +62,6 @@ class UserRegisterSerializer(serializers.ModelSerializer):
 
 class MyUserProfileSerializer(serializers.ModelSerializer):
 
-    follower_count = serializers.SerializerMethodField()
-    following_count = serializers.SerializerMethodField()
-
     class Meta:
         model = MyUser
         fields = [
@@ -74,80 +71,147 @@ class MyUserProfileSerializer(serializers.ModelSerializer):
             "follower_count",
             "following_count",
         ]
+        read_only_fields = ["follower_count", "following_count"]
 
-    def get_follower_count(self, obj):
-        return obj.followers.count()
-
-    def get_following_count(self, obj):
-        return obj.following.count()
     
-class OrganizationSerializer(serializers.ModelSerializer):
-    owner_username = serializers.ReadOnlyField(source='owner.username')
-    member_count = serializers.SerializerMethodField()
+class MembershipStateMixin:
+    """
+    Reads is_member and has_pending_request from the annotations added by
+    OrganizationQuerySet.with_summary, falling back to queries for bare
+    instances.
+    """
+
+    def _viewer(self):
+        request = self.context.get('request', None)
+        return request.user if request is not None else None
+
+    def get_is_owner(self, obj):
+        viewer = self._viewer()
+        return viewer is not None and viewer.pk == obj.owner_id
+
+    def get_is_member(self, obj):
+        if hasattr(obj, 'is_member'):
+            return obj.is_member
+        viewer = self._viewer()
+        return viewer is not None and obj.members.filter(pk=viewer.pk).exists()
+
+    def get_has_pending_request(self, obj):
+        if hasattr(obj, 'has_pending_request'):
+            return obj.has_pending_request
+        viewer = self._viewer()
+        return viewer is not None and obj.pending_requests.filter(pk=viewer.pk).exists()
+
+
+class OrganizationSummarySerializer(MembershipStateMixin, serializers.ModelSerializer):
+    """List entry: constant size however many members the organization has."""
     is_owner = serializers.SerializerMethodField()
-    members = serializers.SlugRelatedField(
-        many=True, read_only=True, slug_field='username'
-    )  # ✅ Includes usernames of members
-    pending_requests = serializers.SlugRelatedField(
-        many=True, read_only=True, slug_field='username'
-    )  # ✅ Includes usernames of pending users
+    is_member = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Organization
+        fields = ['id', 'name', 'bio', 'profile_image', 'member_count', 'is_owner', 'is_member']
+        read_only_fields = ['member_count']
+
+
+class OrganizationSerializer(OrganizationSummarySerializer):
+    """
+    Organization page. Members and pending requests are paged separately
+    through /organization/<id>/members/ and /organization/<id>/pending/.
+    """
+    owner_username = serializers.ReadOnlyField(source='owner_id')
+    has_pending_request = serializers.SerializerMethodField()
 
     class Meta:
         model = Organization
         fields = [
             'id', 'name', 'bio', 'profile_image', 'created_at',
-            'owner_username', 'members', 'pending_requests',
-            'member_count', 'is_owner', 'discord_server', 'discord_channel'  # Added Discord fields
+            'owner_username', 'member_count', 'is_owner', 'is_member',
+            'has_pending_request', 'discord_server', 'discord_channel'  # Added Discord fields
         ]
+        read_only_fields = ['member_count']
 
-    def get_member_count(self, obj):
-        return obj.members.count()
 
-    def get_is_owner(self, obj):
+class OrganizationSearchSerializer(serializers.ModelSerializer):
+    """Search hit: no member lists; membership flags come from annotations."""
+    owner_username = serializers.ReadOnlyField(source='owner_id')
+    is_member = serializers.BooleanField(read_only=True)
+    has_pending_request = serializers.BooleanField(read_only=True)
+
+    class Meta:
+        model = Organization
+        fields = ['id', 'name', 'profile_image', 'owner_username', 'is_member', 'has_pending_request']
+
+
+class OrganizationMembershipSerializer(serializers.Serializer):
+    """One row of an organization's member or pending list, read off the through table."""
+    username = serializers.CharField(source='myuser_id', read_only=True)
+
+
+class LikeStateMixin:
+    """
+    Reads liked from the annotation added by PostQuerySet.for_feed, falling
+    back to a query for bare instances.
+    """
+
+    def get_liked(self, obj):
+        if hasattr(obj, 'liked'):
+            return obj.liked
         request = self.context.get('request', None)
-        return request and request.user == obj.owner
-    
+        if request is None or not request.user.is_authenticated:
+            return False
+        return obj.likes.filter(pk=request.user.pk).exists()
 
-class PostSerializer(serializers.ModelSerializer):
+
+class PostSerializer(LikeStateMixin, serializers.ModelSerializer):
 
     username = serializers.SerializerMethodField()
-    like_count = serializers.SerializerMethodField()
+    liked = serializers.SerializerMethodField()
     formatted_date = serializers.SerializerMethodField()
 
     class Meta:
         model = Post
-        fields = ['id', 'username','description','formatted_date','likes', 'like_count']
+        fields = ['id', 'username','description','formatted_date', 'like_count', 'liked']
+        read_only_fields = ['like_count']
 
     def get_username(self, obj):
         return obj.user.username
     
-    def get_like_count(self, obj):
-        return obj.likes.count()
-    
     def get_formatted_date(self, obj):
         return obj.created_at.strftime("%d %b %y")
 
+class PostLikeSerializer(serializers.ModelSerializer):
+    """One row of a post's liker list, read straight off the through table."""
+    username = serializers.CharField(source='myuser_id', read_only=True)
+
+    class Meta:
+        model = Post.likes.through
+        fields = ['username']
+
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = MyUser
         fields = ['username', 'bio', 'email', 'profile_image', 'first_name', 'last_name']
 
 
-class OrgPostSerializer(serializers.ModelSerializer):
+class UserSearchSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = MyUser
+        fields = ['username', 'first_name', 'last_name', 'profile_image']
+
+
+class OrgPostSerializer(LikeStateMixin, serializers.ModelSerializer):
     username = serializers.SerializerMethodField()
-    like_count = serializers.SerializerMethodField()
+    liked = serializers.SerializerMethodField()
     formatted_date = serializers.SerializerMethodField()
 
     class Meta:
         model = orgPost
-        fields = ['id', 'username','description','formatted_date','likes', 'like_count', 'organization']
+        fields = ['id', 'username','description','formatted_date', 'like_count', 'liked', 'organization']
+        read_only_fields = ['like_count']
 
     def get_username(self, obj):
         return obj.user.username
 
-    def get_like_count(self, obj):
-        return obj.likes.count()
-
     def get_formatted_date(self, obj):
         return obj.created_at.strftime("%d %b %y")
 
@@ -0,0 +1,271 @@
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .autocomplete import autocomplete
+from .membership import invalidate_organization
+from .models import Job, MyUser, Organization, Post, orgPost
+from .response_cache import invalidate_tags
+from .timeline import fan_out_post
+from .user_cache import invalidate_user
+from .username_filter import username_filter
+
+
+def adjust_like_counts(model, post_ids, delta):
+    """Move like_count on the posts, floored at 0 like every other counter."""
+    CounterSide(model, 'likes', 'like_count').adjust(post_ids, delta)
+
+
+def _sync_like_count(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """
+    Keep the stored like_count in step with the likes join table.
+
+    Works from either side of the relation: post.likes.add(user) arrives with
+    reverse=False and the post as instance, user.post_likes.add(post) arrives
+    with reverse=True and the user as instance.
+    """
+    post_model = model if reverse else type(instance)
+    post_field = post_model.likes.field.m2m_field_name()
+    user_field = post_model.likes.field.m2m_reverse_field_name()
+
+    if reverse:
+        rows = sender.objects.filter(**{user_field: instance.pk})
+    else:
+        rows = sender.objects.filter(**{post_field: instance.pk})
+
+    # remove() reports every requested pk, not just the ones that were
+    # actually liked, so record the real rows before they disappear.
+    if action == 'pre_remove':
+        key = f'{post_field}__in' if reverse else f'{user_field}__in'
+        instance._removed_like_posts = list(
+            rows.filter(**{key: pk_set}).values_list(post_field, flat=True)
+        )
+    elif action == 'pre_clear':
+        instance._removed_like_posts = list(rows.values_list(post_field, flat=True))
+
+    elif action == 'post_add':
+        if not pk_set:
+            return
+        if reverse:
+            adjust_like_counts(post_model, pk_set, 1)
+        else:
+            adjust_like_counts(post_model, [instance.pk], len(pk_set))
+    elif action in ('post_remove', 'post_clear'):
+        removed = getattr(instance, '_removed_like_posts', [])
+        if reverse:
+            adjust_like_counts(post_model, removed, -1)
+        else:
+            adjust_like_counts(post_model, [instance.pk], -len(removed))
+        instance._removed_like_posts = []
+    else:
+        return
+
+    if not reverse and action.startswith('post_'):
+        instance.refresh_from_db(fields=['like_count'])
+
+
+@receiver(m2m_changed, sender=Post.likes.through)
+def sync_post_like_count(sender, **kwargs):
+    _sync_like_count(sender, **kwargs)
+
+
+@receiver(m2m_changed, sender=orgPost.likes.through)
+def sync_org_post_like_count(sender, **kwargs):
+    _sync_like_count(sender, **kwargs)
+
+
+class CounterSide:
+    """One end of a many-to-many relation: its through-table field and its counter, if any."""
+
+    def __init__(self, model, field, counter=None):
+        self.model = model
+        self.field = field
+        self.counter = counter
+
+    def adjust(self, pks, delta):
+        if self.counter and pks and delta:
+            value = F(self.counter) + delta
+            if delta < 0:
+                value = Greatest(value, 0)  # a drifted counter must not block the write
+            self.model.objects.filter(pk__in=pks).update(**{self.counter: value})
+
+
+def _sync_counters(sender, instance, action, reverse, pk_set, source, target, **kwargs):
+    """
+    Keep stored row counters in step with a many-to-many through table.
+
+    source is the side that declares the field, target the related side. The
+    instance's own counter moves by the number of rows changed, and each
+    row's other end moves by one. Like _sync_like_count, remove() is resolved
+    to the rows that actually existed before they disappear.
+    """
+    mine, theirs = (target, source) if reverse else (source, target)
+    rows = sender.objects.filter(**{mine.field: instance.pk})
+    stash = f'_removed_{sender._meta.model_name}'
+
+    if action == 'pre_remove':
+        setattr(instance, stash, list(
+            rows.filter(**{f'{theirs.field}__in': pk_set}).values_list(theirs.field, flat=True)
+        ))
+        return
+    if action == 'pre_clear':
+        setattr(instance, stash, list(rows.values_list(theirs.field, flat=True)))
+        return
+    if action == 'post_add':
+        changed, delta = pk_set or (), 1
+    elif action in ('post_remove', 'post_clear'):
+        changed, delta = getattr(instance, stash, []), -1
+        setattr(instance, stash, [])
+    else:
+        return
+
+    if changed:
+        mine.adjust([instance.pk], delta * len(changed))
+        theirs.adjust(changed, delta)
+        if mine.counter:
+            instance.refresh_from_db(fields=[mine.counter])
+
+
+FOLLOWED = CounterSide(MyUser, 'from_myuser', 'follower_count')
+FOLLOWER = CounterSide(MyUser, 'to_myuser', 'following_count')
+ORGANIZATION = CounterSide(Organization, 'organization', 'member_count')
+MEMBER = CounterSide(MyUser, 'myuser')
+
+
+@receiver(m2m_changed, sender=MyUser.followers.through)
+def sync_follow_counts(sender, **kwargs):
+    _sync_counters(sender, source=FOLLOWED, target=FOLLOWER, **kwargs)
+
+
+@receiver(m2m_changed, sender=Organization.members.through)
+def sync_member_count(sender, **kwargs):
+    _sync_counters(sender, source=ORGANIZATION, target=MEMBER, **kwargs)
+
+
+@receiver(pre_delete, sender=MyUser)
+def release_counters(sender, instance, **kwargs):
+    """
+    Deleting a user cascades through the join tables without m2m_changed, so
+    release the follow, member and like counts their rows stood for.
+    """
+    follows = MyUser.followers.through.objects
+    FOLLOWER.adjust(list(follows.filter(from_myuser=instance.pk).values_list('to_myuser', flat=True)), -1)
+    FOLLOWED.adjust(list(follows.filter(to_myuser=instance.pk).values_list('from_myuser', flat=True)), -1)
+    ORGANIZATION.adjust(list(Organization.members.through.objects.filter(myuser=instance.pk)
+                             .values_list('organization', flat=True)), -1)
+    for post_model in (Post, orgPost):
+        likes = post_model.likes
+        adjust_like_counts(post_model, list(
+            likes.through.objects.filter(**{likes.field.m2m_reverse_field_name(): instance.pk})
+            .values_list(likes.field.m2m_field_name(), flat=True)
+        ), -1)
+
+
+@receiver(post_save, sender=Post)
+def fan_out_new_post(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        fan_out_post(instance)
+
+
+@receiver(post_save, sender=MyUser)
+@receiver(post_delete, sender=MyUser)
+def invalidate_cached_user(sender, instance, **kwargs):
+    invalidate_user(instance.pk)
+
+
+# Response-cache tags invalidated by each model write; see base.response_cache.
+# Profiles are addressed by username, so user tags are too. Only models a
+# cached response reads are listed: the profile and organization responses
+# include no posts or events, so saving one (a like included) invalidates
+# nothing.
+RESPONSE_CACHE_TAGS = {
+    MyUser: lambda obj: [f"user:{obj.username}"],
+    Organization: lambda obj: [f"organization:{obj.pk}"],
+    Job: lambda obj: ["jobs", f"job:{obj.pk}"],
+}
+
+
+def invalidate_cached_responses(sender, instance, **kwargs):
+    invalidate_tags(*RESPONSE_CACHE_TAGS[sender](instance))
+
+
+# Connected per model: a post_delete receiver for every sender would stop
+# Django from fast-deleting rows of unrelated models such as through tables.
+for _model in RESPONSE_CACHE_TAGS:
+    post_save.connect(invalidate_cached_responses, sender=_model)
+    post_delete.connect(invalidate_cached_responses, sender=_model)
+
+
+@receiver(m2m_changed, sender=Organization.members.through)
+@receiver(m2m_changed, sender=Organization.pending_requests.through)
+def invalidate_cached_organization(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith('post_'):
+        return
+    if not reverse:
+        invalidate_tags(f"organization:{instance.pk}")
+    elif pk_set:
+        invalidate_tags(*(f"organization:{pk}" for pk in pk_set))
+
+
+@receiver(m2m_changed, sender=Organization.members.through)
+@receiver(m2m_changed, sender=Organization.pending_requests.through)
+def invalidate_memberships(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action.startswith('post_'):
+            invalidate_organization(instance.pk)
+    elif action == 'pre_clear':
+        # post_clear does not say which organizations the user left.
+        invalidate_organization(*sender.objects.filter(myuser_id=instance.pk)
+                                .values_list('organization_id', flat=True))
+    elif action.startswith('post_') and pk_set:
+        invalidate_organization(*pk_set)
+
+
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+def invalidate_organization_memberships(sender, instance, **kwargs):
+    invalidate_organization(instance.pk)
+
+
+@receiver(pre_delete, sender=MyUser)
+def invalidate_departing_memberships(sender, instance, **kwargs):
+    # Deleting a user cascades through the membership tables without
+    # m2m_changed, and the username can be registered again.
+    org_ids = set(instance.owned_organizations.values_list('pk', flat=True))
+    for through in (Organization.members.through, Organization.pending_requests.through):
+        org_ids.update(through.objects.filter(myuser_id=instance.pk).values_list('organization_id', flat=True))
+    invalidate_organization(*org_ids)
+
+
+@receiver(m2m_changed, sender=MyUser.followers.through)
+def invalidate_cached_profiles(sender, instance, action, pk_set, **kwargs):
+    if not action.startswith('post_'):
+        return
+    usernames = MyUser.objects.filter(pk__in=pk_set or ()).values_list('username', flat=True)
+    invalidate_tags(f"user:{instance.username}", *(f"user:{name}" for name in usernames))
+
+
+@receiver(post_save, sender=MyUser)
+def index_user_for_autocomplete(sender, instance, **kwargs):
+    autocomplete.user_saved(instance.username)
+
+
+@receiver(post_delete, sender=MyUser)
+def unindex_user_for_autocomplete(sender, instance, **kwargs):
+    autocomplete.user_deleted(instance.username)
+
+
+@receiver(post_save, sender=Organization)
+def index_organization_for_autocomplete(sender, instance, **kwargs):
+    autocomplete.organization_saved(instance.pk, instance.name)
+
+
+@receiver(post_delete, sender=Organization)
+def unindex_organization_for_autocomplete(sender, instance, **kwargs):
+    autocomplete.organization_deleted(instance.pk)
+
+
+@receiver(post_save, sender=MyUser)
+def remember_taken_username(sender, instance, **kwargs):
+    username_filter.add(instance.username)
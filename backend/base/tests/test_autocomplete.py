@@ -0,0 +1,113 @@
+# backend/base/tests/test_autocomplete.py
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from base.autocomplete import PrefixIndex, autocomplete
+from base.models import MyUser, Organization
+
+
+class PrefixIndexTest(SimpleTestCase):
+    def test_matches_in_key_order(self):
+        """Matches come back alphabetically, exact match first, up to the limit"""
+        index = PrefixIndex()
+        index.load((name, name, (name,)) for name in ["sam", "samantha", "sally", "bob", "samuel"])
+
+        self.assertEqual([pk for pk, _ in index.match("sam", 10)], ["sam", "samantha", "samuel"])
+        self.assertEqual([pk for pk, _ in index.match("sa", 2)], ["sally", "sam"])
+        self.assertEqual(index.match("z", 10), [])
+
+    def test_rekeying_replaces_old_keys(self):
+        """Adding an existing pk under a new key drops the old one"""
+        index = PrefixIndex()
+        index.add(1, "Chess Club", ("chess club", "club"))
+        index.add(1, "Go Club", ("go club", "club"))
+
+        self.assertEqual(index.match("chess", 10), [])
+        self.assertEqual(index.match("club", 10), [(1, "Go Club")])
+
+        index.remove(1)
+        self.assertEqual(index.match("club", 10), [])
+
+
+class AutocompleteEndpointTest(TestCase):
+    def setUp(self):
+        """Log in and start from an index that has not been built"""
+        cache.clear()  # Login throttle counters live in the cache
+        autocomplete.reset()
+        self.viewer = MyUser.objects.create_user(username="viewer", password="password123")
+        Organization.objects.create(name="Chess Club", bio="b", owner=self.viewer)
+        self.client = Client()
+        self.client.post(
+            reverse("login"),
+            {"username": "viewer", "password": "password123"},
+            content_type="application/json"
+        )
+        self.client.get("/api/get_posts/")  # warm the authenticated-user cache
+
+    def tearDown(self):
+        autocomplete.reset()
+
+    def _suggest(self, prefix):
+        response = self.client.get("/api/autocomplete/", {"q": prefix})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_warm_lookups_skip_the_database(self):
+        """Once built, suggestions are answered from memory"""
+        self._suggest("v")
+
+        with CaptureQueriesContext(connection) as ctx:
+            data = self._suggest("vie")
+
+        self.assertEqual(data["users"], [{"username": "viewer"}])
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_organization_words_are_prefixes(self):
+        """Any word of an organization name can start a match"""
+        self.assertEqual([org["name"] for org in self._suggest("club")["organizations"]], ["Chess Club"])
+
+    def test_signals_update_the_index(self):
+        """New, renamed and deleted rows show up without a rebuild"""
+        self._suggest("v")
+
+        MyUser.objects.create(username="victor")
+        org = Organization.objects.get(name="Chess Club")
+        org.name = "Go Society"
+        org.save()
+
+        data = self._suggest("vi")
+        self.assertEqual([user["username"] for user in data["users"]], ["victor", "viewer"])
+        self.assertEqual(self._suggest("chess")["organizations"], [])
+        self.assertEqual(self._suggest("society")["organizations"], [{"id": org.id, "name": "Go Society"}])
+
+        org.delete()
+        self.assertEqual(self._suggest("go")["organizations"], [])
+
+    def test_stale_index_is_rebuilt_in_the_background(self):
+        """An expired index keeps answering while one rebuild is handed off"""
+        self._suggest("v")
+        MyUser.objects.bulk_create([MyUser(username="vera")])  # bypasses signals
+        autocomplete._expires = time.monotonic() - 1
+        rebuilds = []
+
+        with mock.patch("base.autocomplete.run_in_background", lambda target, name: rebuilds.append(target)):
+            with CaptureQueriesContext(connection) as ctx:
+                stale = self._suggest("v")
+                self._suggest("vi")
+
+        self.assertEqual(len(ctx.captured_queries), 0)
+        self.assertEqual(stale["users"], [{"username": "viewer"}])
+        self.assertEqual(len(rebuilds), 1)
+
+        rebuilds[0]()
+        self.assertEqual([user["username"] for user in self._suggest("v")["users"]], ["vera", "viewer"])
+
+    def test_blank_prefix(self):
+        """An empty query suggests nothing"""
+        self.assertEqual(self._suggest("  "), {"users": [], "organizations": []})
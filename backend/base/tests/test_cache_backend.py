@@ -0,0 +1,128 @@
+# backend/base/tests/test_cache_backend.py
+import multiprocessing
+import os
+import tempfile
+import time
+
+from django.test import SimpleTestCase
+from base.cache_backends import SQLiteCache
+
+
+def _bump(location, times):
+    cache = SQLiteCache(location, {})
+    for _ in range(times):
+        cache.incr("hits")
+
+
+class SQLiteCacheTest(SimpleTestCase):
+    def setUp(self):
+        """Give every test its own cache file"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.location = os.path.join(self.tmpdir.name, "cache.sqlite3")
+        self.cache = SQLiteCache(self.location, {})
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_trip(self):
+        """Values of any picklable type come back unchanged"""
+        self.cache.set("number", 7)
+        self.cache.set("data", {"results": [1, 2], "next": None})
+
+        self.assertEqual(self.cache.get("number"), 7)
+        self.assertEqual(self.cache.get("data"), {"results": [1, 2], "next": None})
+        self.assertEqual(self.cache.get_many(["number", "missing"]), {"number": 7})
+        self.assertIsNone(self.cache.get("missing"))
+
+    def test_expiry(self):
+        """Expired entries are treated as missing"""
+        self.cache.set("short", "value", timeout=0.05)
+        time.sleep(0.1)
+
+        self.assertIsNone(self.cache.get("short"))
+        self.assertFalse(self.cache.has_key("short"))
+        self.assertTrue(self.cache.add("short", "again"))
+
+    def test_add_only_when_missing(self):
+        """add() never overwrites a live entry"""
+        self.assertTrue(self.cache.add("key", 1))
+        self.assertFalse(self.cache.add("key", 2))
+        self.assertEqual(self.cache.get("key"), 1)
+
+    def test_incr_and_decr(self):
+        """Counters move in place and missing keys raise like Django's caches"""
+        self.cache.set("counter", 10)
+        self.assertEqual(self.cache.incr("counter", 5), 15)
+        self.assertEqual(self.cache.decr("counter"), 14)
+
+        with self.assertRaises(ValueError):
+            self.cache.incr("missing")
+
+    def test_entries_shared_between_instances(self):
+        """A second instance on the same file sees the first one's writes"""
+        self.cache.set("shared", "yes")
+        other = SQLiteCache(self.location, {})
+
+        self.assertEqual(other.get("shared"), "yes")
+        other.delete("shared")
+        self.assertIsNone(self.cache.get("shared"))
+
+    def test_incr_is_atomic_across_processes(self):
+        """Concurrent workers never lose an increment"""
+        self.cache.set("hits", 0)
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(target=_bump, args=(self.location, 50)) for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(self.cache.get("hits"), 200)
+
+    def test_least_recently_used_entries_evicted(self):
+        """Past MAX_ENTRIES the stalest keys go and recently read ones stay"""
+        cache = SQLiteCache(self.location, {"OPTIONS": {"MAX_ENTRIES": 4, "CULL_FREQUENCY": 2}})
+        conn = cache._connection()
+        for i in range(4):
+            cache.set(f"key{i}", i)
+            # Spread access times so LRU order is deterministic
+            conn.execute(
+                "UPDATE cache_entry SET accessed = ? WHERE key = ?",
+                (i, cache.make_key(f"key{i}")),
+            )
+        cache.get("key0")  # key0 becomes the most recently used
+
+        cache.set("key4", 4)
+
+        self.assertEqual(cache.get("key0"), 0)
+        self.assertIsNone(cache.get("key1"))
+        self.assertIsNone(cache.get("key2"))
+        self.assertEqual(cache.get("key4"), 4)
+
+    def test_running_size_tracks_writes(self):
+        """The trigger-kept size matches the table through every kind of write"""
+        conn = self.cache._connection()
+
+        def sizes():
+            return (
+                conn.execute("SELECT entries FROM cache_size").fetchone()[0],
+                conn.execute("SELECT COUNT(*) FROM cache_entry").fetchone()[0],
+            )
+
+        self.cache.set("a", 1)
+        self.cache.set("a", "replaced")
+        self.cache.add("a", 2)
+        self.cache.set("b", 2, timeout=0.01)
+        self.cache.add("c", 0)
+        self.cache.incr("c")
+        self.assertEqual(sizes(), (3, 3))
+
+        time.sleep(0.02)
+        self.cache.get("b")  # expired: deleted on read
+        self.cache.delete("c")
+        self.assertEqual(sizes(), (1, 1))
+
+        self.cache.clear()
+        self.assertEqual(sizes(), (0, 0))
@@ -0,0 +1,158 @@
+# backend/base/tests/test_counters.py
+from io import StringIO
+
+from django.contrib import admin
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, Client
+from django.urls import reverse
+from base.models import MyUser, Organization, Post
+
+
+class FollowCountTest(TestCase):
+    def setUp(self):
+        self.alice = MyUser.objects.create(username="alice")
+        self.bob = MyUser.objects.create(username="bob")
+        self.carol = MyUser.objects.create(username="carol")
+
+    def _counts(self, user):
+        user.refresh_from_db()
+        return user.follower_count, user.following_count
+
+    def test_follow_from_either_side(self):
+        """Adds and removes through followers or following move both counters"""
+        self.alice.followers.add(self.bob, self.carol)
+        self.assertEqual(self.alice.follower_count, 2)  # refreshed on the instance
+        self.assertEqual(self._counts(self.bob), (0, 1))
+
+        self.bob.following.add(self.carol)
+        self.assertEqual(self._counts(self.bob), (0, 2))
+        self.assertEqual(self._counts(self.carol), (1, 1))
+
+        self.alice.followers.remove(self.bob, self.bob)  # duplicates and misses count once
+        self.alice.followers.remove(self.bob)
+        self.assertEqual(self._counts(self.alice), (1, 0))
+        self.assertEqual(self._counts(self.bob), (0, 1))
+
+        self.carol.following.clear()
+        self.assertEqual(self._counts(self.alice), (0, 0))
+        self.assertEqual(self._counts(self.carol), (1, 0))
+
+    def test_deleted_user_releases_counts(self):
+        self.alice.followers.add(self.bob)
+        self.bob.followers.add(self.alice)
+        self.bob.delete()
+
+        self.assertEqual(self._counts(self.alice), (0, 0))
+
+    def test_toggle_follow_endpoint(self):
+        """The through-table toggle keeps both counters in step"""
+        cache.clear()  # Login throttle counters live in the cache
+        MyUser.objects.create_user(username="dave", password="password123")
+        client = Client()
+        client.post(reverse("login"), {"username": "dave", "password": "password123"},
+                    content_type="application/json")
+
+        client.post("/api/toggle_follow/", {"username": "alice"}, content_type="application/json")
+        self.assertEqual(self._counts(self.alice), (1, 0))
+        self.assertEqual(self._counts(MyUser.objects.get(pk="dave")), (0, 1))
+
+        data = client.get("/api/user_data/alice/").data
+        self.assertEqual(data["follower_count"], 1)
+
+        client.post("/api/toggle_follow/", {"username": "alice"}, content_type="application/json")
+        self.assertEqual(self._counts(self.alice), (0, 0))
+
+    def test_unfollow_with_drifted_counters(self):
+        """A counter that drifted to 0 stays at 0 instead of blocking the unfollow"""
+        cache.clear()  # Login throttle counters live in the cache
+        MyUser.objects.create_user(username="dave", password="password123")
+        client = Client()
+        client.post(reverse("login"), {"username": "dave", "password": "password123"},
+                    content_type="application/json")
+        client.post("/api/toggle_follow/", {"username": "alice"}, content_type="application/json")
+        MyUser.objects.update(follower_count=0, following_count=0)
+
+        response = client.post("/api/toggle_follow/", {"username": "alice"}, content_type="application/json")
+
+        self.assertEqual(response.data, {"following": False})
+        self.assertFalse(self.alice.followers.filter(pk="dave").exists())
+        self.assertEqual(self._counts(self.alice), (0, 0))
+
+
+class MemberCountTest(TestCase):
+    def setUp(self):
+        self.owner = MyUser.objects.create(username="owner")
+        self.user = MyUser.objects.create(username="user")
+        self.org = Organization.objects.create(name="Org", bio="b", owner=self.owner)
+
+    def _count(self):
+        self.org.refresh_from_db()
+        return self.org.member_count
+
+    def test_membership_changes(self):
+        self.org.members.add(self.owner, self.user)
+        self.assertEqual(self._count(), 2)
+
+        self.user.joined_organizations.remove(self.org)
+        self.assertEqual(self._count(), 1)
+
+        self.user.joined_organizations.add(self.org)
+        self.org.members.clear()
+        self.assertEqual(self._count(), 0)
+
+        self.org.members.add(self.user)
+        self.user.delete()
+        self.assertEqual(self._count(), 0)
+
+    def test_reconcile_fixes_drift(self):
+        """The reconcile command recounts from the join tables"""
+        self.org.members.add(self.owner, self.user)
+        self.owner.followers.add(self.user)
+        Organization.objects.update(member_count=7)
+        MyUser.objects.update(follower_count=5, following_count=0)
+
+        out = StringIO()
+        call_command("reconcile_counts", stdout=out)
+
+        self.assertEqual(self._count(), 2)
+        self.owner.refresh_from_db()
+        self.user.refresh_from_db()
+        self.assertEqual((self.owner.follower_count, self.user.following_count), (1, 1))
+        self.assertEqual(self.user.follower_count, 0)
+        self.assertIn("Organization: fixed 1 member_count values", out.getvalue())
+
+
+class StaleSaveTest(TestCase):
+    def setUp(self):
+        self.owner = MyUser.objects.create(username="owner")
+        self.fan = MyUser.objects.create(username="fan")
+        self.org = Organization.objects.create(name="Org", bio="b", owner=self.owner)
+
+    def test_stale_user_save_keeps_counters(self):
+        """Saving a user read before a follow does not reset its counters"""
+        stale = MyUser.objects.get(pk="owner")
+        self.owner.followers.add(self.fan)
+
+        stale.bio = "Edited"
+        stale.save()
+
+        stale.refresh_from_db()
+        self.assertEqual((stale.bio, stale.follower_count), ("Edited", 1))
+
+    def test_stale_organization_save_keeps_member_count(self):
+        """Saving an organization read before a join does not reset member_count"""
+        stale = Organization.objects.get(pk=self.org.pk)
+        self.org.members.add(self.owner, self.fan)
+
+        stale.bio = "Edited"
+        stale.save()
+
+        stale.refresh_from_db()
+        self.assertEqual((stale.bio, stale.member_count), ("Edited", 2))
+
+    def test_admin_shows_counters_read_only(self):
+        """The admin forms cannot overwrite stored counters"""
+        self.assertIn("member_count", admin.site._registry[Organization].readonly_fields)
+        self.assertIn("follower_count", admin.site._registry[MyUser].readonly_fields)
+        self.assertIn("like_count", admin.site._registry[Post].readonly_fields)
@@ -0,0 +1,66 @@
+# backend/base/tests/test_indexes.py
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+from base.models import Event, Job, JobApplication, MyUser, Organization, Post, TimelineEntry, orgPost
+
+
+@skipUnless(connection.vendor == "sqlite", "checks SQLite EXPLAIN QUERY PLAN output")
+class HotQueryIndexTest(TestCase):
+    """Each hot filter+ordering should be answered from its composite index."""
+
+    def setUp(self):
+        self.user = MyUser.objects.create(username="indexer")
+        self.organization = Organization.objects.create(
+            name="Index Org", bio="Fast lookups", owner=self.user
+        )
+        self.job = Job.objects.create(
+            creator=self.user, title="DBA", description="Tune queries", pay="$1"
+        )
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan)
+        self.assertNotIn("TEMP B-TREE", plan.upper())
+
+    def test_global_feed(self):
+        """get_posts walks post_created_idx"""
+        posts = Post.objects.for_feed(self.user).order_by("-created_at", "-id")[:11]
+        self.assertUsesIndex(posts, "post_created_idx")
+
+    def test_users_posts(self):
+        """get_users_posts walks post_user_created_idx"""
+        posts = self.user.posts.for_feed(self.user).order_by("-created_at", "-id")[:11]
+        self.assertUsesIndex(posts, "post_user_created_idx")
+
+    def test_home_timeline(self):
+        """HomeTimeline pages walk timeline_owner_created_idx"""
+        entries = TimelineEntry.objects.filter(owner=self.user).order_by("-created_at", "-post") \
+            .values_list("created_at", "post_id")[:11]
+        self.assertUsesIndex(entries, "timeline_owner_created_idx")
+
+    def test_organization_posts(self):
+        """get_organization_posts walks orgpost_org_created_idx"""
+        posts = orgPost.objects.filter(organization=self.organization).order_by("-created_at", "-id")[:11]
+        self.assertUsesIndex(posts, "orgpost_org_created_idx")
+
+    def test_organization_events(self):
+        """EventListCreateView walks event_org_starts_idx"""
+        events = Event.objects.filter(organization_id=self.organization.id).order_by("starts_at")
+        self.assertUsesIndex(events, "event_org_starts_idx")
+
+    def test_jobs_list(self):
+        """jobs walks job_post_date_idx"""
+        jobs = Job.objects.all().order_by("-post_date")[:10]
+        self.assertUsesIndex(jobs, "job_post_date_idx")
+
+    def test_my_jobs(self):
+        """my_jobs walks job_creator_date_idx"""
+        jobs = Job.objects.filter(creator=self.user).order_by("-post_date")
+        self.assertUsesIndex(jobs, "job_creator_date_idx")
+
+    def test_job_applications(self):
+        """job_applications walks jobapp_job_date_idx"""
+        applications = JobApplication.objects.filter(job=self.job).order_by("-application_date")
+        self.assertUsesIndex(applications, "jobapp_job_date_idx")
@@ -0,0 +1,87 @@
+# backend/base/tests/test_join_requests.py
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from base.membership import get_role
+from base.models import MyUser, Organization
+
+
+class BulkJoinRequestsTest(TestCase):
+    def setUp(self):
+        """An organization with a queue of join requests"""
+        cache.clear()  # Login throttle counters live in the cache
+        self.owner = MyUser.objects.create_user(username="owner", password="password123")
+        MyUser.objects.create_user(username="outsider", password="password123")
+        self.org = Organization.objects.create(name="Popular", bio="b", owner=self.owner)
+        self.org.members.add(self.owner)
+        self.applicants = [MyUser.objects.create(username=f"applicant{i:03d}") for i in range(200)]
+        self.org.pending_requests.add(*self.applicants)
+        self.url = f"/api/organization/{self.org.id}/requests/"
+
+    def _login(self, username):
+        client = Client()
+        client.post(
+            reverse("login"),
+            {"username": username, "password": "password123"},
+            content_type="application/json"
+        )
+        client.get("/api/get_posts/")  # warm the authenticated-user cache
+        return client
+
+    def _respond(self, client, action, usernames):
+        return client.post(self.url, {"action": action, "usernames": usernames},
+                           content_type="application/json")
+
+    def test_accept_many_in_fixed_queries(self):
+        """Accepting 200 requests takes as many queries as accepting 2"""
+        client = self._login("owner")
+        names = [user.username for user in self.applicants]
+        get_role(self.org.id, "applicant000")  # cached before the change
+
+        with CaptureQueriesContext(connection) as few:
+            self._respond(client, "accept", names[:2])
+        with CaptureQueriesContext(connection) as many:
+            response = self._respond(client, "accept", names[2:])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(few.captured_queries), len(many.captured_queries))
+        self.assertEqual(set(response.data["results"].values()), {"accepted"})
+        self.assertEqual(self.org.members.count(), 201)
+        self.org.refresh_from_db()
+        self.assertEqual(self.org.member_count, 201)
+        self.assertEqual(self.org.pending_requests.count(), 0)
+        self.assertTrue(get_role(self.org.id, "applicant000").is_member)
+
+    def test_reject_reports_each_user(self):
+        """Usernames without a request are reported, the rest are dropped"""
+        client = self._login("owner")
+        response = self._respond(client, "reject", ["applicant000", "owner", "nobody"])
+
+        self.assertEqual(response.data["results"], {
+            "applicant000": "rejected", "owner": "not_pending", "nobody": "not_pending",
+        })
+        self.assertFalse(self.org.pending_requests.filter(pk="applicant000").exists())
+        self.assertFalse(self.org.members.filter(pk="applicant000").exists())
+
+        again = self._respond(client, "accept", ["applicant000"])
+        self.assertEqual(again.data["results"], {"applicant000": "not_pending"})
+
+    def test_owner_only(self):
+        response = self._respond(self._login("outsider"), "accept", ["applicant000"])
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertTrue(self.org.pending_requests.filter(pk="applicant000").exists())
+
+    def test_bad_requests(self):
+        client = self._login("owner")
+        self.assertEqual(self._respond(client, "approve", ["applicant000"]).status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self._respond(client, "accept", "applicant000").status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self._respond(client, "accept", ["x"] * 501).status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        response = client.post("/api/organization/9999/requests/", {"action": "accept", "usernames": []},
+                               content_type="application/json")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
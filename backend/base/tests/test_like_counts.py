@@ -0,0 +1,81 @@
+# backend/base/tests/test_like_counts.py
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from base.models import MyUser, Organization, Post, orgPost
+
+
+class LikeCounterTest(TestCase):
+    def setUp(self):
+        """Set up an author, a few likers and one post of each kind"""
+        self.author = MyUser.objects.create(username="author")
+        self.likers = [MyUser.objects.create(username=f"liker{i}") for i in range(3)]
+        self.organization = Organization.objects.create(
+            name="Counter Org", bio="Counts things", owner=self.author
+        )
+        self.post = Post.objects.create(user=self.author, description="Count me")
+        self.org_post = orgPost.objects.create(
+            user=self.author, description="Count me too", organization=self.organization
+        )
+
+    def _stored(self, post):
+        return type(post).objects.values_list("like_count", flat=True).get(pk=post.pk)
+
+    def test_add_and_remove_update_counter(self):
+        """Adding and removing likes moves the stored counter"""
+        self.post.likes.add(*self.likers)
+        self.assertEqual(self._stored(self.post), 3)
+        self.assertEqual(self.post.like_count, 3)
+
+        self.post.likes.remove(self.likers[0])
+        self.assertEqual(self._stored(self.post), 2)
+
+    def test_duplicate_add_and_missing_remove_are_ignored(self):
+        """Re-adding an existing like or removing a missing one changes nothing"""
+        self.post.likes.add(self.likers[0])
+        self.post.likes.add(self.likers[0])
+        self.post.likes.remove(self.likers[1])
+
+        self.assertEqual(self._stored(self.post), 1)
+
+    def test_clear_resets_counter(self):
+        """Clearing every like zeroes the counter"""
+        self.org_post.likes.add(*self.likers)
+        self.org_post.likes.clear()
+
+        self.assertEqual(self._stored(self.org_post), 0)
+
+    def test_reverse_side_updates_counter(self):
+        """Changes made from the user side are counted too"""
+        other = Post.objects.create(user=self.author, description="Another")
+        self.likers[0].post_likes.add(self.post, other)
+        self.assertEqual(self._stored(self.post), 1)
+        self.assertEqual(self._stored(other), 1)
+
+        self.likers[0].post_likes.clear()
+        self.assertEqual(self._stored(self.post), 0)
+        self.assertEqual(self._stored(other), 0)
+
+    def test_deleted_liker_releases_likes(self):
+        """Deleting a user takes their likes off both kinds of post"""
+        self.post.likes.add(*self.likers)
+        self.org_post.likes.add(self.likers[0])
+
+        self.likers[0].delete()
+
+        self.assertEqual(self._stored(self.post), 2)
+        self.assertEqual(self._stored(self.org_post), 0)
+
+    def test_reconcile_command_fixes_drift(self):
+        """reconcile_like_counts rewrites counters that no longer match"""
+        self.post.likes.add(*self.likers)
+        Post.objects.filter(pk=self.post.pk).update(like_count=42)
+        orgPost.objects.filter(pk=self.org_post.pk).update(like_count=7)
+
+        out = StringIO()
+        call_command("reconcile_like_counts", stdout=out)
+
+        self.assertEqual(self._stored(self.post), 3)
+        self.assertEqual(self._stored(self.org_post), 0)
+        self.assertIn("Post: fixed 1", out.getvalue())
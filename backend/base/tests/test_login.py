@@ -0,0 +1,92 @@
+# backend/base/tests/test_login.py
+import threading
+from unittest import mock
+
+from django.contrib.auth.hashers import make_password, verify_password
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from base.models import MyUser
+
+
+@override_settings(PASSWORD_HASH_ITERATIONS=1000)
+class LoginTest(TestCase):
+    def setUp(self):
+        """Create a user with a cheap hash so logins are quick"""
+        cache.clear()  # Login throttle counters live in the cache
+        self.client = Client()
+        self.user = MyUser.objects.create_user(
+            username="dana", password="password123", bio="Hello"
+        )
+
+    def _login(self, password="password123", **extra):
+        return self.client.post(
+            reverse("login"),
+            {"username": "dana", "password": password, **extra},
+            content_type="application/json"
+        )
+
+    def test_login_reuses_authenticated_user(self):
+        """The user row is read once, by authentication, not again for the response"""
+        with CaptureQueriesContext(connection) as ctx:
+            response = self._login()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data["success"])
+        self.assertEqual(response.data["user"]["bio"], "Hello")
+        self.assertIn("access_token", response.cookies)
+        user_reads = [q for q in ctx.captured_queries if 'FROM "base_myuser"' in q["sql"]]
+        self.assertEqual(len(user_reads), 1)
+
+    def test_wrong_password(self):
+        """Bad credentials report failure without setting cookies"""
+        response = self._login(password="wrong")
+
+        self.assertFalse(response.data["success"])
+        self.assertNotIn("access_token", response.cookies)
+
+    def test_missing_password(self):
+        """A malformed body is a failed login, not a server error"""
+        response = self.client.post(
+            reverse("login"), {"username": "dana"}, content_type="application/json"
+        )
+        self.assertFalse(response.data["success"])
+
+    def test_hashing_runs_in_pool(self):
+        """Password verification happens on a hashing thread"""
+        threads = []
+
+        def recording_verify(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return verify_password(*args, **kwargs)
+
+        with mock.patch("base.hashers.verify_password", recording_verify):
+            self._login()
+
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("password-hash"))
+
+    def test_outdated_hash_upgraded_on_login(self):
+        """A hash made with old costs is replaced after a successful login"""
+        with override_settings(PASSWORD_HASH_ITERATIONS=2000):
+            self.assertTrue(self._login().data["success"])
+
+        self.user.refresh_from_db()
+        self.assertIn("$2000$", self.user.password)
+
+    def test_registration_hashes_in_pool(self):
+        """Hashes made outside login share the pool's cap too"""
+        threads = []
+
+        def recording_make(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return make_password(*args, **kwargs)
+
+        with mock.patch("base.hashers.make_password", recording_make):
+            MyUser(username="erin").set_password("password123")
+
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("password-hash"))
@@ -0,0 +1,129 @@
+# backend/base/tests/test_membership.py
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from base.membership import Memberships, NO_ROLE, Role, get_role
+from base.models import MyUser, Organization
+
+
+class RoleLookupTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = MyUser.objects.create(username="owner")
+        self.user = MyUser.objects.create(username="someone")
+        self.org = Organization.objects.create(name="Org", bio="b", owner=self.owner)
+        self.org.members.add(self.owner)
+
+    def test_roles(self):
+        self.assertEqual(get_role(self.org.id, "owner"), Role(True, True, False))
+        self.assertEqual(get_role(self.org.id, "someone"), NO_ROLE)
+        self.assertEqual(get_role(9999, "owner"), NO_ROLE)
+
+    def test_cached_until_membership_changes(self):
+        """Repeat lookups skip the database; joins from either side invalidate"""
+        get_role(self.org.id, "someone")
+        with CaptureQueriesContext(connection) as ctx:
+            get_role(self.org.id, "someone")
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+        self.org.pending_requests.add(self.user)
+        self.assertTrue(get_role(self.org.id, "someone").is_pending)
+
+        self.user.organization_requests.remove(self.org)
+        self.user.joined_organizations.add(self.org)
+        self.assertEqual(get_role(self.org.id, "someone"), Role(False, True, False))
+
+        self.user.joined_organizations.clear()
+        self.assertEqual(get_role(self.org.id, "someone"), NO_ROLE)
+
+    def test_owner_change_and_user_delete_invalidate(self):
+        get_role(self.org.id, "someone")
+        self.org.owner = self.user
+        self.org.members.add(self.user)
+        self.org.save()
+        self.assertTrue(get_role(self.org.id, "someone").is_owner)
+
+        self.owner.delete()
+        MyUser.objects.create(username="owner")  # the name is free again
+        self.assertEqual(get_role(self.org.id, "owner"), NO_ROLE)
+
+    def test_request_memo(self):
+        """One request asks the cache once per organization and user"""
+        memo = Memberships(self.owner)
+        memo.is_owner(self.org.id)
+        cache.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertTrue(memo.is_member(self.org.id))
+            self.assertFalse(memo.is_pending(str(self.org.id)))
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+        memo.forget(self.org.id)
+        with CaptureQueriesContext(connection) as ctx:
+            memo.is_member(self.org.id)
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+
+class MembershipViewsTest(TestCase):
+    def setUp(self):
+        cache.clear()  # Login throttle counters live in the cache
+        self.owner = MyUser.objects.create_user(username="owner", password="password123")
+        self.outsider = MyUser.objects.create_user(username="outsider", password="password123")
+        self.small = Organization.objects.create(name="Small", bio="b", owner=self.owner)
+        self.large = Organization.objects.create(name="Large", bio="b", owner=self.owner)
+        self.small.members.add(self.owner)
+        crowd = [MyUser(username=f"member{i:03d}") for i in range(300)]
+        MyUser.objects.bulk_create(crowd)
+        self.large.members.add(self.owner, *crowd)
+
+    def _login(self, username):
+        client = Client()
+        client.post(
+            reverse("login"),
+            {"username": username, "password": "password123"},
+            content_type="application/json"
+        )
+        client.get("/api/get_posts/")  # warm the authenticated-user cache
+        return client
+
+    def _queries(self, client, method, url, data=None):
+        with CaptureQueriesContext(connection) as ctx:
+            response = getattr(client, method)(url, data or {}, content_type="application/json")
+        return response, len(ctx.captured_queries)
+
+    def test_membership_checks_do_not_grow_with_members(self):
+        """Authorization costs the same for 1 member and 300"""
+        client = self._login("owner")
+        _, small = self._queries(client, "post", "/api/create_org_post/",
+                                 {"organization_id": self.small.id, "description": "hi"})
+        _, large = self._queries(client, "post", "/api/create_org_post/",
+                                 {"organization_id": self.large.id, "description": "hi"})
+        self.assertEqual(small, large)
+
+    def test_join_then_accept(self):
+        """Join and accept see each other's writes through the cache"""
+        outsider = self._login("outsider")
+        self.assertEqual(outsider.get(f"/api/organization/posts/{self.large.id}/").status_code,
+                         status.HTTP_403_FORBIDDEN)
+        self.assertEqual(outsider.post(f"/api/organization/join/{self.large.id}/").status_code,
+                         status.HTTP_200_OK)
+        self.assertEqual(outsider.post(f"/api/organization/join/{self.large.id}/").data,
+                         {"error": "Already requested"})
+
+        owner = self._login("owner")
+        response = owner.post(f"/api/organization/accept/{self.large.id}/outsider/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(outsider.get(f"/api/organization/posts/{self.large.id}/").status_code,
+                         status.HTTP_200_OK)
+
+    def test_only_owner_creates_events(self):
+        url = f"/api/organization/{self.large.id}/events/"
+        event = {"organization_id": self.large.id, "title": "Meetup",
+                 "description": "", "starts_at": "2030-01-01T18:00:00Z"}
+        self.assertEqual(self._login("outsider").post(url, event, content_type="application/json").status_code,
+                         status.HTTP_403_FORBIDDEN)
+        self.assertEqual(self._login("owner").post(url, event, content_type="application/json").status_code,
+                         status.HTTP_201_CREATED)
@@ -202,7 +202,7 @@ class OrganizationAPITest(TestCase):
         response = self.client.get(self.org_posts_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIsInstance(response.data, list)
+        self.assertIsInstance(response.data["results"], list)
     
     def test_get_organization_posts_unauthorized(self):
         """Test that non-members cannot access organization posts"""
@@ -235,11 +235,11 @@ class OrganizationAPITest(TestCase):
         response = self.client.get(f"{self.search_orgs_url}?query=Test")
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["name"], "Test Organization")
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["name"], "Test Organization")
         
         # Search with no results
         response = self.client.get(f"{self.search_orgs_url}?query=NonExistent")
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 0)
\ No newline at end of file
+        self.assertEqual(len(response.data["results"]), 0)
\ No newline at end of file
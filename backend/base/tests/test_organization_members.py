@@ -0,0 +1,93 @@
+# backend/base/tests/test_organization_members.py
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from base.models import MyUser, Organization
+
+
+class OrganizationMembersTest(TestCase):
+    def setUp(self):
+        """An owner, a viewer and organizations with many members"""
+        cache.clear()  # Login throttle counters live in the cache
+        self.owner = MyUser.objects.create_user(username="owner", password="password123")
+        self.viewer = MyUser.objects.create_user(username="viewer", password="password123")
+        self.crowd = [MyUser.objects.create(username=f"member{i:02d}") for i in range(60)]
+
+        self.orgs = []
+        for i in range(3):
+            org = Organization.objects.create(name=f"Org {i}", bio="b", owner=self.owner)
+            org.members.add(self.owner, self.viewer, *self.crowd)
+            self.orgs.append(org)
+        self.org = self.orgs[0]
+        self.org.pending_requests.add(*self.crowd[:3])
+
+    def _login(self, username):
+        client = Client()
+        client.post(
+            reverse("login"),
+            {"username": username, "password": "password123"},
+            content_type="application/json"
+        )
+        client.get("/api/get_posts/")  # warm the authenticated-user cache
+        return client
+
+    def test_user_organizations_are_summaries(self):
+        """The list is one query and carries no member rows"""
+        client = self._login("viewer")
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get("/api/organization/user/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        entry = response.data[0]
+        self.assertEqual(
+            set(entry), {"id", "name", "bio", "profile_image", "member_count", "is_owner", "is_member"}
+        )
+        self.assertEqual(entry["member_count"], 62)
+        self.assertTrue(entry["is_member"])
+        self.assertFalse(entry["is_owner"])
+
+    def test_detail_has_flags_instead_of_lists(self):
+        """The organization page reports the viewer's state, not every member"""
+        client = self._login("viewer")
+        data = client.get(f"/api/organization/{self.org.id}/").data
+
+        self.assertNotIn("members", data)
+        self.assertNotIn("pending_requests", data)
+        self.assertEqual(data["member_count"], 62)
+        self.assertTrue(data["is_member"])
+        self.assertFalse(data["has_pending_request"])
+        self.assertEqual(data["owner_username"], "owner")
+
+    def test_members_are_cursor_paged(self):
+        """Members come back 50 at a time, newest first, without overlap"""
+        self.org.members.add(MyUser.objects.create(username="latecomer"))
+        client = self._login("viewer")
+        first = client.get(f"/api/organization/{self.org.id}/members/").data
+        second = client.get(first["next"]).data
+
+        self.assertEqual(len(first["results"]), 50)
+        self.assertEqual(first["results"][0], {"username": "latecomer"})
+        self.assertEqual(len(second["results"]), 13)
+        self.assertIsNone(second["next"])
+        usernames = {row["username"] for row in first["results"] + second["results"]}
+        self.assertEqual(len(usernames), 63)
+
+    def test_pending_list_is_owner_only(self):
+        """Only the owner can page through join requests"""
+        url = f"/api/organization/{self.org.id}/pending/"
+        self.assertEqual(self._login("viewer").get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self._login("owner").get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {row["username"] for row in response.data["results"]}, {"member00", "member01", "member02"}
+        )
+
+    def test_missing_organization(self):
+        client = self._login("owner")
+        self.assertEqual(client.get("/api/organization/9999/members/").status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(client.get("/api/organization/9999/pending/").status_code, status.HTTP_404_NOT_FOUND)
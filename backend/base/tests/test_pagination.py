@@ -0,0 +1,134 @@
+# backend/base/tests/test_pagination.py
+import json
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from base.models import MyUser, Post
+
+
+class KeysetPaginationTest(TestCase):
+    def setUp(self):
+        """Set up a user with enough posts to span several pages"""
+        cache.clear()  # Login throttle counters live in the cache
+        self.client = Client()
+
+        self.user = MyUser.objects.create_user(
+            username="scroller",
+            password="password123",
+            email="scroller@example.com",
+            bio="Scrolls a lot"
+        )
+
+        self.posts = [
+            Post.objects.create(user=self.user, description=f"Post {i}")
+            for i in range(25)
+        ]
+
+        self.get_posts_url = "/api/get_posts/"
+        self.client.post(
+            reverse("login"),
+            {"username": "scroller", "password": "password123"},
+            content_type="application/json"
+        )
+
+    def _walk(self, url):
+        """Follow next links and collect every post id"""
+        ids = []
+        pages = 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(post["id"] for post in response.data["results"])
+            url = response.data["next"]
+            pages += 1
+        return ids, pages
+
+    def test_walks_every_post_once_newest_first(self):
+        """Following next cursors yields every post exactly once, newest first"""
+        ids, pages = self._walk(self.get_posts_url)
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(ids, [post.id for post in reversed(self.posts)])
+
+    def test_previous_cursor_returns_prior_page(self):
+        """The previous link on page two points back at page one"""
+        first = self.client.get(self.get_posts_url).data
+        self.assertIsNone(first["previous"])
+
+        second = self.client.get(first["next"]).data
+        back = self.client.get(second["previous"]).data
+
+        self.assertEqual(
+            [post["id"] for post in back["results"]],
+            [post["id"] for post in first["results"]],
+        )
+
+    def test_no_count_query(self):
+        """Paging never issues a COUNT(*) over base_post"""
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.get_posts_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for query in ctx.captured_queries:
+            sql = query["sql"].upper()
+            self.assertFalse(
+                '"__COUNT"' in sql and 'FROM "BASE_POST"' in sql, sql
+            )
+
+    def test_invalid_cursor(self):
+        """A garbage cursor is rejected with 404"""
+        response = self.client.get(f"{self.get_posts_url}?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_post_likes_endpoint_pages_through_likers(self):
+        """The liker list is served separately, most recent like first"""
+        post = self.posts[0]
+        likers = [MyUser.objects.create(username=f"liker{i}") for i in range(60)]
+        for liker in likers:
+            post.likes.add(liker)
+
+        url = f"/api/posts/{post.id}/likes/"
+        first = self.client.get(url).data
+        second = self.client.get(first["next"]).data
+
+        usernames = [row["username"] for row in first["results"] + second["results"]]
+        self.assertEqual(len(first["results"]), 50)
+        self.assertIsNone(second["next"])
+        self.assertEqual(usernames, [liker.username for liker in reversed(likers)])
+
+    def test_post_likes_missing_post(self):
+        """Asking for the likers of a missing post returns 404"""
+        response = self.client.get("/api/posts/999999/likes/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_users_posts_are_paged(self):
+        """A user's post history is paged with the same cursor scheme"""
+        ids, pages = self._walk(f"/api/posts/{self.user.username}/")
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(ids, [post.id for post in reversed(self.posts)])
+
+    def test_users_posts_ndjson_stream(self):
+        """stream=ndjson sends the whole history as one JSON object per line"""
+        response = self.client.get(f"/api/posts/{self.user.username}/?stream=ndjson")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 25)
+        self.assertEqual(json.loads(lines[0])["description"], "Post 24")
+
+    def test_orders_by_timestamp_within_a_day(self):
+        """Posts from the same day are ordered by time, not by id"""
+        early, late = self.posts[-2], self.posts[-1]
+        Post.objects.filter(pk=early.pk).update(created_at=late.created_at + timedelta(minutes=5))
+
+        response = self.client.get(self.get_posts_url)
+        ids = [post["id"] for post in response.data["results"]]
+
+        self.assertEqual(ids[:2], [early.id, late.id])
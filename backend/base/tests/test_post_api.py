@@ -87,10 +87,11 @@ class PostAPITest(TestCase):
         response = self.client.get(self.user1_posts_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["username"], "user1")
-        self.assertEqual(response.data[0]["description"], "Test post by user1")
-        self.assertFalse(response.data[0]["liked"])  # user2 hasn't liked user1's post
+        results = response.data["results"]
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["username"], "user1")
+        self.assertEqual(results[0]["description"], "Test post by user1")
+        self.assertFalse(results[0]["liked"])  # user2 hasn't liked user1's post
     
     def test_get_all_posts(self):
         """Test retrieving all posts"""
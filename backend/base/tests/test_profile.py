@@ -0,0 +1,67 @@
+# backend/base/tests/test_profile.py
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from base.models import MyUser
+
+
+class ProfileDataTest(TestCase):
+    def setUp(self):
+        cache.clear()  # Login throttle counters and cached responses live in the cache
+        self.viewer = MyUser.objects.create_user(username="viewer", password="password123")
+        self.star = MyUser.objects.create(username="star", bio="Famous")
+        self.star.followers.add(self.viewer, *MyUser.objects.bulk_create(
+            [MyUser(username=f"fan{i}") for i in range(20)]
+        ))
+        self.client = Client()
+        self.client.post(
+            reverse("login"),
+            {"username": "viewer", "password": "password123"},
+            content_type="application/json"
+        )
+        self.client.get("/api/get_posts/")  # warm the authenticated-user cache
+        self.url = "/api/user_data/star/"
+
+    def test_single_query(self):
+        """Counts and the follow flag come from one annotated query"""
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url)
+
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual(response.data["follower_count"], 21)
+        self.assertEqual(response.data["following_count"], 0)
+        self.assertTrue(response.data["following"])
+        self.assertFalse(response.data["is_owner"])
+
+    def test_unchanged_profile_is_not_modified(self):
+        """A matching If-None-Match gets a 304 without touching the database"""
+        etag = self.client.get(self.url)["ETag"]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_follow_changes_etag(self):
+        """Unfollowing invalidates the cached profile and its ETag"""
+        etag = self.client.get(self.url)["ETag"]
+        self.client.post("/api/toggle_follow/", {"username": "star"}, content_type="application/json")
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertFalse(response.data["following"])
+        self.assertEqual(response.data["follower_count"], 20)
+
+    def test_etag_survives_cache_expiry(self):
+        """The ETag depends on the data, so a rebuilt response still matches"""
+        etag = self.client.get(self.url)["ETag"]
+        cache.clear()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -0,0 +1,139 @@
+# backend/base/tests/test_query_budget.py
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from base.models import MyUser, Organization, Post, orgPost
+
+
+class FeedQueryBudgetTest(TestCase):
+    def setUp(self):
+        """Set up a viewer, an author and a client logged in as the viewer"""
+        cache.clear()  # Login throttle counters live in the cache
+        self.client = Client()
+
+        self.viewer = MyUser.objects.create_user(
+            username="viewer",
+            password="password123",
+            email="viewer@example.com",
+            bio="Reads the feed"
+        )
+        self.author = MyUser.objects.create_user(
+            username="author",
+            password="password123",
+            email="author@example.com",
+            bio="Writes the feed"
+        )
+        self.fans = [
+            MyUser.objects.create_user(username=f"fan{i}", password="password123")
+            for i in range(3)
+        ]
+
+        self.client.post(
+            reverse("login"),
+            {"username": "viewer", "password": "password123"},
+            content_type="application/json"
+        )
+        # Warm the authenticated-user cache so query counts compare like for like
+        self.client.get("/api/get_posts/")
+
+    def _add_posts(self, count):
+        """Create posts by the author, each liked by every fan"""
+        for i in range(count):
+            post = Post.objects.create(user=self.author, description=f"Post {i}")
+            post.likes.add(*self.fans)
+
+    def _count_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(ctx.captured_queries)
+
+    def test_get_posts_query_budget_is_fixed(self):
+        """A full page costs the same number of queries as a single post"""
+        self._add_posts(1)
+        small = self._count_queries("/api/get_posts/")
+
+        self._add_posts(9)
+        full = self._count_queries("/api/get_posts/")
+
+        self.assertEqual(small, full)
+
+    def test_get_users_posts_query_budget_is_fixed(self):
+        """A user's post list does not issue per-post queries"""
+        self._add_posts(1)
+        small = self._count_queries(f"/api/posts/{self.author.username}/")
+
+        self._add_posts(9)
+        full = self._count_queries(f"/api/posts/{self.author.username}/")
+
+        self.assertEqual(small, full)
+
+    def test_liked_flag_comes_from_the_query(self):
+        """The viewer's liked flag is set without scanning the likes list"""
+        self._add_posts(2)
+        liked_post = Post.objects.filter(user=self.author).first()
+        liked_post.likes.add(self.viewer)
+
+        response = self.client.get("/api/get_posts/")
+
+        liked = {post["id"]: post["liked"] for post in response.data["results"]}
+        self.assertTrue(liked.pop(liked_post.id))
+        self.assertFalse(any(liked.values()))
+
+    def _create_post(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(
+                "/api/create_post/",
+                {"description": "Fresh post"},
+                content_type="application/json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(ctx.captured_queries)
+
+    def test_create_post_query_budget(self):
+        """Creating a post costs the same however many followers get it"""
+        response, lonely = self._create_post()
+        self.assertEqual(response.data["like_count"], 0)
+        self.assertFalse(response.data["liked"])
+
+        self.viewer.followers.add(*self.fans)
+        _, popular = self._create_post()
+
+        self.assertEqual(lonely, popular)
+
+    def test_feed_payload_omits_liker_list(self):
+        """Posts carry like_count and liked, never the full liker list"""
+        self._add_posts(1)
+
+        response = self.client.get("/api/get_posts/")
+        post = response.data["results"][0]
+
+        self.assertNotIn("likes", post)
+        self.assertEqual(post["like_count"], len(self.fans))
+        self.assertFalse(post["liked"])
+
+    def test_organization_feed_is_paged_with_fixed_budget(self):
+        """The org feed pages by cursor and does not query per post"""
+        club = Organization.objects.create(name="Club", bio="Members only", owner=self.author)
+        club.members.add(self.viewer, self.author)
+        elsewhere = Organization.objects.create(name="Elsewhere", bio="Not joined", owner=self.author)
+        orgPost.objects.create(user=self.author, description="Hidden", organization=elsewhere)
+
+        orgPost.objects.create(user=self.author, description="First", organization=club)
+        small = self._count_queries("/api/organization/feed/")
+
+        for i in range(14):
+            orgPost.objects.create(user=self.author, description=f"More {i}", organization=club)
+        full = self._count_queries("/api/organization/feed/")
+        self.assertEqual(small, full)
+
+        first = self.client.get("/api/organization/feed/").data
+        second = self.client.get(first["next"]).data
+        descriptions = [post["description"] for post in first["results"] + second["results"]]
+
+        self.assertEqual(len(first["results"]), 10)
+        self.assertEqual(len(descriptions), 15)
+        self.assertNotIn("Hidden", descriptions)
@@ -0,0 +1,108 @@
+# backend/base/tests/test_response_cache.py
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from base.models import Job, MyUser, Organization
+
+
+class ResponseCacheTest(TestCase):
+    def setUp(self):
+        """Log in an owner and a visitor, each with their own client"""
+        cache.clear()  # Login throttle counters and cached responses live in the cache
+        self.owner = MyUser.objects.create_user(username="owner", password="password123")
+        self.visitor = MyUser.objects.create_user(username="visitor", password="password123")
+        self.org = Organization.objects.create(name="Cached Org", bio="Bio", owner=self.owner)
+
+        self.owner_client = self._login("owner")
+        self.visitor_client = self._login("visitor")
+
+    def _login(self, username):
+        client = Client()
+        client.post(
+            reverse("login"),
+            {"username": username, "password": "password123"},
+            content_type="application/json"
+        )
+        # Warm the authenticated-user cache so query counts compare like for like
+        client.get("/api/get_posts/")
+        return client
+
+    def _get(self, client, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data, len(ctx.captured_queries)
+
+    def test_authenticated_varies_by_user(self):
+        """The cached authenticated response never leaks another username"""
+        owner_data, _ = self._get(self.owner_client, "/api/authenticated/")
+        visitor_data, _ = self._get(self.visitor_client, "/api/authenticated/")
+
+        self.assertEqual(owner_data["username"], "owner")
+        self.assertEqual(visitor_data["username"], "visitor")
+
+    def test_organization_served_from_cache_per_user(self):
+        """A repeat read skips the database and keeps is_owner per user"""
+        url = f"/api/organization/{self.org.id}/"
+        first, cold = self._get(self.owner_client, url)
+        again, warm = self._get(self.owner_client, url)
+        visitor_data, _ = self._get(self.visitor_client, url)
+
+        self.assertEqual(first, again)
+        self.assertLess(warm, cold)
+        self.assertTrue(again["is_owner"])
+        self.assertFalse(visitor_data["is_owner"])
+
+    def test_organization_write_invalidates(self):
+        """Saving the organization or changing members drops cached copies"""
+        url = f"/api/organization/{self.org.id}/"
+        self._get(self.visitor_client, url)
+
+        self.org.bio = "Updated bio"
+        self.org.save()
+        data, _ = self._get(self.visitor_client, url)
+        self.assertEqual(data["bio"], "Updated bio")
+
+        self.org.members.add(self.visitor)
+        data, _ = self._get(self.visitor_client, url)
+        self.assertTrue(data["is_member"])
+
+    def test_job_create_invalidates_list(self):
+        """A new job shows up in the cached job list straight away"""
+        self._get(self.visitor_client, "/api/jobs/")
+
+        response = self.owner_client.post(
+            "/api/jobs/",
+            {"title": "Engineer", "description": "Build things", "pay": "$1"},
+            content_type="application/json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        data, _ = self._get(self.visitor_client, "/api/jobs/")
+        self.assertEqual([job["title"] for job in data["results"]], ["Engineer"])
+
+    def test_job_detail_invalidated_on_save(self):
+        """Editing a job refreshes its cached detail"""
+        job = Job.objects.create(creator=self.owner, title="Old", description="d", pay="$1")
+        self._get(self.visitor_client, f"/api/jobs/{job.id}/")
+
+        job.title = "New"
+        job.save()
+        data, _ = self._get(self.visitor_client, f"/api/jobs/{job.id}/")
+        self.assertEqual(data["title"], "New")
+
+    def test_toggle_follow_invalidates_profiles(self):
+        """Following someone updates both the flag and the follower count"""
+        data, _ = self._get(self.visitor_client, "/api/user_data/owner/")
+        self.assertFalse(data["following"])
+
+        self.visitor_client.post(
+            "/api/toggle_follow/", {"username": "owner"}, content_type="application/json"
+        )
+
+        data, _ = self._get(self.visitor_client, "/api/user_data/owner/")
+        self.assertTrue(data["following"])
+        self.assertEqual(data["follower_count"], 1)
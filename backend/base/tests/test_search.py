@@ -0,0 +1,223 @@
+# backend/base/tests/test_search.py
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from django.utils import timezone
+from base.models import Event, Job, MyUser, Organization, Post, orgPost
+from base.search import FTS5SearchBackend, PrefixSearchBackend
+
+
+class SearchBackendTest(TestCase):
+    def setUp(self):
+        """A handful of users and organizations to search"""
+        self.john = MyUser.objects.create(username="john_smith", first_name="John", last_name="Smith")
+        MyUser.objects.create(username="jane", first_name="Jane", last_name="Johnson")
+        MyUser.objects.create(username="bob", first_name="Robert", last_name="Jones")
+        self.org = Organization.objects.create(
+            name="Chess Club", bio="Weekly games for all levels", owner=self.john
+        )
+        Organization.objects.create(name="Book Club", bio="We read chess books too", owner=self.john)
+
+    def test_prefix_matches_any_name_column(self):
+        """Every word matches as a prefix of the username or a name"""
+        backend = FTS5SearchBackend()
+
+        self.assertEqual(backend.search(MyUser, "smi", 10), ["john_smith"])
+        self.assertEqual(set(backend.search(MyUser, "jo", 10)), {"john_smith", "jane", "bob"})
+        self.assertEqual(backend.search(MyUser, "jo smi", 10), ["john_smith"])
+
+    def test_name_hits_rank_above_bio_hits(self):
+        """An organization named for the query beats one that mentions it"""
+        chess, books = FTS5SearchBackend().search(Organization, "chess", 10)
+        self.assertEqual(chess, self.org.id)
+
+    def test_index_follows_writes(self):
+        """Triggers keep the index in step with inserts, updates and deletes"""
+        backend = FTS5SearchBackend()
+        self.org.name = "Go Society"
+        self.org.save()
+
+        self.assertEqual(backend.search(Organization, "society", 10), [self.org.id])
+        self.assertNotIn(self.org.id, backend.search(Organization, "chess", 10))
+
+        self.org.delete()
+        self.assertEqual(backend.search(Organization, "society", 10), [])
+
+    def test_query_syntax_is_not_interpreted(self):
+        """FTS5 operators in the query are treated as plain words"""
+        backend = FTS5SearchBackend()
+        self.assertEqual(backend.search(MyUser, 'smith" (*', 10), ["john_smith"])
+        self.assertEqual(backend.search(MyUser, "  ", 10), [])
+
+    def test_prefix_backend_agrees(self):
+        """The ORM fallback finds the same rows"""
+        backend = PrefixSearchBackend()
+        self.assertEqual(backend.search(MyUser, "jo smi", 10), ["john_smith"])
+        self.assertEqual(backend.search(MyUser, "j", 10, offset=1), ["jane", "john_smith"])
+
+    def test_repair_restores_dropped_triggers(self):
+        """Triggers lost to a table rebuild come back, with the missed rows indexed"""
+        backend = FTS5SearchBackend()
+        with connection.cursor() as cursor:
+            cursor.execute('DROP TRIGGER "base_organization_fts_ai"')
+        Organization.objects.create(name="Go Society", bio="", owner=self.john)
+
+        self.assertEqual(backend.search(Organization, "society", 10), [])
+        self.assertEqual([index.kind for index in backend.repair(connection)], ["organization"])
+        self.assertEqual(len(backend.search(Organization, "society", 10)), 1)
+        self.assertEqual(backend.repair(connection), [])
+
+    def test_repair_rebuilds_an_index_out_of_step_with_its_rowids(self):
+        """An index on implicit rowids is checked against its table and rebuilt"""
+        backend = FTS5SearchBackend()
+        with connection.cursor() as cursor:
+            # As if VACUUM had renumbered the rows under the index
+            cursor.execute('UPDATE "base_myuser" SET rowid = rowid + 100')
+
+        self.assertEqual([index.kind for index in backend.repair(connection)], ["user"])
+        self.assertEqual(backend.search(MyUser, "smi", 10), ["john_smith"])
+
+
+class SearchEndpointTest(TestCase):
+    def setUp(self):
+        cache.clear()  # Login throttle counters live in the cache
+        self.viewer = MyUser.objects.create_user(username="viewer", password="password123")
+        owner = MyUser.objects.create(username="owner")
+        self.member_of = Organization.objects.create(name="Alpha Team", bio="b", owner=owner)
+        self.pending = Organization.objects.create(name="Alpha Guild", bio="b", owner=owner)
+        self.member_of.members.add(self.viewer)
+        self.pending.pending_requests.add(self.viewer)
+        for i in range(30):
+            MyUser.objects.create(username=f"alpha{i:02d}")
+
+        self.client = Client()
+        self.client.post(
+            reverse("login"),
+            {"username": "viewer", "password": "password123"},
+            content_type="application/json"
+        )
+
+    def test_organization_hits_are_lightweight(self):
+        """Results carry membership flags instead of member lists"""
+        response = self.client.get("/api/search_organizations/?query=alpha")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        hits = {hit["name"]: hit for hit in response.data["results"]}
+        self.assertNotIn("members", hits["Alpha Team"])
+        self.assertTrue(hits["Alpha Team"]["is_member"])
+        self.assertFalse(hits["Alpha Team"]["has_pending_request"])
+        self.assertTrue(hits["Alpha Guild"]["has_pending_request"])
+        self.assertEqual(hits["Alpha Guild"]["owner_username"], "owner")
+
+    def test_user_results_are_paged(self):
+        """Users come back a page at a time in a fixed number of queries"""
+        self.client.get("/api/get_posts/")  # warm the authenticated-user cache
+        with CaptureQueriesContext(connection) as ctx:
+            first = self.client.get("/api/search/?query=alpha").data
+        second = self.client.get(first["next"]).data
+
+        self.assertEqual(len(first["results"]), 20)
+        self.assertEqual(len(second["results"]), 10)
+        self.assertIsNone(second["next"])
+        self.assertEqual(set(first["results"][0]), {"username", "first_name", "last_name", "profile_image"})
+        self.assertLessEqual(len(ctx.captured_queries), 2)
+
+    @override_settings(SEARCH_BACKEND="base.search.PrefixSearchBackend")
+    def test_backend_is_pluggable(self):
+        """SEARCH_BACKEND swaps the implementation"""
+        response = self.client.get("/api/search/?query=alpha0")
+        self.assertEqual(len(response.data["results"]), 10)
+
+
+class UnifiedSearchTest(TestCase):
+    def setUp(self):
+        cache.clear()  # Login throttle counters live in the cache
+        self.viewer = MyUser.objects.create_user(username="viewer", password="password123")
+        author = MyUser.objects.create(username="author")
+        self.club = Organization.objects.create(name="Rowing Club", bio="b", owner=author)
+        self.club.members.add(self.viewer)
+        other = Organization.objects.create(name="Private Club", bio="b", owner=author)
+
+        self.job = Job.objects.create(creator=author, title="Python developer", description="Django work", pay="1")
+        self.post = Post.objects.create(user=author, description="Learning python <b>fast</b>")
+        self.org_post = orgPost.objects.create(user=author, organization=self.club, description="python meetup")
+        orgPost.objects.create(user=author, organization=other, description="python secrets")
+        self.event = Event.objects.create(
+            organization=self.club, creator=author, title="Python night", starts_at=timezone.now()
+        )
+        Event.objects.create(organization=other, creator=author, title="Python gala", starts_at=timezone.now())
+
+        self.client = Client()
+        self.client.post(
+            reverse("login"),
+            {"username": "viewer", "password": "password123"},
+            content_type="application/json"
+        )
+        self.client.get("/api/get_posts/")  # warm the authenticated-user cache
+
+    def _search(self, **params):
+        response = self.client.get("/api/search/all/", params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_typed_hits_from_every_kind(self):
+        """One query finds posts, org posts, jobs and events the viewer may see"""
+        with CaptureQueriesContext(connection) as ctx:
+            hits = self._search(query="pyth")["results"]
+
+        found = {(hit["type"], hit["id"]) for hit in hits}
+        self.assertEqual(found, {
+            ("job", self.job.id), ("post", self.post.id),
+            ("org_post", self.org_post.id), ("event", self.event.id),
+        })
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+    def test_titles_rank_above_bodies(self):
+        """Hits in a title outrank hits in body text"""
+        hits = self._search(query="python")["results"]
+        self.assertIn(hits[0]["type"], {"job", "event"})
+        self.assertEqual(hits[-1]["type"], "post")
+
+    def test_highlight_is_escaped_and_marked(self):
+        """Matched words are wrapped in <mark> and the text is escaped"""
+        hit, = self._search(query="learn", types="post")["results"]
+
+        self.assertEqual(hit["label"], "author")
+        self.assertIn("<mark>Learning</mark>", hit["highlight"])
+        self.assertIn("&lt;b&gt;", hit["highlight"])
+
+    def test_member_only_hits_carry_their_organization(self):
+        """Events and organization posts name the organization they belong to"""
+        hits = self._search(query="python", types="event,org_post")["results"]
+        self.assertEqual({hit["organization"] for hit in hits}, {self.club.id})
+
+    def test_unknown_type_is_rejected(self):
+        response = self.client.get("/api/search/all/", {"query": "python", "types": "post,spam"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_results_are_paged(self):
+        """Pages follow the rank order without overlap"""
+        for i in range(25):
+            Job.objects.create(creator=self.viewer, title=f"Python role {i}", description="d", pay="1")
+
+        first = self._search(query="python")
+        second = self.client.get(first["next"]).data
+
+        self.assertEqual(len(first["results"]), 20)
+        self.assertEqual(len(second["results"]), 9)
+        ids = {(hit["type"], hit["id"]) for hit in first["results"] + second["results"]}
+        self.assertEqual(len(ids), 29)
+
+    @override_settings(SEARCH_BACKEND="base.search.PrefixSearchBackend")
+    def test_prefix_backend_agrees(self):
+        """The ORM fallback returns the same visible hits"""
+        hits = self._search(query="python")["results"]
+
+        self.assertEqual({(hit["type"], hit["id"]) for hit in hits}, {
+            ("job", self.job.id), ("org_post", self.org_post.id), ("event", self.event.id),
+        })  # the post starts with "Learning", and the fallback only matches column starts
+        job, = [hit for hit in hits if hit["type"] == "job"]
+        self.assertEqual(job["highlight"], "<mark>Python</mark> developer")
@@ -135,9 +135,9 @@ class SerializerTest(TestCase):
         self.assertEqual(data["owner_username"], "testuser1")
         self.assertEqual(data["member_count"], 2)
         self.assertTrue(data["is_owner"])
-        self.assertEqual(len(data["members"]), 2)
-        self.assertIn("testuser1", data["members"])
-        self.assertIn("testuser2", data["members"])
+        self.assertTrue(data["is_member"])
+        self.assertFalse(data["has_pending_request"])
+        self.assertNotIn("members", data)  # paged through /organization/<id>/members/
     
     def test_org_post_serializer(self):
         """Test OrgPostSerializer"""
@@ -0,0 +1,118 @@
+# backend/base/tests/test_throttling.py
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory
+from rest_framework.request import Request
+from rest_framework.parsers import JSONParser
+from base.models import MyUser
+from base.throttling import LoginThrottle, TokenBucketThrottle
+from base.views import CustomTokenObtainPairView
+
+RATES = {
+    "DEFAULT_THROTTLE_CLASSES": ["base.throttling.LoginThrottle"],
+    "DEFAULT_THROTTLE_RATES": {"login": "2/minute", "login_ip": "3/minute"},
+}
+
+
+@override_settings(REST_FRAMEWORK=RATES)
+class TokenBucketThrottleTest(TestCase):
+    def setUp(self):
+        """Freeze the throttle clock and start with empty buckets"""
+        cache.clear()
+        self.now = 1_000_000.0
+        patcher = mock.patch.object(TokenBucketThrottle, "timer", mock.Mock(side_effect=lambda: self.now))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.factory = APIRequestFactory()
+        self.view = CustomTokenObtainPairView()
+
+    def _attempt(self, username, ip="10.0.0.1"):
+        request = Request(
+            self.factory.post(
+                "/api/login/", {"username": username}, format="json", REMOTE_ADDR=ip
+            ),
+            parsers=[JSONParser()],
+        )
+        throttle = LoginThrottle()
+        return throttle.allow_request(request, self.view), throttle.wait()
+
+    def test_bursts_up_to_the_rate_then_refuses(self):
+        """Two attempts per minute pass; the third waits for the next token"""
+        self.assertTrue(self._attempt("alice")[0])
+        self.assertTrue(self._attempt("alice")[0])
+
+        allowed, wait = self._attempt("alice")
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(wait, 30)
+
+    def test_tokens_refill_over_time(self):
+        """One token comes back every period / rate seconds"""
+        self._attempt("alice")
+        self._attempt("alice")
+
+        self.now += 30
+        self.assertTrue(self._attempt("alice")[0])
+        self.assertFalse(self._attempt("alice")[0])
+
+    def test_refused_attempts_do_not_consume(self):
+        """Hammering a full bucket does not push the next token further out"""
+        self._attempt("alice")
+        self._attempt("alice")
+        for _ in range(5):
+            self.assertFalse(self._attempt("alice")[0])
+
+        self.now += 30
+        self.assertTrue(self._attempt("alice")[0])
+
+    def test_usernames_have_separate_buckets(self):
+        """One locked-out account does not lock out the next user"""
+        self._attempt("alice")
+        self._attempt("alice")
+
+        self.assertTrue(self._attempt("bob", ip="10.0.0.2")[0])
+
+    def test_ip_bucket_limits_username_spraying(self):
+        """One client trying many accounts hits the per-IP bucket"""
+        for name in ("a", "b", "c"):
+            self.assertTrue(self._attempt(name)[0])
+
+        allowed, wait = self._attempt("d")
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(wait, 20)
+        self.assertTrue(self._attempt("d", ip="10.0.0.2")[0])
+
+    def test_refused_username_returns_ip_token(self):
+        """An attempt refused on the username bucket does not spend the IP bucket"""
+        self._attempt("alice")
+        self._attempt("alice")
+        self._attempt("alice")  # refused by the username bucket
+
+        self.assertTrue(self._attempt("bob")[0])
+
+
+@override_settings(REST_FRAMEWORK=RATES)
+class LoginThrottleEndpointTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        MyUser.objects.create_user(username="carol", password="password123")
+
+    def test_retry_after_header(self):
+        """A throttled login reports how long until the next token"""
+        data = {"username": "carol", "password": "wrong"}
+        self.client.post(reverse("login"), data, content_type="application/json")
+        self.client.post(reverse("login"), data, content_type="application/json")
+
+        response = self.client.post(reverse("login"), data, content_type="application/json")
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn(int(response["Retry-After"]), (29, 30))
+
+    def test_non_object_body(self):
+        """A list or scalar JSON body is throttled by IP and rejected, not a 500"""
+        for body in ("[1]", "1", '"carol"'):
+            response = self.client.post(reverse("login"), body, content_type="application/json")
+            self.assertLess(response.status_code, 500)
@@ -0,0 +1,120 @@
+# backend/base/tests/test_timeline.py
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from base.models import MyUser, Post, TimelineEntry
+from base.timeline import trim_timelines
+
+
+class HomeTimelineTest(TestCase):
+    def setUp(self):
+        """Set up a reader who follows one author and ignores another"""
+        cache.clear()  # Login throttle counters live in the cache
+        self.client = Client()
+
+        self.reader = MyUser.objects.create_user(username="reader", password="password123")
+        self.friend = MyUser.objects.create(username="friend")
+        self.stranger = MyUser.objects.create(username="stranger")
+        self.friend.followers.add(self.reader)
+
+        self.timeline_url = "/api/timeline/"
+        self.client.post(
+            reverse("login"),
+            {"username": "reader", "password": "password123"},
+            content_type="application/json"
+        )
+
+    def _timeline_descriptions(self):
+        response = self.client.get(self.timeline_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [post["description"] for post in response.data["results"]]
+
+    def test_new_posts_fan_out_to_followers(self):
+        """Creating a post writes it to the author's and each follower's timeline"""
+        post = Post.objects.create(user=self.friend, description="Hello followers")
+
+        owners = set(TimelineEntry.objects.filter(post=post).values_list("owner_id", flat=True))
+        self.assertEqual(owners, {"friend", "reader"})
+
+    def test_timeline_shows_own_and_followed_posts_only(self):
+        """The home timeline holds the reader's posts and followed accounts' posts"""
+        Post.objects.create(user=self.friend, description="From a friend")
+        Post.objects.create(user=self.stranger, description="From a stranger")
+        Post.objects.create(user=self.reader, description="My own")
+
+        self.assertEqual(self._timeline_descriptions(), ["My own", "From a friend"])
+
+    @override_settings(TIMELINE_FANOUT_LIMIT=1)
+    def test_large_accounts_are_merged_on_read(self):
+        """Accounts over the fan-out limit skip the write and are pulled on read"""
+        self.stranger.followers.add(self.reader, self.friend)
+
+        post = Post.objects.create(user=self.stranger, description="Big announcement")
+
+        self.stranger.refresh_from_db()
+        self.assertTrue(self.stranger.fan_out_on_read)
+        self.assertFalse(TimelineEntry.objects.filter(post=post, owner=self.reader).exists())
+        self.assertIn("Big announcement", self._timeline_descriptions())
+
+    def test_follow_backfills_and_unfollow_prunes(self):
+        """Following seeds recent posts, unfollowing removes them again"""
+        Post.objects.create(user=self.stranger, description="Before the follow")
+
+        self.client.post("/api/toggle_follow/", {"username": "stranger"}, content_type="application/json")
+        self.assertIn("Before the follow", self._timeline_descriptions())
+
+        self.client.post("/api/toggle_follow/", {"username": "stranger"}, content_type="application/json")
+        self.assertNotIn("Before the follow", self._timeline_descriptions())
+
+    def test_entries_carry_the_post_date(self):
+        """Fan-out copies created_at so pages never join the posts table"""
+        post = Post.objects.create(user=self.friend, description="Dated")
+
+        dates = set(TimelineEntry.objects.filter(post=post).values_list("created_at", flat=True))
+        self.assertEqual(dates, {post.created_at})
+
+    @override_settings(TIMELINE_FANOUT_LIMIT=1)
+    def test_pages_merge_pushed_and_pulled_posts(self):
+        """Cursor pages interleave fan-out-on-read posts without gaps or repeats"""
+        self.stranger.followers.add(self.reader, self.friend)
+        for i in range(12):
+            author = self.stranger if i % 3 == 0 else self.friend
+            Post.objects.create(user=author, description=f"Post {i}")
+
+        self.stranger.refresh_from_db()
+        self.assertTrue(self.stranger.fan_out_on_read)
+
+        seen, url = [], self.timeline_url
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen += [post["description"] for post in response.data["results"]]
+            url = response.data["next"]
+
+        self.assertEqual(seen, [f"Post {i}" for i in reversed(range(12))])
+
+    def test_page_reads_are_bounded(self):
+        """A page costs a fixed number of queries however long the timeline"""
+        for i in range(30):
+            Post.objects.create(user=self.friend, description=f"Post {i}")
+        self.client.get(self.timeline_url)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.timeline_url)
+
+        self.assertEqual(len(response.data["results"]), 10)
+        timeline_reads = [q for q in ctx.captured_queries if '"base_timelineentry"' in q["sql"]]
+        self.assertEqual(len(timeline_reads), 1)
+        self.assertIn("LIMIT 11", timeline_reads[0]["sql"])
+
+    @override_settings(TIMELINE_MAX_ENTRIES=3)
+    def test_trim_keeps_newest_entries(self):
+        """Trimming keeps each timeline's newest TIMELINE_MAX_ENTRIES entries"""
+        posts = [Post.objects.create(user=self.friend, description=f"Post {i}") for i in range(5)]
+
+        self.assertEqual(trim_timelines(), 4)  # two from each of friend and reader
+        kept = TimelineEntry.objects.filter(owner=self.reader).values_list("post_id", flat=True)
+        self.assertEqual(set(kept), {post.id for post in posts[2:]})
@@ -0,0 +1,82 @@
+# backend/base/tests/test_toggles.py
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from base.models import MyUser, Post
+
+
+class ToggleEndpointTest(TestCase):
+    def setUp(self):
+        """Set up a logged-in fan, a popular user and one of their posts"""
+        cache.clear()  # Login throttle counters live in the cache
+        self.client = Client()
+
+        self.fan = MyUser.objects.create_user(username="fan", password="password123")
+        self.star = MyUser.objects.create(username="star")
+        self.post = Post.objects.create(user=self.star, description="Popular post")
+
+        self.client.post(
+            reverse("login"),
+            {"username": "fan", "password": "password123"},
+            content_type="application/json"
+        )
+        # Warm the authenticated-user cache so query counts compare like for like
+        self.client.get("/api/get_posts/")
+
+    def _toggle(self, url, data):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(url, data, content_type="application/json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data, len(ctx.captured_queries)
+
+    def test_toggle_like_keeps_counter_in_step(self):
+        """Liking then unliking writes the through row and the stored counter"""
+        data, _ = self._toggle("/api/toggleLike/", {"id": self.post.id})
+        self.assertTrue(data["now_liked"])
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.like_count, 1)
+        self.assertTrue(self.post.likes.filter(pk=self.fan.pk).exists())
+
+        data, _ = self._toggle("/api/toggleLike/", {"id": self.post.id})
+        self.assertFalse(data["now_liked"])
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.like_count, 0)
+
+    def test_unlike_with_drifted_counter(self):
+        """A like row the counter missed can still be removed; the counter stays at 0"""
+        Post.likes.through.objects.create(post=self.post, myuser=self.fan)  # no signals
+
+        data, _ = self._toggle("/api/toggleLike/", {"id": self.post.id})
+
+        self.assertFalse(data["now_liked"])
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.like_count, 0)
+
+    def test_toggle_like_missing_post(self):
+        """Toggling a like on a missing post reports an error"""
+        data, _ = self._toggle("/api/toggleLike/", {"id": 999999})
+        self.assertEqual(data["error"], "post does not exist")
+
+    def test_toggle_follow(self):
+        """Following then unfollowing flips the relation"""
+        data, _ = self._toggle("/api/toggle_follow/", {"username": "star"})
+        self.assertTrue(data["following"])
+        self.assertIn(self.fan, self.star.followers.all())
+
+        data, _ = self._toggle("/api/toggle_follow/", {"username": "star"})
+        self.assertFalse(data["following"])
+        self.assertNotIn(self.fan, self.star.followers.all())
+
+    def test_toggle_follow_cost_independent_of_follower_count(self):
+        """A star with many followers costs the same to follow as anyone else"""
+        _, quiet = self._toggle("/api/toggle_follow/", {"username": "star"})
+        self._toggle("/api/toggle_follow/", {"username": "star"})
+
+        crowd = [MyUser.objects.create(username=f"crowd{i}") for i in range(50)]
+        self.star.followers.add(*crowd)
+
+        _, busy = self._toggle("/api/toggle_follow/", {"username": "star"})
+        self.assertEqual(quiet, busy)
@@ -0,0 +1,89 @@
+# backend/base/tests/test_token_cache.py
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, Client, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+from base.models import MyUser
+from base.token_cache import clear_token_cache, get_verified_token, token_cache_stats
+
+
+class VerifiedTokenCacheTest(TestCase):
+    def setUp(self):
+        """Start with an empty token cache and one user"""
+        clear_token_cache()
+        self.user = MyUser.objects.create_user(username="erin", password="password123")
+
+    def _verify(self, raw, validate=AccessToken):
+        return get_verified_token(raw, validate)
+
+    def test_repeat_token_skips_verification(self):
+        """The second presentation of a token is a hit and is not re-decoded"""
+        raw = str(AccessToken.for_user(self.user))
+        self._verify(raw)
+
+        decode = mock.Mock(side_effect=AccessToken)
+        token = self._verify(raw, decode)
+
+        decode.assert_not_called()
+        self.assertEqual(token["user_id"], "erin")
+        self.assertEqual(token_cache_stats(), {"hits": 1, "misses": 1, "size": 1})
+
+    def test_entries_expire_with_the_token(self):
+        """A cached token is not served past its exp claim"""
+        raw = str(AccessToken.for_user(self.user))
+        token = self._verify(raw)
+
+        decode = mock.Mock(return_value=token)
+        with mock.patch("base.token_cache.time.time", return_value=token["exp"] + 1):
+            self._verify(raw, decode)
+        decode.assert_called_once()
+
+    @override_settings(AUTH_TOKEN_CACHE_SIZE=2)
+    def test_least_recently_used_token_evicted(self):
+        """The cache holds at most AUTH_TOKEN_CACHE_SIZE tokens"""
+        first, second, third = (
+            str(AccessToken.for_user(MyUser.objects.create(username=f"user{i}")))
+            for i in range(3)
+        )
+        self._verify(first)
+        self._verify(second)
+        self._verify(first)  # first is now the most recently used
+        self._verify(third)
+
+        self.assertEqual(token_cache_stats()["size"], 2)
+        self._verify(first)
+        self.assertEqual(token_cache_stats()["hits"], 2)
+        self._verify(second)
+        self.assertEqual(token_cache_stats()["misses"], 4)
+
+    def test_invalid_tokens_not_cached(self):
+        """A rejected token is rejected again on the next request"""
+        with self.assertRaises(Exception):
+            self._verify("not-a-token")
+        self.assertEqual(token_cache_stats()["size"], 0)
+
+
+class CookieAuthenticationTokenCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()  # Login throttle counters live in the cache
+        clear_token_cache()
+        MyUser.objects.create_user(username="frank", password="password123")
+        self.client = Client()
+        self.client.post(
+            reverse("login"),
+            {"username": "frank", "password": "password123"},
+            content_type="application/json"
+        )
+
+    def test_requests_reuse_verified_token(self):
+        """Only the first request of a session verifies the access token"""
+        for _ in range(3):
+            response = self.client.get("/api/get_posts/")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        stats = token_cache_stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 2)
@@ -0,0 +1,118 @@
+# backend/base/tests/test_user_cache.py
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from base.models import MyUser
+from base.user_cache import _local, _user_key, _version_key, clear_local_cache, get_cached_user
+
+
+class UserCacheTest(TestCase):
+    def setUp(self):
+        """Start every test with both cache tiers empty"""
+        cache.clear()
+        clear_local_cache()
+        self.user = MyUser.objects.create_user(
+            username="cached", password="password123", bio="Original bio"
+        )
+
+    def test_repeat_lookups_skip_the_database(self):
+        """Only the first lookup reads base_myuser"""
+        get_cached_user("cached")
+
+        with CaptureQueriesContext(connection) as ctx:
+            user = get_cached_user("cached")
+            get_cached_user("cached")
+
+        self.assertEqual(user.bio, "Original bio")
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_shared_tier_serves_other_processes(self):
+        """With the local tier empty, the shared cache still avoids a query"""
+        get_cached_user("cached")
+        clear_local_cache()
+
+        with CaptureQueriesContext(connection) as ctx:
+            user = get_cached_user("cached")
+
+        self.assertEqual(user.username, "cached")
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_save_invalidates(self):
+        """Saving the user makes the next lookup see the change"""
+        get_cached_user("cached")
+
+        self.user.bio = "New bio"
+        self.user.save()
+        clear_local_cache()  # as seen from another process
+
+        self.assertEqual(get_cached_user("cached").bio, "New bio")
+
+    def test_delete_invalidates(self):
+        """A deleted user is no longer served from cache"""
+        get_cached_user("cached")
+        self.user.delete()
+
+        self.assertIsNone(get_cached_user("cached"))
+
+    def test_callers_get_private_copies(self):
+        """Mutating a returned user does not leak into the cache"""
+        get_cached_user("cached").bio = "Scribbled"
+        self.assertEqual(get_cached_user("cached").bio, "Original bio")
+
+    def test_password_hash_is_not_cached(self):
+        """The shared tier holds no password, yet the user can still check one"""
+        get_cached_user("cached")
+        version = cache.get(_version_key("cached"), 0)
+        self.assertNotIn("password", cache.get(_user_key("cached", version)))
+
+        clear_local_cache()
+        user = get_cached_user("cached")
+        self.assertTrue(user.check_password("password123"))
+
+    def test_saving_a_cached_user_keeps_its_password(self):
+        """Fields that were not cached are not blanked by save()"""
+        user = get_cached_user("cached")
+        user.bio = "Edited"
+        user.save()
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.bio, "Edited")
+        self.assertTrue(self.user.check_password("password123"))
+
+    @override_settings(AUTH_USER_LOCAL_SIZE=2)
+    def test_local_tier_is_bounded(self):
+        """The in-process tier keeps only the most recently used users"""
+        for name in ("second", "third"):
+            MyUser.objects.create(username=name)
+        for name in ("cached", "second", "cached", "third"):
+            get_cached_user(name)
+
+        self.assertEqual(list(_local), ["cached", "third"])
+
+
+class CachedAuthenticationTest(TestCase):
+    def setUp(self):
+        """Log in once so requests carry an access token cookie"""
+        cache.clear()
+        clear_local_cache()
+        self.client = Client()
+        MyUser.objects.create_user(username="reader", password="password123")
+        self.client.post(
+            reverse("login"),
+            {"username": "reader", "password": "password123"},
+            content_type="application/json"
+        )
+
+    def test_authenticated_requests_do_not_reload_the_user(self):
+        """A warm request resolves request.user without touching base_myuser"""
+        self.client.get("/api/get_posts/")
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/get_posts/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for query in ctx.captured_queries:
+            self.assertNotIn('FROM "base_myuser" WHERE', query["sql"])
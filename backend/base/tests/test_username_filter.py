@@ -0,0 +1,116 @@
+# backend/base/tests/test_username_filter.py
+import time
+from unittest import mock
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, Client
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from base.models import MyUser
+from base.username_filter import BloomFilter, username_filter
+
+
+class BloomFilterTest(SimpleTestCase):
+    def test_no_false_negatives(self):
+        """Every added item is reported as present"""
+        bloom = BloomFilter(1000)
+        names = [f"user{i}" for i in range(1000)]
+        for name in names:
+            bloom.add(name)
+
+        self.assertTrue(all(name in bloom for name in names))
+
+    def test_false_positive_rate_near_target(self):
+        """At capacity, unknown items are mostly reported absent"""
+        bloom = BloomFilter(1000)
+        for i in range(1000):
+            bloom.add(f"user{i}")
+
+        false_positives = sum(f"other{i}" in bloom for i in range(10000))
+        self.assertLess(false_positives, 300)  # target 1%, allow 3%
+
+
+class CheckUsernameTest(TestCase):
+    def setUp(self):
+        """Start each test with the filter unbuilt"""
+        username_filter.reset()
+        MyUser.objects.create(username="taken")
+        self.client = Client()
+        self.client.get("/api/check-username/", {"username": "warmup"})  # build the filter
+
+    def tearDown(self):
+        username_filter.reset()
+
+    def _check(self, username):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/check-username/", {"username": username})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["available"], len(ctx.captured_queries)
+
+    def test_free_name_answered_without_query(self):
+        """A name the filter has never seen skips the database"""
+        available, queries = self._check("brand_new_name")
+
+        self.assertTrue(available)
+        self.assertEqual(queries, 0)
+
+    def test_taken_name_confirmed_by_database(self):
+        """A possible match is checked against the table"""
+        available, queries = self._check("taken")
+
+        self.assertFalse(available)
+        self.assertEqual(queries, 1)
+
+    def test_new_user_added_by_signal(self):
+        """Registering a user makes the name taken without a rebuild"""
+        MyUser.objects.create(username="fresh")
+
+        available, _ = self._check("fresh")
+        self.assertFalse(available)
+
+    def test_deleted_user_is_free_again(self):
+        """A deleted name falls through to the database, which frees it"""
+        MyUser.objects.get(username="taken").delete()
+
+        available, queries = self._check("taken")
+        self.assertTrue(available)
+        self.assertEqual(queries, 1)
+        self.assertEqual(username_filter.stats()["false_positives"], 1)
+
+    def test_stale_filter_is_rebuilt_in_the_background(self):
+        """An expired filter keeps answering while one rebuild is handed off"""
+        MyUser.objects.bulk_create([MyUser(username="bulk")])  # bypasses signals
+        username_filter._expires = time.monotonic() - 1
+        rebuilds = []
+
+        with mock.patch("base.username_filter.run_in_background",
+                        lambda target, name: rebuilds.append(target)):
+            self.assertEqual(self._check("free_name"), (True, 0))
+            self.assertEqual(self._check("bulk"), (True, 0))  # not in the old filter yet
+
+        self.assertEqual(len(rebuilds), 1)
+        rebuilds[0]()
+        self.assertEqual(self._check("bulk"), (False, 1))
+
+    def test_stats_count_filtered_lookups(self):
+        """Metrics show how many checks the filter answered alone"""
+        self._check("free1")
+        self._check("taken")
+
+        stats = username_filter.stats()
+        self.assertEqual(stats["filtered"], 2)  # warmup and free1
+        self.assertEqual(stats["checked"], 1)
+        self.assertAlmostEqual(stats["filter_rate"], 2 / 3)
+
+    def test_metrics_endpoint_is_admin_only(self):
+        """Cache metrics are reported to staff and hidden from everyone else"""
+        client = APIClient()
+        self.assertIn(client.get("/api/metrics/caches/").status_code,
+                      (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN))
+
+        client.force_authenticate(MyUser.objects.create(username="admin", is_staff=True))
+        response = client.get("/api/metrics/caches/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["username_filter"]["filtered"], 1)
+        self.assertIn("hits", response.data["token_cache"])
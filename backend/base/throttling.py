@@ -1,46 +1,164 @@
-from rest_framework.throttling import SimpleRateThrottle
-from django.core.cache import cache
+"""
+Rate limiting with the generic cell rate algorithm (GCRA), a token bucket
+that stores a single integer per key.
+
+A rate of N requests per period lets one request through every
+period / N seconds, with bursts of up to N. Each key holds the bucket's
+"theoretical arrival time" (TAT) in milliseconds: the moment it would be
+empty again if nothing else arrived. A request moves the TAT forward by one
+interval with an atomic cache.incr(), and is refused if that pushes it more
+than one period ahead. Every request does O(1) cache work. Increments from
+concurrent workers add up, so none are lost the way a read-modify-write of
+a timestamp list loses them.
+
+A key expires when its TAT passes, so an idle bucket starts again full.
+"""
+import math
 import time
+from collections.abc import Mapping
+
+from django.core.cache import cache as default_cache
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Base class: subclasses set scope and return the bucket keys for a
+    request from get_cache_keys(); no keys means the request is not limited.
+    A request must fit in every bucket, and only consumes from them if so.
+    """
+    cache = default_cache
+    timer = time.time
+    cache_format = 'throttle_%(scope)s_%(ident)s'
+    scope = None
+
+    def get_cache_keys(self, request, view):
+        raise NotImplementedError('.get_cache_keys() must be overridden')
+
+    def get_rate(self, scope=None):
+        # Read per call (not at import) so override_settings takes effect.
+        rates = api_settings.DEFAULT_THROTTLE_RATES
+        return rates.get(scope or self.scope)
+
+    @staticmethod
+    def parse_rate(rate):
+        """'4/minute' -> (4, 60)"""
+        num, period = rate.split('/')
+        return int(num), PERIODS[period[0]]
+
+    def allow_request(self, request, view):
+        self._wait = None
+        acquired = []
+
+        for key, rate in self.get_cache_keys(request, view):
+            num_requests, duration = self.parse_rate(rate)
+            interval = duration * 1000 // num_requests
+            wait = self._acquire(key, interval, duration * 1000)
+            if wait is not None:
+                for held_key, held_interval in acquired:
+                    self._release(held_key, held_interval)
+                self._wait = wait
+                return False
+            acquired.append((key, interval))
+
+        return True
+
+    def wait(self):
+        return self._wait
+
+    def _now(self):
+        return int(self.timer() * 1000)
+
+    def _acquire(self, key, interval, period):
+        """Take one token from the bucket, or return seconds until one is free."""
+        now = self._now()
+
+        # A full bucket is refused on a read alone, so floods cost no writes.
+        tat = self.cache.get(key)
+        if tat is not None and tat + interval - now > period:
+            return (tat + interval - now - period) / 1000
 
-class LoginThrottle(SimpleRateThrottle):
+        try:
+            tat = self.cache.incr(key, interval)
+        except ValueError:
+            if self.cache.add(key, now + interval, math.ceil(interval / 1000)):
+                return None
+            tat = self.cache.incr(key, interval)
+
+        if tat - interval < now:
+            # Only reachable through clock skew between workers: the key
+            # should have expired. Move the TAT up to now rather than grant
+            # the stale credit.
+            tat = self.cache.incr(key, now - (tat - interval))
+
+        if tat - now > period:
+            self._release(key, interval)
+            return (tat - now - period) / 1000
+
+        self.cache.touch(key, math.ceil((tat - now) / 1000))
+        return None
+
+    def _release(self, key, interval):
+        try:
+            self.cache.decr(key, interval)
+        except ValueError:
+            pass  # the bucket expired in between; nothing to give back
+
+
+class LoginThrottle(TokenBucketThrottle):
+    """
+    Login attempts are limited per username (rate 'login'), so one account
+    cannot be brute forced, and per client IP (rate 'login_ip', defaulting
+    to 'login'), so one client cannot spray many accounts.
+    """
     scope = 'login'
 
-    def get_cache_key(self, request, view):
-        
+    def get_cache_keys(self, request, view):
         view_name = view.__class__.__name__.lower()
-        if (request.method == 'POST' and 
-            ('login' in view_name or 'token' in view_name or 'auth' in view_name)):
-            return self.cache_format % {
-                'scope': self.scope,
-                'ident': 'global'  
-            }
-        return None
+        if not (request.method == 'POST' and
+                ('login' in view_name or 'token' in view_name or 'auth' in view_name)):
+            return []
+
+        rate = self.get_rate()
+        keys = [(
+            self.cache_format % {'scope': 'login_ip', 'ident': self.get_ident(request)},
+            self.get_rate('login_ip') or rate,
+        )]
+        # A JSON body may be a list or a scalar rather than an object.
+        data = request.data if isinstance(request.data, Mapping) else {}
+        username = data.get('username')
+        if isinstance(username, str) and username:
+            keys.append((
+                self.cache_format % {'scope': self.scope, 'ident': username.lower()},
+                rate,
+            ))
+        return keys
+
 
-class TokenRefreshRateThrottle(SimpleRateThrottle):
+class TokenRefreshRateThrottle(TokenBucketThrottle):
     """
     Rate limiting for token refresh operations
     """
     scope = 'token_refresh'
-    
-    def get_cache_key(self, request, view):
+
+    def get_cache_keys(self, request, view):
         # Only apply to token refresh endpoint
         if request.path.endswith('/api/token/refresh/') and request.method == 'POST':
             # Use client IP for per-client tracking
             ident = self.get_ident(request)
-            return self.cache_format % {
-                'scope': self.scope,
-                'ident': ident
-            }
-        return None
-    
-class OrganizationJoinThrottle(SimpleRateThrottle):
+            return [(self.cache_format % {'scope': self.scope, 'ident': ident}, self.get_rate())]
+        return []
+
+
+class OrganizationJoinThrottle(TokenBucketThrottle):
     scope = 'organization_join'
-    
-    def get_cache_key(self, request, view):
+
+    def get_cache_keys(self, request, view):
         if request.path.startswith('/api/organization/join/') and request.method == 'POST':
             # Use username instead of IP for more granular control
-            return self.cache_format % {
-                'scope': self.scope,
-                'ident': request.user.username
-            }
-        return None
+            ident = request.user.username
+            return [(self.cache_format % {'scope': self.scope, 'ident': ident}, self.get_rate())]
+        return []
@@ -0,0 +1,146 @@
+"""
+Home timelines, built with fan-out-on-write.
+
+When a post is created it is copied into a TimelineEntry row for the author
+and each of their followers, with the post's created_at. A timeline page is
+then one range scan of the (owner, -created_at, -post) index, whatever the
+size of the posts table.
+
+Copying to millions of followers would make posting slow for big accounts.
+Once an author has more than TIMELINE_FANOUT_LIMIT followers they are flagged
+fan_out_on_read. Their posts are then only written to their own timeline,
+and each page of a reader's timeline merges in one bounded range scan per
+such account the reader follows.
+
+Timelines keep their newest TIMELINE_MAX_ENTRIES entries; trim_timelines()
+deletes the rest. Run `python manage.py trim_timelines` periodically.
+"""
+from django.conf import settings
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
+
+from .models import MyUser, Post, TimelineEntry
+from .user_cache import invalidate_user
+
+FANOUT_BATCH_SIZE = 1000
+FOLLOW_BACKFILL_SIZE = 20
+
+
+def get_fanout_limit():
+    return getattr(settings, 'TIMELINE_FANOUT_LIMIT', 10000)
+
+
+def get_max_entries():
+    return getattr(settings, 'TIMELINE_MAX_ENTRIES', 800)
+
+
+def fan_out_post(post):
+    """Push a new post onto its author's timeline and their followers'."""
+    author = post.user
+    entries = [TimelineEntry(owner_id=author.pk, post_id=post.pk, created_at=post.created_at)]
+
+    if not author.fan_out_on_read:
+        limit = get_fanout_limit()
+        followers = MyUser.followers.through.objects.filter(from_myuser_id=author.pk)
+
+        # Bounded count: we only need to know whether the limit is exceeded.
+        if followers[:limit + 1].count() > limit:
+            MyUser.objects.filter(pk=author.pk).update(fan_out_on_read=True)
+            invalidate_user(author.pk)
+            author.fan_out_on_read = True
+        else:
+            entries.extend(
+                TimelineEntry(owner_id=follower_id, post_id=post.pk, created_at=post.created_at)
+                for follower_id in followers.values_list('to_myuser_id', flat=True)
+            )
+
+    TimelineEntry.objects.bulk_create(
+        entries, batch_size=FANOUT_BATCH_SIZE, ignore_conflicts=True
+    )
+
+
+def backfill_follow(follower, followee):
+    """Seed a new follower's timeline with the followee's latest posts."""
+    if followee.fan_out_on_read:
+        return
+
+    recent = followee.posts.order_by('-created_at', '-id')[:FOLLOW_BACKFILL_SIZE]
+    TimelineEntry.objects.bulk_create(
+        [TimelineEntry(owner_id=follower.pk, post_id=post_id, created_at=created_at)
+         for post_id, created_at in recent.values_list('id', 'created_at')],
+        ignore_conflicts=True,
+    )
+    trim_timelines([follower.pk])
+
+
+def prune_unfollow(follower, followee):
+    """Drop the unfollowed account's posts from the follower's timeline."""
+    TimelineEntry.objects.filter(owner=follower, post__user=followee).delete()
+
+
+def trim_timelines(owner_ids=None):
+    """
+    Delete entries beyond the newest TIMELINE_MAX_ENTRIES of each timeline,
+    or of the given owners' timelines only. Returns the number deleted.
+    """
+    entries = TimelineEntry.objects.all()
+    if owner_ids is not None:
+        entries = entries.filter(owner_id__in=owner_ids)
+    excess = entries.annotate(position=Window(
+        RowNumber(),
+        partition_by=F('owner_id'),
+        order_by=[F('created_at').desc(), F('post_id').desc()],
+    )).filter(position__gt=get_max_entries()).values_list('pk', flat=True)
+
+    deleted = 0
+    pks = list(excess)
+    for start in range(0, len(pks), FANOUT_BATCH_SIZE):
+        deleted += TimelineEntry.objects.filter(pk__in=pks[start:start + FANOUT_BATCH_SIZE]).delete()[0]
+    return deleted
+
+
+def _seek(queryset, id_field, cursor, reverse):
+    """Rows strictly past the cursor's (created_at, id) key."""
+    if cursor is None:
+        return queryset
+    op = 'gt' if reverse else 'lt'
+    return queryset.filter(
+        Q(**{f'created_at__{op}': cursor['value']}) |
+        Q(**{'created_at': cursor['value'], f'{id_field}__{op}': cursor['id']})
+    )
+
+
+class HomeTimeline:
+    """
+    Posts on the user's home timeline, for TimelinePagination. Each page reads
+    the user's entries and, for each followed fan_out_on_read account, that
+    account's posts, each with a range scan bounded by the page size, then
+    merges them on (created_at, id).
+    """
+    model = Post
+
+    def __init__(self, user):
+        self.user = user
+
+    def rows(self, cursor, reverse, limit):
+        """Up to limit posts past cursor, newest first unless reverse."""
+        order = '' if reverse else '-'
+
+        entries = _seek(TimelineEntry.objects.filter(owner=self.user), 'post_id', cursor, reverse)
+        keys = set(
+            entries.order_by(f'{order}created_at', f'{order}post')
+            .values_list('created_at', 'post_id')[:limit]
+        )
+
+        pulled = MyUser.objects.filter(followers=self.user, fan_out_on_read=True)
+        for author_id in pulled.values_list('pk', flat=True):
+            posts = _seek(Post.objects.filter(user_id=author_id), 'id', cursor, reverse)
+            keys.update(
+                posts.order_by(f'{order}created_at', f'{order}id')
+                .values_list('created_at', 'id')[:limit]
+            )
+
+        keys = sorted(keys, reverse=not reverse)[:limit]
+        posts = Post.objects.for_feed(self.user).in_bulk([pk for _, pk in keys])
+        # A post deleted since its key was read is skipped.
+        return [posts[pk] for _, pk in keys if pk in posts]
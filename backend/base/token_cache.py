@@ -0,0 +1,71 @@
+"""
+Per-process cache of verified access tokens.
+
+Checking a JWT means decoding it, verifying its signature, parsing the claims
+and checking expiry and token type, and that happens on every authenticated
+request. A session sends the same access token over and over, so verified
+tokens are kept in a bounded LRU, keyed by the SHA-256 of the raw token.
+An entry is dropped when the token's exp passes, so a cached token is never
+accepted for longer than verifying it again would accept it.
+
+Only successful verifications are cached; forged or expired tokens are
+checked (and rejected) every time. token_cache_stats() reports hits and
+misses.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+_entries = OrderedDict()
+_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0}
+
+
+def _max_size():
+    return getattr(settings, 'AUTH_TOKEN_CACHE_SIZE', 10000)
+
+
+def get_verified_token(raw_token, validate):
+    """
+    Return the verified token for raw_token, calling validate(raw_token) on
+    a cache miss. Callers must treat the returned token as read-only: it is
+    shared by every request that presents the same raw token.
+    """
+    if isinstance(raw_token, str):
+        raw_token = raw_token.encode()
+    key = hashlib.sha256(raw_token).digest()
+    now = time.time()
+
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None and entry[0] > now:
+            _entries.move_to_end(key)
+            _stats['hits'] += 1
+            return entry[1]
+        _stats['misses'] += 1
+
+    token = validate(raw_token)
+    expires = token.get('exp')
+    if expires is None:
+        return token
+
+    with _lock:
+        _entries[key] = (expires, token)
+        _entries.move_to_end(key)
+        while len(_entries) > _max_size():
+            _entries.popitem(last=False)
+    return token
+
+
+def token_cache_stats():
+    with _lock:
+        return {**_stats, 'size': len(_entries)}
+
+
+def clear_token_cache():
+    with _lock:
+        _entries.clear()
+        _stats.update(hits=0, misses=0)
@@ -11,10 +11,14 @@ urlpatterns = [
     path('authenticated/', views.authenticated),
     path('toggle_follow/', views.toggleFollow),
     path('posts/<str:pk>/', views.get_users_posts),
+    path('posts/<int:post_id>/likes/', views.get_post_likes),
     path('toggleLike/', views.toggleLike),
     path('create_post/', views.create_post),
     path('get_posts/', views.get_posts),
+    path('timeline/', views.get_home_timeline),
     path('search/', views.search_users),
+    path('search/all/', views.search_all, name='search-all'),
+    path('autocomplete/', views.autocomplete_suggestions),
     path('update_user/', views.update_user_details),
     path('logout/', views.logout),
     path("organization/user/", views.get_user_organizations),
@@ -27,6 +31,9 @@ urlpatterns = [
     path("organization/posts/<int:org_id>/", views.get_organization_posts),
     path("organization/<int:org_id>/", views.get_organization),
     path("organization/<int:org_id>/update/", views.update_organization),
+    path("organization/<int:org_id>/members/", views.get_organization_members, name="org-members"),
+    path("organization/<int:org_id>/pending/", views.get_organization_pending, name="org-pending"),
+    path("organization/<int:org_id>/requests/", views.respond_to_join_requests, name="org-requests"),
     path("create_org_post/", views.create_org_post),
     path('login/', views.CustomTokenObtainPairView.as_view(), name='login'),
     path('search_organizations/', views.search_organizations),
@@ -38,6 +45,7 @@ urlpatterns = [
     path('my-jobs/', views.my_jobs, name='my-jobs'),
     path('jobs/<int:job_id>/applications/', views.job_applications, name='job-applications'),
     path('check-username/', views.check_username, name='check-username'),
+    path('metrics/caches/', views.cache_metrics, name='cache-metrics'),
 ] + static(
     settings.MEDIA_URL, document_root=settings.MEDIA_ROOT
 )
\ No newline at end of file
@@ -0,0 +1,101 @@
+"""
+Cached MyUser lookups for request authentication.
+
+Every authenticated request used to load its user from base_myuser. Users are
+now cached in two tiers:
+
+* an in-process LRU of at most AUTH_USER_LOCAL_SIZE users, each trusted for
+  AUTH_USER_LOCAL_TTL seconds, and
+* the shared Django cache, under a key that includes a per-user version.
+
+Only CACHED_FIELDS are stored, never the password hash; the user handed to
+callers is rebuilt from them and loads any other field on first access.
+
+Saving or deleting a MyUser bumps the version and drops the local entry, so
+the next lookup anywhere misses the shared tier. Other processes may keep
+serving their local copy for up to AUTH_USER_LOCAL_TTL seconds.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .cache_versions import bump_version
+from .models import MyUser
+
+# What authentication, permission classes and views read off request.user.
+CACHED_FIELDS = (
+    'username', 'first_name', 'last_name', 'bio', 'profile_image',
+    'is_active', 'is_staff', 'is_superuser', 'fan_out_on_read',
+)
+
+_local = OrderedDict()
+_local_lock = threading.Lock()
+
+
+def _local_size():
+    return getattr(settings, 'AUTH_USER_LOCAL_SIZE', 10000)
+
+
+def _ttls():
+    return (
+        getattr(settings, 'AUTH_USER_LOCAL_TTL', 5),
+        getattr(settings, 'AUTH_USER_CACHE_TTL', 60),
+    )
+
+
+def _version_key(username):
+    return f'auth_user_version:{username}'
+
+
+def _user_key(username, version):
+    return f'auth_user:{username}:{version}'
+
+
+def _build(fields):
+    # from_db marks the fields that were not cached as deferred, so save()
+    # never overwrites them with blanks. It expects the values in model order.
+    names = [f.attname for f in MyUser._meta.concrete_fields if f.attname in fields]
+    return MyUser.from_db(MyUser.objects.db, names, [fields[name] for name in names])
+
+
+def get_cached_user(username):
+    """Return a fresh MyUser for the user, or None if no such user exists."""
+    local_ttl, shared_ttl = _ttls()
+    now = time.monotonic()
+
+    with _local_lock:
+        entry = _local.get(username)
+        if entry is not None and entry[0] > now:
+            _local.move_to_end(username)
+            return _build(entry[1])
+
+    version = cache.get(_version_key(username), 0)
+    fields = cache.get(_user_key(username, version))
+    if fields is None:
+        fields = MyUser.objects.filter(username=username).values(*CACHED_FIELDS).first()
+        if fields is None:
+            return None
+        cache.set(_user_key(username, version), fields, shared_ttl)
+
+    with _local_lock:
+        _local[username] = (now + local_ttl, fields)
+        _local.move_to_end(username)
+        while len(_local) > _local_size():
+            _local.popitem(last=False)
+    return _build(fields)
+
+
+def invalidate_user(username):
+    """Forget every cached copy of the user after it changes."""
+    with _local_lock:
+        _local.pop(username, None)
+
+    bump_version(_version_key(username))
+
+
+def clear_local_cache():
+    with _local_lock:
+        _local.clear()
@@ -0,0 +1,131 @@
+"""
+Bloom filter of taken usernames, in front of check_username.
+
+check_username is open to anonymous clients and is called on every keystroke
+of the registration form. Most names typed there are free. The filter
+answers "definitely free" from memory, and only names it may contain go to
+the database.
+
+A Bloom filter never forgets a name, so deleted users just become false
+positives that the database query clears. The filter is built on first use
+and rebuilt after USERNAME_FILTER_REFRESH_INTERVAL seconds or when it fills
+to capacity. Rebuilds run on a background thread, and lookups keep using the
+old filter until the new one is swapped in, so no anonymous request waits on
+a scan of base_myuser after the first.
+
+Only the process that registers a user sees that name through signals.
+Another worker can report a name as free until its next rebuild. The answer
+is advisory either way; register still enforces uniqueness.
+"""
+import hashlib
+import math
+import threading
+import time
+
+from django.conf import settings
+
+from .background import run_in_background
+from .models import MyUser
+
+ERROR_RATE = 0.01
+MIN_CAPACITY = 1024
+
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate=ERROR_RATE):
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        # Double hashing: k positions from one 128-bit digest.
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, item):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7))
+                   for position in self._positions(item))
+
+
+class UsernameFilter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._filter = None
+        self._expires = None
+        self._stats = {'filtered': 0, 'checked': 0, 'false_positives': 0}
+
+    def _refresh_interval(self):
+        return getattr(settings, 'USERNAME_FILTER_REFRESH_INTERVAL', 300)
+
+    def build(self):
+        usernames = MyUser.objects.values_list('username', flat=True)
+        bloom = BloomFilter(max(MIN_CAPACITY, 2 * usernames.count()))
+        for username in usernames.iterator():
+            bloom.add(username)
+        with self._lock:
+            self._filter = bloom
+            self._expires = time.monotonic() + self._refresh_interval()
+
+    def _stale(self):
+        bloom = self._filter
+        return bloom.count >= bloom.capacity or time.monotonic() > self._expires
+
+    def _current(self):
+        if self._filter is None:
+            # Nothing to answer from yet: one thread builds, the others wait.
+            with self._build_lock:
+                if self._filter is None:
+                    self.build()
+        elif self._stale() and self._build_lock.acquire(blocking=False):
+            run_in_background(self._rebuild, 'username-filter-rebuild')
+        return self._filter
+
+    def _rebuild(self):
+        try:
+            self.build()
+        finally:
+            self._build_lock.release()
+
+    def might_exist(self, username):
+        """False means no such user; True means ask the database."""
+        present = username in self._current()
+        with self._lock:
+            self._stats['checked' if present else 'filtered'] += 1
+        return present
+
+    def record_false_positive(self):
+        with self._lock:
+            self._stats['false_positives'] += 1
+
+    def add(self, username):
+        with self._lock:
+            # Re-saving an existing user must not use up capacity.
+            if self._filter is not None and username not in self._filter:
+                self._filter.add(username)
+
+    def stats(self):
+        with self._lock:
+            total = self._stats['filtered'] + self._stats['checked']
+            return {
+                **self._stats,
+                'filter_rate': self._stats['filtered'] / total if total else 0.0,
+            }
+
+    def reset(self):
+        with self._lock:
+            self._filter = None
+            self._expires = None
+            self._stats = {'filtered': 0, 'checked': 0, 'false_positives': 0}
+
+
+username_filter = UsernameFilter()
@@ -1,38 +1,57 @@
+import json
 import logging
 import os
 
-from django.http import HttpResponse
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, F, OuterRef
+from django.http import HttpResponse, StreamingHttpResponse
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 from django.views.decorators.csrf import ensure_csrf_cookie
 from rest_framework import generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes, throttle_classes
+from rest_framework.exceptions import AuthenticationFailed, ValidationError
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.throttling import UserRateThrottle
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
+from .autocomplete import DEFAULT_LIMIT, autocomplete
+from .membership import invalidate_organization, memberships
 from .models import Event, EventAttendance, Job, JobApplication, MyUser, Organization, Post, orgPost
+from .pagination import KeysetPagination, OffsetPagination, TimelinePagination
+from .response_cache import cache_response, invalidate_tags
+from .search import SEARCH_KINDS, SearchResults, UnifiedSearchResults
 from .serializers import (
     EventAttendanceSerializer,
     EventSerializer,
     JobApplicationSerializer,
     JobSerializer,
     MyUserProfileSerializer,
+    OrganizationSearchSerializer,
+    OrganizationMembershipSerializer,
     OrganizationSerializer,
+    OrganizationSummarySerializer,
     OrgPostSerializer,
+    PostLikeSerializer,
     PostSerializer,
     UserRegisterSerializer,
+    UserSearchSerializer,
     UserSerializer,
 )
+from .signals import FOLLOWED, FOLLOWER, adjust_like_counts
 from .throttling import OrganizationJoinThrottle, TokenRefreshRateThrottle
+from .timeline import HomeTimeline, backfill_follow, prune_unfollow
+from .token_cache import token_cache_stats
+from .username_filter import username_filter
 
 logger = logging.getLogger(__name__)
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
-@cache_page(60 * 2)  # Cache authenticated response for 2 minutes
+@cache_response(lambda: [], timeout=60 * 2)  # Cache authenticated response for 2 minutes
 def authenticated(request):
     return Response({"status": "authenticated", "username": request.user.username})
 
@@ -48,43 +67,38 @@ def register(request):
 
 class CustomTokenObtainPairView(TokenObtainPairView):
     def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
         try:
-            response = super().post(request, *args, **kwargs)
-            tokens = response.data
-
-            access_token = tokens["access"]
-            refresh_token = tokens["refresh"]
-            username = request.data["username"]
-
-            try:
-                user = MyUser.objects.get(username=username)
-            except MyUser.DoesNotExist:
-                return Response({"error": "user does not exist"})
+            serializer.is_valid(raise_exception=True)
+        except (AuthenticationFailed, ValidationError, TokenError):
+            return Response({"success": False})
 
-            res = Response()
-            res.data = {"success":True, "user":{"username":user.username, "bio":user.bio, "email":user.email, "first_name":user.first_name, "last_name":user.last_name}}
+        # The serializer already authenticated the user; no second lookup.
+        user = serializer.user
+        tokens = serializer.validated_data
 
-            res.set_cookie(
-                key="access_token",
-                value=access_token,
-                httponly=True,
-                secure=True,
-                samesite="None",
-                path="/",
-            )
+        res = Response()
+        res.data = {"success":True, "user":{"username":user.username, "bio":user.bio, "email":user.email, "first_name":user.first_name, "last_name":user.last_name}}
+
+        res.set_cookie(
+            key="access_token",
+            value=tokens["access"],
+            httponly=True,
+            secure=True,
+            samesite="None",
+            path="/",
+        )
 
-            res.set_cookie(
-                key="refresh_token",
-                value=refresh_token,
-                httponly=True,
-                secure=True,
-                samesite="None",
-                path="/",
-            )
+        res.set_cookie(
+            key="refresh_token",
+            value=tokens["refresh"],
+            httponly=True,
+            secure=True,
+            samesite="None",
+            path="/",
+        )
 
-            return res
-        except:
-            return Response({"success": False})
+        return res
 
 
 class CustomTokenRefreshView(TokenRefreshView):
@@ -132,47 +146,115 @@ class CustomTokenRefreshView(TokenRefreshView):
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
+@cache_response(lambda pk: [f"user:{pk}"])
 def get_user_profile_data(request, pk):
     try:
-        try:
-            user = MyUser.objects.get(username=pk)
-        except MyUser.DoesNotExist:
+        # One query: counts are stored columns and the viewer's follow state
+        # is an EXISTS probe of the followers table.
+        user = MyUser.objects.only(
+            'username', 'bio', 'profile_image', 'follower_count', 'following_count'
+        ).annotate(
+            is_following=Exists(MyUser.followers.through.objects.filter(
+                from_myuser_id=OuterRef('pk'), to_myuser_id=request.user.pk)),
+        ).filter(username=pk).first()
+        if user is None:
             return Response({"error": "user does not exit"})
 
         serializer = MyUserProfileSerializer(user, many=False)
 
-        following = False
-
-        if request.user in user.followers.all():
-            following = True
-
         return Response(
             {
                 **serializer.data,
                 "is_owner": request.user.username == user.username,
-                "following": following,
+                "following": user.is_following,
             }
         )
     except:
         return Response({"error": "error getting user data"})
 
+def paginate_search(request, queryset, serializer_class):
+    """Run ?query= through the search backend and return one ranked page."""
+    paginator = OffsetPagination()
+    results = SearchResults(queryset, request.query_params.get('query', ''))
+    page = paginator.paginate_queryset(results, request)
+    serializer = serializer_class(page, many=True)
+    return paginator.get_paginated_response(serializer.data)
+
+def paginate_or_stream(request, queryset, serializer_class):
+    """
+    Page a post queryset by cursor, or with ?stream=ndjson send every post as
+    newline-delimited JSON. Streaming walks the queryset with a server-side
+    iterator, so export-style consumers never hold the whole history in memory.
+    """
+    if request.query_params.get('stream') == 'ndjson':
+        rows = queryset.order_by('-created_at', '-id').iterator(chunk_size=500)
+        lines = (
+            json.dumps(serializer_class(obj).data, cls=JSONEncoder) + '\n'
+            for obj in rows
+        )
+        return StreamingHttpResponse(lines, content_type='application/x-ndjson')
+
+    paginator = KeysetPagination()
+    result_page = paginator.paginate_queryset(queryset, request)
+
+    serializer = serializer_class(result_page, many=True)
+
+    return paginator.get_paginated_response(serializer.data)
+
+
+def _toggle_through_row(through, **lookup):
+    """
+    Delete the M2M through row matching lookup, or insert it if there is none.
+
+    Both branches hit the table's unique (from, to) index once, so the cost is
+    independent of how many rows the relation holds. Returns (present,
+    changed): whether the row exists afterwards, and whether this call
+    changed anything. A concurrent request inserting the same row first
+    leaves present=True, changed=False. Call inside transaction.atomic().
+    """
+    removed, _ = through.objects.filter(**lookup).delete()
+    if removed:
+        return False, True
+
+    try:
+        with transaction.atomic():
+            through.objects.create(**lookup)
+    except IntegrityError:
+        return True, False
+    return True, True
+
+
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def toggleFollow(request):
     try:
-        try:
-            my_user = MyUser.objects.get(username=request.user.username)
-            user_to_follow = MyUser.objects.get(username=request.data['username'])
-        except MyUser.DoesNotExist:
+        user_to_follow = MyUser.objects.only('username', 'fan_out_on_read').filter(
+            username=request.data['username']
+        ).first()
+        if user_to_follow is None:
             return Response({"error": "user does not exit"})
-        
-        if my_user in user_to_follow.followers.all():
-            user_to_follow.followers.remove(my_user)
-            return Response({'following':False})
-        else:
-            user_to_follow.followers.add(my_user)
-            return Response({'following':True})
-        
+
+        with transaction.atomic():
+            following, changed = _toggle_through_row(
+                MyUser.followers.through,
+                from_myuser_id=user_to_follow.pk,
+                to_myuser_id=request.user.pk,
+            )
+            if changed and following:
+                backfill_follow(request.user, user_to_follow)
+            elif changed:
+                prune_unfollow(request.user, user_to_follow)
+            # Direct through-table writes skip m2m_changed, so keep the
+            # stored counters in step here.
+            if changed:
+                delta = 1 if following else -1
+                FOLLOWED.adjust([user_to_follow.pk], delta)
+                FOLLOWER.adjust([request.user.pk], delta)
+        if changed:
+            # Through-table writes skip m2m_changed, so drop cached profiles here
+            invalidate_tags(f"user:{user_to_follow.username}", f"user:{request.user.username}")
+        return Response({'following':following})
+
     except:
         return Response({'error':'error following user'})
     
@@ -182,66 +264,67 @@ def toggleFollow(request):
 def get_users_posts(request, pk):
     try:
         user = MyUser.objects.get(username=pk)
-        my_user = MyUser.objects.get(username=request.user.username)
     except MyUser.DoesNotExist:
         return Response({"error": "user does not exist"})
 
-    posts = user.posts.all().order_by('-created_at')
+    posts = user.posts.for_feed(request.user)
 
-    serializer = PostSerializer(posts, many=True)
-
-    data = []
-    for post in serializer.data:
-        new_post = {}
-
-        if my_user.username in post['likes']:
-            new_post = {**post, 'liked':True}
-        else:
-            new_post = {**post, 'liked':False}
-        data.append(new_post)
-
-    return Response(data)
+    return paginate_or_stream(request, posts, PostSerializer)
 
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def toggleLike(request):
     try:
-        try:
-            post = Post.objects.get(id=request.data['id'])
-        except Post.DoesNotExist:
+        post_id = request.data['id']
+        if not Post.objects.filter(id=post_id).exists():
             return Response({"error": "post does not exist"})
-        
-        try:
-            user = MyUser.objects.get(username=request.user.username)
-        except MyUser.DoesNotExist:
-            return Response({"error": "user does not exist"})
-        
-        if user in post.likes.all():
-            post.likes.remove(user)
-            return Response({'now_liked':False})
-        else:
-            post.likes.add(user)
-            return Response({'now_liked':True})
+
+        with transaction.atomic():
+            now_liked, changed = _toggle_through_row(
+                Post.likes.through,
+                post_id=post_id,
+                myuser_id=request.user.pk,
+            )
+            # Direct through-table writes skip m2m_changed, so keep the
+            # stored counter in step here.
+            if changed:
+                adjust_like_counts(Post, [post_id], 1 if now_liked else -1)
+        return Response({'now_liked':now_liked})
     except:
         return Response({'error':'failed to like post'})
     
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_post_likes(request, post_id):
+    """Paginated list of the users who liked a post, most recent first."""
+    if not Post.objects.filter(id=post_id).exists():
+        return Response({"error": "post does not exist"}, status=status.HTTP_404_NOT_FOUND)
+
+    likes = Post.likes.through.objects.filter(post_id=post_id)
+
+    paginator = KeysetPagination()
+    paginator.page_size = 50
+    paginator.ordering_field = 'id'
+    result_page = paginator.paginate_queryset(likes, request)
+
+    serializer = PostLikeSerializer(result_page, many=True)
+    return paginator.get_paginated_response(serializer.data)
+
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def create_post(request):
     try:
         data = request.data
-
-        try:
-            user = MyUser.objects.get(username=request.user.username)
-        except MyUser.DoesNotExist:
-            return Response({"error": "user does not exit"})
+        user = request.user
 
         post = Post.objects.create(
             user=user,
             description=data['description']
         )
+        post = Post.objects.for_feed(user).get(pk=post.pk)
 
         serializer = PostSerializer(post, many=False)
 
@@ -253,44 +336,70 @@ def create_post(request):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def get_posts(request):
-    try:
-        my_user = MyUser.objects.get(username=request.user.username)
-    except MyUser.DoesNotExist:
-        return Response({"error": "user does not exist"})
-
-    posts = Post.objects.all().order_by('-created_at')
+    posts = Post.objects.for_feed(request.user)
 
-    paginator = PageNumberPagination()
-    paginator.page_size = 10
+    # Keyset pagination on (created_at, id): no COUNT and no OFFSET per page
+    paginator = KeysetPagination()
     result_page = paginator.paginate_queryset(posts, request)
 
     serializer = PostSerializer(result_page, many=True)
 
-    data = []
-    for post in serializer.data:
-        new_post = {}
+    return paginator.get_paginated_response(serializer.data)
 
-        if my_user.username in post['likes']:
-            new_post = {**post, 'liked':True}
-        else:
-            new_post = {**post, 'liked':False}
-        data.append(new_post)
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_home_timeline(request):
+    """Posts by the user and the accounts they follow, newest first."""
+    paginator = TimelinePagination()
+    result_page = paginator.paginate_queryset(HomeTimeline(request.user), request)
+
+    serializer = PostSerializer(result_page, many=True)
 
-    return paginator.get_paginated_response(data)
+    return paginator.get_paginated_response(serializer.data)
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def search_users(request):
-    query = request.query_params.get('query', '')
-    users = MyUser.objects.filter(username__icontains=query)
-    serializer = UserSerializer(users, many=True)
-    return Response(serializer.data)
+    users = MyUser.objects.only('username', 'first_name', 'last_name', 'profile_image')
+    return paginate_search(request, users, UserSearchSerializer)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def search_all(request):
+    """
+    Ranked, typed hits for ?query= across every searched kind, one page at a
+    time. ?types=post,job narrows the kinds searched.
+    """
+    types = request.query_params.get('types')
+    kinds = [kind for kind in types.split(',') if kind] if types else list(SEARCH_KINDS)
+    unknown = [kind for kind in kinds if kind not in SEARCH_KINDS]
+    if unknown:
+        return Response({"error": f"Unknown types: {', '.join(unknown)}"}, status=status.HTTP_400_BAD_REQUEST)
+
+    paginator = OffsetPagination()
+    results = UnifiedSearchResults(request.query_params.get('query', ''), kinds, request.user.pk)
+    return paginator.get_paginated_response(paginator.paginate_queryset(results, request))
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def autocomplete_suggestions(request):
+    """Typeahead matches for ?q=, served from the in-memory prefix index."""
+    try:
+        limit = int(request.query_params.get('limit', DEFAULT_LIMIT))
+    except ValueError:
+        limit = DEFAULT_LIMIT
+    users, organizations = autocomplete.suggest(request.query_params.get('q', ''), limit)
+    return Response({
+        'users': [{'username': username} for username, _ in users],
+        'organizations': [{'id': pk, 'name': name} for pk, name in organizations],
+    })
 
 @api_view(['PATCH'])
 @permission_classes([IsAuthenticated])
 def update_user_details(request):
     data = request.data
 
+    # request.user may be a cached copy; write against a fresh row
     try:
         user = MyUser.objects.get(username=request.user.username)
     except MyUser.DoesNotExist:
@@ -339,7 +448,7 @@ def create_organization(request):
     org.members.add(user)  # The creator is automatically a member
     org.save()
 
-    serializer = OrganizationSerializer(org)
+    serializer = OrganizationSerializer(org, context={"request": request})
     return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
@@ -351,7 +460,7 @@ def update_organization(request, org_id):
         org = Organization.objects.get(id=org_id)
         
         # Ensure the current user is the owner
-        if request.user != org.owner:
+        if not memberships(request).is_owner(org.id):
             return Response(
                 {"error": "Only the organization owner can update details"}, 
                 status=status.HTTP_403_FORBIDDEN
@@ -421,11 +530,11 @@ def request_to_join_organization(request, org_id):
         
         logger.info(f"Join request: User {user.username} requesting to join org {org.name} (ID: {org_id})")
 
-        if user in org.members.all():
+        if memberships(request).is_member(org.id):
             logger.info(f"User {user.username} is already a member of {org.name}")
             return Response({"error": "Already a member"}, status=status.HTTP_400_BAD_REQUEST)
 
-        if user in org.pending_requests.all():
+        if memberships(request).is_pending(org.id):
             logger.info(f"User {user.username} already has a pending request to join {org.name}")
             return Response({"error": "Already requested"}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -448,13 +557,13 @@ def accept_join_request(request, org_id, user_id):
     try:
         org = Organization.objects.get(id=org_id)
 
-        if request.user != org.owner:
+        if not memberships(request).is_owner(org.id):
             return Response({"error": "Only owner can accept requests"}, status=status.HTTP_403_FORBIDDEN)
 
         # Use get_object_or_404 for cleaner error handling
         user = MyUser.objects.get(username=user_id)  # Changed from id to username
 
-        if user not in org.pending_requests.all():
+        if not memberships(request).is_pending(org.id, user.username):
             return Response({"error": "No pending request from this user"}, status=status.HTTP_400_BAD_REQUEST)
 
         org.pending_requests.remove(user)
@@ -467,6 +576,70 @@ def accept_join_request(request, org_id, user_id):
         return Response({"error": "User not found"}, status=status.HTTP_404_NOT_FOUND)
 
 
+MAX_BULK_JOIN_REQUESTS = 500
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def respond_to_join_requests(request, org_id):
+    """
+    Accept or reject many join requests at once (owner only).
+
+    Body: {"action": "accept" | "reject", "usernames": [...]}. Runs as one
+    transaction: a single delete of the matching pending rows and, when
+    accepting, one bulk insert into the members table and one counter
+    update. Each username is reported as accepted, rejected or not_pending.
+    """
+    action = request.data.get("action")
+    usernames = request.data.get("usernames")
+    if action not in ("accept", "reject"):
+        return Response({"error": "action must be accept or reject"}, status=status.HTTP_400_BAD_REQUEST)
+    if not isinstance(usernames, list) or not all(isinstance(name, str) for name in usernames):
+        return Response({"error": "usernames must be a list of usernames"}, status=status.HTTP_400_BAD_REQUEST)
+    if len(usernames) > MAX_BULK_JOIN_REQUESTS:
+        return Response(
+            {"error": f"At most {MAX_BULK_JOIN_REQUESTS} usernames per call"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    if not Organization.objects.filter(id=org_id).exists():
+        return Response({"error": "Organization not found"}, status=status.HTTP_404_NOT_FOUND)
+    if not memberships(request).is_owner(org_id):
+        return Response({"error": "Only owner can respond to requests"}, status=status.HTTP_403_FORBIDDEN)
+
+    pending_through = Organization.pending_requests.through
+    members_through = Organization.members.through
+    with transaction.atomic():
+        pending = set(
+            pending_through.objects.select_for_update()
+            .filter(organization_id=org_id, myuser_id__in=usernames)
+            .values_list('myuser_id', flat=True)
+        )
+        pending_through.objects.filter(organization_id=org_id, myuser_id__in=pending).delete()
+        if action == "accept":
+            joining = pending - set(
+                members_through.objects.filter(organization_id=org_id, myuser_id__in=pending)
+                .values_list('myuser_id', flat=True)
+            )
+            members_through.objects.bulk_create(
+                [members_through(organization_id=org_id, myuser_id=name) for name in joining],
+                ignore_conflicts=True,
+            )
+            # bulk_create skips m2m_changed, so keep the stored counter in step here.
+            Organization.objects.filter(id=org_id).update(member_count=F('member_count') + len(joining))
+
+    if pending:
+        # Through-table writes skip m2m_changed, so drop cached state here
+        invalidate_organization(org_id)
+        invalidate_tags(f"organization:{org_id}")
+        memberships(request).forget(org_id)
+
+    outcome = "accepted" if action == "accept" else "rejected"
+    return Response(
+        {"results": {name: outcome if name in pending else "not_pending" for name in usernames}},
+        status=status.HTTP_200_OK
+    )
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def get_organization_posts(request, org_id):
@@ -475,13 +648,12 @@ def get_organization_posts(request, org_id):
         org = Organization.objects.get(id=org_id)
         user = request.user
 
-        if user not in org.members.all():
+        if not memberships(request).is_member(org.id):
             return Response({"error": "You are not a member of this organization"}, status=status.HTTP_403_FORBIDDEN)
 
-        posts = orgPost.objects.filter(organization=org).order_by('-created_at')
-        serializer = OrgPostSerializer(posts, many=True)
+        posts = orgPost.objects.filter(organization=org).for_feed(user)
 
-        return Response(serializer.data)
+        return paginate_or_stream(request, posts, OrgPostSerializer)
 
     except Organization.DoesNotExist:
         return Response({"error": "Organization not found"}, status=status.HTTP_404_NOT_FOUND)
@@ -492,36 +664,68 @@ def get_organization_posts(request, org_id):
 def get_user_organizations(request):
     """Retrieve all organizations the logged-in user is a part of."""
     user = request.user
-    organizations = Organization.objects.filter(members=user)
-    serializer = OrganizationSerializer(organizations, many=True)
+    organizations = Organization.objects.filter(members=user).with_summary(user)
+    serializer = OrganizationSummarySerializer(organizations, many=True, context={"request": request})
     return Response(serializer.data, status=status.HTTP_200_OK)
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def get_organization_feed(request):
-    """Retrieve all posts from organizations the user is a part of."""
+    """Retrieve posts from organizations the user is a part of, newest first."""
     user = request.user
-    # 1) Find the organizations the user is in
-    organizations = Organization.objects.filter(members=user)
+    # Join straight through the membership table; (organization, member) is
+    # unique, so each post appears at most once.
+    org_posts = orgPost.objects.filter(organization__members=user).for_feed(user)
 
-    # 2) Query orgPost with organization__in= these orgs
-    org_posts = orgPost.objects.filter(organization__in=organizations).order_by('-created_at')
+    paginator = KeysetPagination()
+    result_page = paginator.paginate_queryset(org_posts, request)
 
-    # 3) Serialize them with OrgPostSerializer
-    serializer = OrgPostSerializer(org_posts, many=True)
+    serializer = OrgPostSerializer(result_page, many=True)
 
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    return paginator.get_paginated_response(serializer.data)
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
+@cache_response(lambda org_id: [f"organization:{org_id}"])
 def get_organization(request, org_id):
     try:
-        org = Organization.objects.get(id=org_id)
+        org = Organization.objects.with_summary(request.user).get(id=org_id)
         serializer = OrganizationSerializer(org, context={"request": request})
         return Response(serializer.data, status=status.HTTP_200_OK)
     except Organization.DoesNotExist:
         return Response({"error": "Organization not found"}, status=status.HTTP_404_NOT_FOUND)
 
+def paginate_membership(request, rows):
+    """One cursor page of an organization's member or pending list, newest first."""
+    paginator = KeysetPagination()
+    paginator.page_size = 50
+    paginator.ordering_field = 'id'
+    result_page = paginator.paginate_queryset(rows.only('id', 'myuser_id'), request)
+
+    serializer = OrganizationMembershipSerializer(result_page, many=True)
+    return paginator.get_paginated_response(serializer.data)
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def get_organization_members(request, org_id):
+    """Paginated member list of an organization."""
+    if not Organization.objects.filter(id=org_id).exists():
+        return Response({"error": "Organization not found"}, status=status.HTTP_404_NOT_FOUND)
+    return paginate_membership(request, Organization.members.through.objects.filter(organization_id=org_id))
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def get_organization_pending(request, org_id):
+    """Paginated pending join requests of an organization (owner only)."""
+    owner = Organization.objects.filter(id=org_id).values_list('owner_id', flat=True).first()
+    if owner is None:
+        return Response({"error": "Organization not found"}, status=status.HTTP_404_NOT_FOUND)
+    if owner != request.user.pk:
+        return Response({"error": "Only owner can view requests"}, status=status.HTTP_403_FORBIDDEN)
+    return paginate_membership(
+        request, Organization.pending_requests.through.objects.filter(organization_id=org_id)
+    )
+
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def create_org_post(request):
@@ -540,7 +744,7 @@ def create_org_post(request):
             return Response({"error": "Organization not found"}, status=status.HTTP_404_NOT_FOUND)
 
         # Ensure user is a member of the organization
-        if user not in organization.members.all():
+        if not memberships(request).is_member(organization.id):
             return Response({"error": "You are not a member of this organization"}, status=status.HTTP_403_FORBIDDEN)
 
         # Create the organization post
@@ -559,28 +763,27 @@ def create_org_post(request):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def search_organizations(request):
-    query = request.query_params.get('query', '')
-    organizations = Organization.objects.filter(name__icontains=query)
-    serializer = OrganizationSerializer(organizations, many=True)
-    return Response(serializer.data)
+    organizations = Organization.objects.only('id', 'name', 'profile_image', 'owner') \
+        .with_membership(request.user)
+    return paginate_search(request, organizations, OrganizationSearchSerializer)
 
 class IsOrgOwner(permissions.BasePermission):
     """Allow only the organization owner to POST."""
     def has_permission(self, request, view):
         if request.method != "POST":
             return True
-        org_id = request.data.get("organization_id")
         try:
-            org = Organization.objects.get(id=org_id)
-        except Organization.DoesNotExist:
+            org_id = int(request.data.get("organization_id"))
+        except (TypeError, ValueError):
             return False
-        return org.owner == request.user
+        return memberships(request).is_owner(org_id)
     
 
 # Add these view functions to your existing views.py file
 
 @api_view(['GET', 'POST'])
 @permission_classes([IsAuthenticated])
+@cache_response(lambda: ["jobs"])
 def jobs(request):
     """
     GET - Retrieve all job postings
@@ -608,6 +811,7 @@ def jobs(request):
 
 @api_view(['GET', 'DELETE'])
 @permission_classes([IsAuthenticated])
+@cache_response(lambda job_id: [f"job:{job_id}"])
 def job_detail(request, job_id):
     """
     GET - Retrieve a specific job
@@ -726,7 +930,7 @@ class RSVPUpdateView(generics.UpdateAPIView):
 
     def update(self, request, *args, **kwargs):
         event = Event.objects.get(id=kwargs["event_id"])
-        if request.user not in event.organization.members.all():
+        if not memberships(request).is_member(event.organization_id):
             return Response(
                 {"error": "Not a member of this organization"},
                 status=status.HTTP_403_FORBIDDEN,
@@ -745,6 +949,21 @@ class RSVPUpdateView(generics.UpdateAPIView):
 @permission_classes([permissions.AllowAny])  
 def check_username(request):
     username = request.GET.get('username', '')
+    # Most names typed during registration are free; the filter says so
+    # without a query.
+    if not username_filter.might_exist(username):
+        return Response({'available': True})
+
     exists = MyUser.objects.filter(username=username).exists()
-    
-    return Response({'available': not exists})
\ No newline at end of file
+    if not exists:
+        username_filter.record_false_positive()
+    return Response({'available': not exists})
+
+@api_view(["GET"])
+@permission_classes([permissions.IsAdminUser])
+def cache_metrics(request):
+    """Hit/miss counters of this worker's in-process caches."""
+    return Response({
+        'token_cache': token_cache_stats(),
+        'username_filter': username_filter.stats(),
+    })
\ No newline at end of file
@@ -101,8 +101,9 @@ export const toggleFollow = async (username) => {
     return response.data
 }
 
-export const get_users_posts = async (username) => {
-    const response = await api.get(`/posts/${username}/`);
+// `next` is the opaque cursor URL returned by the previous page, if any
+export const get_users_posts = async (username, next) => {
+    const response = await api.get(next || `/posts/${username}/`);
     return response.data
 }
 
@@ -116,8 +117,9 @@ export const create_post = async (description) => {
     return response.data;
 };
 
-export const get_posts = async (num) => {
-    const response = await api.get(`/get_posts/?page=${num}`)
+// `next` is the opaque cursor URL returned by the previous page, if any
+export const get_posts = async (next) => {
+    const response = await api.get(next || '/get_posts/')
     return response.data
 }
 
@@ -126,6 +128,18 @@ export const search_users = async (search) => {
     return response.data
 }
 
+// Typed, ranked hits across posts, jobs, events, organizations and users;
+// `highlight` is escaped HTML with the matched words in <mark>
+export const search_all = async (search, page = 1) => {
+    const response = await api.get('/search/all/', { params: { query: search, page }, timeout: 3000 })
+    return response.data
+}
+
+export const autocomplete = async (prefix) => {
+    const response = await api.get('/autocomplete/', { params: { q: prefix }, timeout: 3000 })
+    return response.data
+}
+
 export const logout = async () => {
     const response = await api.post('/logout/')
     return response.data
@@ -174,6 +188,24 @@ export const getOrganization = async (org_id) => {
     return response.data;
 };
 
+// `next` is the opaque cursor URL returned by the previous page, if any
+export const getOrganizationMembers = async (org_id, next) => {
+    const response = await api.get(next || `/organization/${org_id}/members/`);
+    return response.data;
+};
+
+// Owner only; `next` is the opaque cursor URL returned by the previous page, if any
+export const getOrganizationPending = async (org_id, next) => {
+    const response = await api.get(next || `/organization/${org_id}/pending/`);
+    return response.data;
+};
+
+// action is "accept" or "reject"; returns { results: { username: outcome } }
+export const respondToJoinRequests = async (org_id, action, usernames) => {
+    const response = await api.post(`/organization/${org_id}/requests/`, { action, usernames });
+    return response.data;
+};
+
 export const joinOrganization = async (org_id) => {
     try {
         const response = await api.post(`/organization/join/${org_id}/`);
@@ -185,8 +217,9 @@ export const joinOrganization = async (org_id) => {
     }
 };
 
-export const getOrganizationPosts = async (org_id) => {
-    const response = await api.get(`/organization/posts/${org_id}/`);
+// `next` is the opaque cursor URL returned by the previous page, if any
+export const getOrganizationPosts = async (org_id, next) => {
+    const response = await api.get(next || `/organization/posts/${org_id}/`);
     return response.data;
 };
 
@@ -195,8 +228,9 @@ export const getUserOrganizations = async () => {
     return response.data;
 };
 
-export const getOrganizationFeed = async () => {
-    const response = await api.get("/organization/feed/");
+// `next` is the opaque cursor URL returned by the previous page, if any
+export const getOrganizationFeed = async (next) => {
+    const response = await api.get(next || "/organization/feed/");
     return response.data;
 };
 
@@ -10,7 +10,7 @@ import {
   Divider,
   Avatar,
 } from "@chakra-ui/react";
-import { getOrganization } from "../api/endpoints";
+import { getOrganizationPending, respondToJoinRequests } from "../api/endpoints";
 
 const PendingRequests = ({ orgId, onUpdateMembers }) => {
   const [pendingUsers, setPendingUsers] = useState([]);
@@ -64,34 +64,52 @@ const PendingRequests = ({ orgId, onUpdateMembers }) => {
     }
   };
 
-  // Function to decline a join request
-  const handleDeclineRequest = async (username) => {
-    // This would need a new API endpoint
-    toast({
-      title: "Not implemented",
-      description: "Decline functionality needs a new API endpoint",
-      status: "info",
-      duration: 3000,
-      isClosable: true,
-    });
-    // For now, we'll just remove from the UI
-    setPendingUsers(pendingUsers.filter(user => user.username !== username));
+  // Accept or decline several requests in one call
+  const respondToRequests = async (action, usernames) => {
+    try {
+      const { results } = await respondToJoinRequests(orgId, action, usernames);
+      const handled = usernames.filter(username => results[username] !== "not_pending");
+      toast({
+        title: action === "accept" ? "Requests accepted" : "Requests declined",
+        description: `${handled.length} request(s) processed`,
+        status: "success",
+        duration: 3000,
+        isClosable: true,
+      });
+      setPendingUsers(pendingUsers.filter(user => !usernames.includes(user.username)));
+      if (action === "accept" && onUpdateMembers) onUpdateMembers();
+    } catch (error) {
+      console.error("Error responding to requests:", error);
+      toast({
+        title: "Error",
+        description: error.response?.data?.error || "Failed to process requests",
+        status: "error",
+        duration: 3000,
+        isClosable: true,
+      });
+    }
   };
 
+  // Function to decline a join request
+  const handleDeclineRequest = (username) => respondToRequests("reject", [username]);
+
+  // The endpoint takes at most 500 usernames per call
+  const handleAcceptAll = () => respondToRequests("accept", pendingUsers.slice(0, 500).map(user => user.username));
+
   // Fetch pending requests
   useEffect(() => {
     const fetchPendingRequests = async () => {
       try {
         setLoading(true);
-        const data = await getOrganization(orgId);
-        
-        if (data.pending_requests) {
-          // Transform usernames to objects for easier handling
-          const pendingUserObjects = data.pending_requests.map(username => ({
-            username,
-          }));
-          setPendingUsers(pendingUserObjects);
-        }
+        // Follow the cursor until every page of requests is loaded
+        let pending = [];
+        let next = null;
+        do {
+          const data = await getOrganizationPending(orgId, next);
+          pending = pending.concat(data.results);
+          next = data.next;
+        } while (next);
+        setPendingUsers(pending);
       } catch (error) {
         console.error("Error fetching pending requests:", error);
         toast({
@@ -115,9 +133,16 @@ const PendingRequests = ({ orgId, onUpdateMembers }) => {
 
   return (
     <Box width="100%" p={4} borderWidth="1px" borderRadius="lg">
-      <Heading size="md" mb={4}>
-        Pending Join Requests
-      </Heading>
+      <HStack justify="space-between" mb={4}>
+        <Heading size="md">
+          Pending Join Requests
+        </Heading>
+        {pendingUsers.length > 1 && (
+          <Button size="sm" colorScheme="green" variant="outline" onClick={handleAcceptAll}>
+            Accept all
+          </Button>
+        )}
+      </HStack>
       
       <Divider mb={4} />
       
@@ -1,13 +1,31 @@
-import { Flex, HStack, Text, Input, InputGroup, InputRightElement } from "@chakra-ui/react";
-import { useState } from "react";
+import { Box, Flex, HStack, Text, Input, InputGroup, InputRightElement, VStack } from "@chakra-ui/react";
+import { useEffect, useState } from "react";
 import { useNavigate } from "react-router-dom";
+import { autocomplete } from "../api/endpoints";
 
 import { IoPersonOutline, IoHomeOutline, IoSearchCircle, IoSettingsSharp, IoBriefcaseOutline } from "react-icons/io5";
 
 const Navbar = () => {
     const [searchValue, setSearchValue] = useState('');
+    const [suggestions, setSuggestions] = useState({ users: [], organizations: [] });
     const nav = useNavigate();
 
+    // Typeahead: wait for a pause in typing before asking for suggestions
+    useEffect(() => {
+        if (searchValue.trim() === '') {
+            setSuggestions({ users: [], organizations: [] });
+            return;
+        }
+        const timer = setTimeout(async () => {
+            try {
+                setSuggestions(await autocomplete(searchValue));
+            } catch (err) {
+                setSuggestions({ users: [], organizations: [] });
+            }
+        }, 150);
+        return () => clearTimeout(timer);
+    }, [searchValue]);
+
     const handleNavigate = (route) => {
         setSearchValue('');
         nav(`/${route}`);
@@ -39,6 +57,24 @@ const Navbar = () => {
                                 if (searchValue === '') { handleNavigate('') }
                             }} />
                         </InputRightElement>
+                        {(suggestions.users.length > 0 || suggestions.organizations.length > 0) && (
+                            <Box position='absolute' top='100%' left='0' w='100%' zIndex='10' bg='white' color='black' borderRadius='8px' boxShadow='md'>
+                                <VStack alignItems='left' gap='0'>
+                                    {suggestions.users.map((user) => (
+                                        <Text key={`user-${user.username}`} p='8px' cursor='pointer' _hover={{ bg: 'gray.100' }}
+                                            onClick={() => handleNavigate(user.username)}>
+                                            @{user.username}
+                                        </Text>
+                                    ))}
+                                    {suggestions.organizations.map((org) => (
+                                        <Text key={`org-${org.id}`} p='8px' cursor='pointer' _hover={{ bg: 'gray.100' }}
+                                            onClick={() => handleNavigate(`organization/${org.id}`)}>
+                                            {org.name}
+                                        </Text>
+                                    ))}
+                                </VStack>
+                            </Box>
+                        )}
                     </InputGroup>
 
                     {/* Existing links */}
@@ -16,29 +16,34 @@ const OrgPost = ({ orgId, canPost = false }) => {
     const [posts, setPosts] = useState([]);
     const [loading, setLoading] = useState(true);
     const [error, setError] = useState(null);
+    const [nextPage, setNextPage] = useState(null);
 
     // Create post state
     const [showInput, setShowInput] = useState(false);
     const [description, setDescription] = useState("");
 
+    // Fetch one page of organization posts; `next` is the cursor of the page
+    // after those already shown, or null for the first page
+    const fetchOrgPosts = async (next) => {
+        try {
+            const data = await getOrganizationPosts(orgId, next);
+            // If user isn't a member, data might be { error: "..."}
+            if (Array.isArray(data.results)) {
+                setPosts(prevPosts => next ? [...prevPosts, ...data.results] : data.results);
+                setNextPage(data.next);
+            } else if (data.error) {
+                setError(data.error);
+            }
+        } catch (err) {
+            setError("Error loading org posts");
+        } finally {
+            setLoading(false);
+        }
+    };
+
     // Fetch organization posts on mount
     useEffect(() => {
-        const fetchOrgPosts = async () => {
-            try {
-                const data = await getOrganizationPosts(orgId);
-                // If user isn't a member, data might be { error: "..."}
-                if (Array.isArray(data)) {
-                    setPosts(data);
-                } else if (data.error) {
-                    setError(data.error);
-                }
-            } catch (err) {
-                setError("Error loading org posts");
-            } finally {
-                setLoading(false);
-            }
-        };
-        fetchOrgPosts();
+        fetchOrgPosts(null);
     }, [orgId]);
 
     // Handle creating a new post
@@ -62,11 +67,12 @@ const OrgPost = ({ orgId, canPost = false }) => {
             setDescription("");
             setShowInput(false);
 
-            // ✅ Re-fetch organization posts after submission
-            setLoading(true);
+            // ✅ Re-fetch the newest posts after submission, keeping the
+            // older pages already loaded below them
             const updatedPosts = await getOrganizationPosts(orgId);
-            setPosts(updatedPosts);
-            setLoading(false);
+            const fresh = Array.isArray(updatedPosts.results) ? updatedPosts.results : [];
+            const freshIds = new Set(fresh.map((post) => post.id));
+            setPosts(prevPosts => [...fresh, ...prevPosts.filter((post) => !freshIds.has(post.id))]);
         } catch {
             alert("Error creating post");
         }
@@ -118,6 +124,10 @@ const OrgPost = ({ orgId, canPost = false }) => {
                     />
                 ))
             )}
+
+            {nextPage && (
+                <Button onClick={() => fetchOrgPosts(nextPage)} w="100%">Load More</Button>
+            )}
         </VStack>
     );
 };
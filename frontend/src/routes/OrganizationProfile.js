@@ -15,6 +15,7 @@ const OrganizationProfile = () => {
     const { orgId } = useParams();
     const [organization, setOrganization] = useState(null);
     const [posts, setPosts] = useState([]);
+    const [nextPostsPage, setNextPostsPage] = useState(null);
     const [events, setEvents] = useState([]);
     const [loading, setLoading] = useState(true);
     const [error, setError] = useState(null);
@@ -30,16 +31,17 @@ const OrganizationProfile = () => {
         }
     };
 
-    useEffect(() => {
-        const fetchPosts = async () => {
-            try {
-                const orgPosts = await getOrganizationPosts(orgId);
-                setPosts(orgPosts);
-            } catch {
-                setError("Error getting posts.");
-            }
-        };
+    const fetchPosts = async (next) => {
+        try {
+            const orgPosts = await getOrganizationPosts(orgId, next);
+            setPosts(prevPosts => next ? [...prevPosts, ...orgPosts.results] : orgPosts.results);
+            setNextPostsPage(orgPosts.next);
+        } catch {
+            setError("Error getting posts.");
+        }
+    };
 
+    useEffect(() => {
         const fetchEvents = async () => {
             try {
                 const orgEvents = await getOrganizationEvents(orgId);
@@ -50,7 +52,7 @@ const OrganizationProfile = () => {
         };
 
         fetchOrganizationData();
-        fetchPosts();
+        fetchPosts(null);
         fetchEvents();
     }, [orgId]);
 
@@ -97,6 +99,9 @@ const OrganizationProfile = () => {
                     <HStack w="100%" spacing="40px" alignItems="flex-start" justifyContent="center" mt="40px">
                         <Box w="100%" maxW="640px">
                             <OrganizationPosts posts={posts} />
+                            {nextPostsPage && (
+                                <Button onClick={() => fetchPosts(nextPostsPage)} w="100%">Load More</Button>
+                            )}
                         </Box>
                     </HStack>
                 </VStack>
@@ -115,17 +120,16 @@ const OrganizationDetails = ({ organization }) => {
     const toast = useToast();
     const [joining, setJoining] = useState(false);
     const [hasPendingRequest, setHasPendingRequest] = useState(false);
-    const currentUsername = JSON.parse(localStorage.getItem('userData'))?.username || '';
 
     // Check if the user has a pending request
     useEffect(() => {
-        if (organization && organization.pending_requests) {
-            setHasPendingRequest(organization.pending_requests.includes(currentUsername));
+        if (organization) {
+            setHasPendingRequest(organization.has_pending_request);
         }
-    }, [organization, currentUsername]);
+    }, [organization]);
 
     // Check if user is a member
-    const isMember = organization?.members?.includes(currentUsername);
+    const isMember = organization?.is_member;
 
     const handleJoinRequest = async () => {
         setJoining(true);
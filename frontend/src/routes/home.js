@@ -7,13 +7,16 @@ const Home = () => {
     const [posts, setPosts] = useState([]);
     const [orgPosts, setOrgPosts] = useState([]);
     const [loading, setLoading] = useState(true);
-    const [nextPage, setNextPage] = useState(1);
+    const [nextPage, setNextPage] = useState(null);
+    const [hasMore, setHasMore] = useState(true);
+    const [nextOrgPage, setNextOrgPage] = useState(null);
 
     const fetchData = async () => {
         try {
             const data = await get_posts(nextPage);
             setPosts(prevPosts => [...prevPosts, ...data.results]);  // ✅ Preserve previous posts
-            setNextPage(prevPage => (data.next ? prevPage + 1 : null));
+            setNextPage(data.next);
+            setHasMore(Boolean(data.next));
         } catch (error) {
             console.error("Error fetching posts:", error);
         }
@@ -21,8 +24,9 @@ const Home = () => {
 
     const fetchOrgPosts = async () => {
         try {
-            const orgData = await getOrganizationFeed();
-            setOrgPosts(orgData);
+            const orgData = await getOrganizationFeed(nextOrgPage);
+            setOrgPosts(prevPosts => [...prevPosts, ...orgData.results]);
+            setNextOrgPage(orgData.next);
         } catch (error) {
             console.error("Error getting organization posts:", error);
         }
@@ -45,7 +49,7 @@ const Home = () => {
     }, []);
 
     const loadMorePosts = () => {
-        if (nextPage) {
+        if (hasMore) {
             fetchData();
         }
     };
@@ -71,6 +75,10 @@ const Home = () => {
                 ) : (
                     <Text>No organization posts yet.</Text>
                 )}
+
+                {nextOrgPage && !loading && (
+                    <Button onClick={fetchOrgPosts} w="100%">Load More</Button>
+                )}
             </VStack>
 
             <VStack alignItems="start" gap="30px" pb="50px">
@@ -86,7 +94,7 @@ const Home = () => {
                             : <></>
                 }
 
-                {nextPage && !loading && (
+                {hasMore && !loading && (
                     <Button onClick={loadMorePosts} w="100%">Load More</Button>
                 )}
             </VStack>
@@ -19,7 +19,7 @@ const Search = () => {
     const fetchUsers = async () => {
         try {
             const users = await search_users(searchValue);
-            setUsers(users);
+            setUsers(users.results);
         } catch (err) {
             console.error("Error fetching users:", err);
         }
@@ -28,7 +28,7 @@ const Search = () => {
     const fetchOrganizations = async () => {
         try {
             const organizations = await search_organizations(searchValue);
-            setOrganizations(organizations);
+            setOrganizations(organizations.results);
         } catch (err) {
             console.error("Error fetching organizations:", err);
         }
@@ -142,12 +142,11 @@ const Organization = ({ name, profile_image, owner_username, id, isMember, refet
     const [joining, setJoining] = useState(false);
     const [isLocalMember, setIsLocalMember] = useState(isMember);
     const [hasPendingRequest, setHasPendingRequest] = useState(false);
-    const currentUsername = JSON.parse(localStorage.getItem('userData'))?.username || '';
 
     useEffect(() => {
         // Check if user has a pending request for this organization
-        if (organization && organization.pending_requests) {
-            setHasPendingRequest(organization.pending_requests.includes(currentUsername));
+        if (organization) {
+            setHasPendingRequest(organization.has_pending_request);
         }
     }, [organization]);
 
@@ -169,21 +169,23 @@ const UserPosts = ({ username }) => {
 
     const [posts, setPosts] = useState([])
     const [loading, setLoading] = useState(true)
+    const [nextPage, setNextPage] = useState(null)
 
-    useEffect(() => {
-        const fetchPosts = async () => {
-            try {
-                console.log("Fetching posts for username:", username);
-                const posts = await get_users_posts(username)
-                setPosts(Array.isArray(posts) ? posts : []);
-            } catch {
-                alert('error getting posts')
-            } finally {
-                setLoading(false)
-            }
+    const fetchPosts = async (next) => {
+        try {
+            const data = await get_users_posts(username, next)
+            const results = Array.isArray(data.results) ? data.results : [];
+            setPosts(prevPosts => next ? [...prevPosts, ...results] : results);
+            setNextPage(data.next);
+        } catch {
+            alert('error getting posts')
+        } finally {
+            setLoading(false)
         }
+    }
 
-        fetchPosts()
+    useEffect(() => {
+        fetchPosts(null)
     }, [username])
 
     return (
@@ -194,6 +196,10 @@ const UserPosts = ({ username }) => {
                         return <Post key={post.id} id={post.id} username={post.username} description={post.description} formatted_date={post.formatted_date} liked={post.liked} like_count={post.like_count} />
                     })
             }
+
+            {nextPage && !loading && (
+                <Button onClick={() => fetchPosts(nextPage)} w="100%">Load More</Button>
+            )}
         </Flex>
     )
 }